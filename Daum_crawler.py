@@ -1,19 +1,15 @@
 # Daum_Crawler.py
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
 import urllib.parse
-import json
 import crawler_utils # 👈 공통 유틸리티 임포트
+import crawler_time  # 👈 공통 시각 파싱
 
 # --- ⬇️ 공통 코드 ⬇️ ---
 NEWS_JSON_DIR = 'news_json'
 result_filename = os.path.join(NEWS_JSON_DIR, 'daum_News.json') # 👈 고유값
 
-keywords, exclude_keywords = crawler_utils.load_keywords()
+# 키워드는 임포트 시점이 아니라 main()에서 로드합니다. (cold start 단축)
+keywords, exclude_keywords = [], []
 today = crawler_utils.get_today_string()
 
 # --- ⬇️ 고유 로직 ⬇️ ---
@@ -37,12 +33,13 @@ urls = [
 
 result_set = set() # Daum은 set을 사용하므로 main에서 변환 필요
 processed_links = set()
+pipeline = None  # main()에서 생성 (상세 요청은 공유 스레드 풀에서 처리)
 
+@crawler_utils.cached_details
 def extract_article_details(url):
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # 필요한 요소를 찾으면 나머지 본문은 받지 않습니다.
+        soup = crawler_utils.fetch_partial(url, ['strong.summary_view', 'meta[property="og:image"]'])
         
         summary_element = soup.select_one('strong.summary_view')
         summary = summary_element.text.strip() if summary_element else ''
@@ -76,43 +73,39 @@ def process_article(element, base_url, category):
     if not text_content:
         return False
     
-    if href_link in processed_links:
-        return False
-    
     # 👈 공통 유틸리티 함수 사용
     if not crawler_utils.is_relevant(text_content, keywords, exclude_keywords):
         return False
     
     time_element = element.select_one('span.txt_info:last-of-type')
-    summary, img_url = extract_article_details(href_link)
     
     formatted_time = ''
     if time_element:
-        time_str = time_element.text.strip()
-        try:
-            published_time = datetime.strptime(time_str, '%Y.%m.%d. %H:%M:%S')
-            formatted_time = published_time.strftime('%Y-%m-%d %H:%M')
-        except ValueError:
-            try:
-                current_date = datetime.now().strftime('%Y-%m-%d')
-                full_time_str = f'{current_date} {time_str}'
-                published_time = datetime.strptime(full_time_str, '%Y-%m-%d %H:%M')
-                formatted_time = published_time.strftime('%Y-%m-%d %H:%M')
-            except ValueError:
-                formatted_time = datetime.now().strftime('%Y-%m-%d %H:%M')
+        # 'YYYY.MM.DD. HH:MM:SS' 또는 오늘 기사의 'HH:MM' (못 읽으면 지금 시각)
+        published_time = crawler_time.parse(time_element.text, ['%Y.%m.%d. %H:%M:%S', '%H:%M']) or crawler_time.now()
+        formatted_time = published_time.strftime('%Y-%m-%d %H:%M')
     
-    # Daum은 set에 튜플로 저장
-    result_set.add((text_content, formatted_time, href_link, summary, img_url))
-    processed_links.add(href_link)
-    print(f"추출된 기사: {text_content} ({formatted_time})")
+    if not processed_links.claim(href_link):
+        return False
+    # 요약/이미지는 공유 풀에서 가져옵니다. (그동안 다음 목록 페이지 처리)
+    pipeline.submit(complete_article, text_content, formatted_time, href_link)
     return True
 
+def complete_article(text_content, formatted_time, href_link):
+    """(공유 풀에서 실행) 상세 페이지의 요약/이미지를 붙여 result_set에 넣을 튜플을 만듭니다."""
+    summary, img_url = extract_article_details(href_link)
+    print(f"추출된 기사: {text_content} ({formatted_time})")
+    # Daum은 set에 튜플로 저장
+    return (text_content, formatted_time, href_link, summary, img_url)
+
 def get_news_from_page(url, page, category):
     try:
         full_url = f"{url}?page={page}" if 'breakingnews' in url else url
-        response = requests.get(full_url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = crawler_utils.fetch_listing(full_url)
+        if response is None:
+            print(f"변경 없음, 건너뜀: {full_url}")
+            return False
+        soup = crawler_utils.parse_html(response.text)
 
         if category in ['politics', 'society', 'economy', 'climate']:
             selector = '.box_comp.box_news_headline2 .item_newsheadline2, .box_comp.box_news_block .item_newsblock'
@@ -127,13 +120,11 @@ def get_news_from_page(url, page, category):
         if article_count == 0:
             return False
 
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [executor.submit(process_article, element, url, category) for element in relevant_elements]
-            results = [future.result() for future in as_completed(futures)]
-        
+        results = [process_article(element, url, category) for element in relevant_elements]
         return any(results)
     except Exception as e:
         print(f"페이지 처리 실패 ({url}): {e}")
+        crawler_utils.discard_listing(full_url)  # 다음 실행에서 이 목록 페이지를 다시 처리
         return False
 
 def scrape_category(url):
@@ -146,14 +137,18 @@ def scrape_category(url):
             if not get_news_from_page(url, page, category):
                 break
             page += 1
-            time.sleep(2)
     else:
         get_news_from_page(url, 1, category)
-        time.sleep(2)
+
+    # 이 카테고리의 상세 처리가 끝나면 결과를 모읍니다. (result_set은 이 스레드에서만 수정)
+    result_set.update(pipeline.drain())
 
 # --- ⬇️ main 함수 (공통 유틸리티를 사용하도록 수정) ⬇️ ---
 def main():
-    global processed_links
+    global keywords, exclude_keywords, processed_links, pipeline
+    keywords, exclude_keywords = crawler_utils.load_keywords()
+    pipeline = crawler_utils.DetailPipeline('Daum')
+    processed_links = crawler_utils.ClaimSet(name='Daum')
     
     #crawler_utils.ensure_file_exists(result_filename)
     # Daum은 processed_links를 공통 유틸리티와 별개로 사용 (result_set 기준)
@@ -161,8 +156,17 @@ def main():
     # processed_links = crawler_utils.get_existing_links(result_filename) # 이 줄은 Daum에선 다르게 동작
     
     # Daum 크롤러는 기존 로직(set 사용)을 유지하되, 저장만 공통 모듈 사용
-    for url in urls:
+    scheduler = crawler_utils.SectionScheduler(result_filename)
+    # result_set에는 이미 저장된 기사도 들어가므로(중복은 저장할 때 거름), 스케줄러에는
+    # 저장된 적 없고 앞 섹션에서 세지 않은 URL만 새 기사로 넘깁니다.
+    counted_links = crawler_utils.get_existing_links(result_filename)
+    for url in scheduler.due(urls): # 수집 예정 시각이 된 섹션만
         scrape_category(url)
+        new_links = {link for _, _, link, _, _ in result_set if link not in counted_links}
+        for link in new_links:
+            counted_links.add(link)
+        scheduler.record(url, len(new_links))
+    scheduler.finish()
 
     # --- Daum 고유의 저장 방식 (set -> list 변환) ---
     print(f"최종 결과 수: {len(result_set)}")
@@ -170,11 +174,8 @@ def main():
 
     all_articles = []
     for title, f_time, link, summary, img_url in sorted_result:
-        try:
-            # 시간 형식을 ISO로 통일
-            iso_time = datetime.strptime(f_time, '%Y-%m-%d %H:%M').isoformat()
-        except ValueError:
-            iso_time = datetime.now().isoformat()
+        # 시간 형식을 ISO로 통일
+        iso_time = crawler_time.parse_iso(f_time, ['%Y-%m-%d %H:%M']) or crawler_time.iso(crawler_time.now())
             
         all_articles.append({
             "title": title,
@@ -192,6 +193,7 @@ def main():
         crawler_utils.save_articles_to_json(result_filename, all_articles, today)
     else:
         print("No new articles found")
+        crawler_utils.commit_listings()  # 저장할 기사는 없지만 목록 페이지는 모두 처리함
 
 if __name__ == "__main__":
     main()
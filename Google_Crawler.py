@@ -1,21 +1,16 @@
 # Google_Crawler.py
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
-import json
 import os
-import re
-from fuzzywuzzy import fuzz
-from fake_useragent import UserAgent
-import time
-import random 
 import crawler_utils # 👈 공통 유틸리티 임포트
+import crawler_store  # 👈 유사 기사 색인
+import crawler_time  # 👈 공통 시각 파싱
 
 # --- ⬇️ 공통 코드 ⬇️ ---
 NEWS_JSON_DIR = 'news_json'
 result_filename = os.path.join(NEWS_JSON_DIR,'google_News.json') # 👈 고유값
 
-keywords, exclude_keywords = crawler_utils.load_keywords()
+# 키워드는 임포트 시점이 아니라 main()에서 로드합니다. (cold start 단축)
+keywords, exclude_keywords = [], []
 today = crawler_utils.get_today_string()
 
 # --- ⬇️ 고유 로직 ⬇️ ---
@@ -33,22 +28,26 @@ urls = [
 ] # 👈 고유값
 
 processed_links = set()
-ua = UserAgent()
+# UserAgent()는 생성 시 브라우저 데이터베이스를 읽으므로 처음 요청할 때 만듭니다.
+ua = None
 
-def is_similar(title1, title2, threshold=35):
-    # Compare titles ignoring case and whitespace
-    t1 = re.sub(r'\s+', '', title1).lower()
-    t2 = re.sub(r'\s+', '', title2).lower()
-    return fuzz.ratio(t1, t2) >= threshold
+def get_user_agent():
+    global ua
+    if ua is None:
+        from fake_useragent import UserAgent
+        ua = UserAgent()
+    return ua.random
+
+# 이번 실행에서 수집한 제목의 유사 기사 색인 (main()에서 생성, 페이지가 달라도 같은 기사는 한 번만)
+title_index = None
 
 def parse_google_time(time_str):
     """Parses Google News's datetime string and converts to timezone-aware datetime."""
     try:
         # Google uses ISO 8601 format with 'Z' for UTC
         dt_utc = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-        # Convert to KST (UTC+9)
-        dt_kst = dt_utc + timedelta(hours=9)
-        return dt_kst
+        # Convert to KST (UTC+9): 시각과 함께 시간대 표시도 +09:00으로 바뀝니다.
+        return crawler_time.to_kst(dt_utc)
     except ValueError:
         print(f"Warning: Could not parse time string: {time_str}")
         return None
@@ -67,15 +66,19 @@ def is_within_last_days(article_dt, days=2):
     return article_dt >= cutoff_dt
 
 def scrape_page(url):
+    import requests  # 요청 오류 구분용 (임포트 시간 단축을 위해 모듈 최상단이 아니라 여기서)
+
     print(f"Scraping URL: {url}")
     articles = []
     try:
-        headers = {'User-Agent': ua.random}
-        response = requests.get(url, headers=headers, timeout=20) # Increased timeout
-        response.raise_for_status() # Check for HTTP errors
+        headers = {'User-Agent': get_user_agent()}
+        response = crawler_utils.fetch_listing(url, headers=headers, timeout=20) # Increased timeout, raises on HTTP errors
+        if response is None:
+            print(f"변경 없음, 건너뜀: {url}")
+            return []
         response.encoding = response.apparent_encoding # Detect encoding
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = crawler_utils.parse_html(response.text)
         
         potential_articles = soup.find_all('article')
         if not potential_articles:
@@ -140,12 +143,8 @@ def scrape_page(url):
                 print(f"SKIPPING (Old article): {title} ({published_dt_kst})") # 👈 디버깅 코드
                 continue
 
-            is_dup_title = False
-            for existing_article in articles:
-                if is_similar(title, existing_article['title']):
-                    is_dup_title = True
-                    break
-            if is_dup_title:
+            if title_index.find(title) is not None:
+                print(f"SKIPPING (Similar title): {title}") # 👈 디버깅 코드
                 continue
 
             img_element = item.find('img', src=True)
@@ -161,6 +160,7 @@ def scrape_page(url):
                 #'original_url': full_link 
             })
             processed_article_links_in_page.add(full_link)
+            title_index.add(title)
 
         return articles
 
@@ -169,13 +169,16 @@ def scrape_page(url):
         return []
     except Exception as e:
         print(f"Error processing page {url}: {e}")
+        crawler_utils.discard_listing(url)  # 다음 실행에서 이 목록 페이지를 다시 처리
         import traceback
         traceback.print_exc() 
         return []
 
 # --- ⬇️ main 함수 (공통 유틸리티를 사용하도록 수정) ⬇️ ---
 def main():
-    global processed_links
+    global keywords, exclude_keywords, processed_links, title_index
+    keywords, exclude_keywords = crawler_utils.load_keywords()
+    title_index = crawler_store.NearDuplicateIndex()
     
     #crawler_utils.ensure_file_exists(result_filename)
     processed_links = crawler_utils.get_existing_links(result_filename)
@@ -187,20 +190,20 @@ def main():
     if not keywords:
         print("Warning: No include keywords loaded. Relevance check might not work as expected.")
 
-    for url in urls:
+    scheduler = crawler_utils.SectionScheduler(result_filename)
+    for url in scheduler.due(urls): # 수집 예정 시각이 된 섹션만
         articles = scrape_page(url)
+        scheduler.record(url, len(articles))
         if articles: 
              all_new_articles.extend(articles)
-        sleep_time = random.uniform(1.5, 4.0)
-        print(f"Sleeping for {sleep_time:.1f} seconds...")
-        time.sleep(sleep_time)
+    scheduler.finish()
 
-    print(f"\n--- Scraping Finished ---")
+    print("\n--- Scraping Finished ---")
     print(f"Total potential new articles found across all sources: {len(all_new_articles)}")
 
     crawler_utils.save_articles_to_json(result_filename, all_new_articles, today)
 
-    print(f"--- Process Completed ---")
+    print("--- Process Completed ---")
 
 if __name__ == "__main__":
     main()
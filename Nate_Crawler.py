@@ -1,20 +1,16 @@
 # Nate_Crawler.py
-import requests
-from bs4 import BeautifulSoup
 from datetime import datetime
-import json
 import os
-import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from urllib.parse import urljoin, urlparse, urlunparse
-import time
 import crawler_utils  # 👈 공통 유틸리티 임포트
+import crawler_time  # 👈 공통 시각 파싱
 
 # --- ⬇️ 공통 코드 ⬇️ ---
 NEWS_JSON_DIR = 'news_json'
 result_filename = os.path.join(NEWS_JSON_DIR, 'nate_News.json') # 👈 고유값
 
-keywords, exclude_keywords = crawler_utils.load_keywords()
+# 키워드는 임포트 시점이 아니라 main()에서 로드합니다. (cold start 단축)
+keywords, exclude_keywords = [], []
 today = crawler_utils.get_today_string()
 
 # --- ⬇️ 고유 로직 ⬇️ ---
@@ -27,6 +23,8 @@ base_urls = [
 
 processed_links = set()
 processed_titles = set()
+pagination_guard = None  # main()에서 생성 (이미 본 기사만 나오면 페이지 넘김 중단)
+pipeline = None  # main()에서 생성 (요약 요청은 공유 스레드 풀에서 처리)
 
 def get_date_list():
     today_dt = datetime.now()
@@ -34,6 +32,7 @@ def get_date_list():
 
 # --- ⬇️ 'Nate_Crawler.py'의 'get_nate_summary' 함수를 통째로 교체하세요 ⬇️ ---
 
+@crawler_utils.cached_details
 def get_nate_summary(url):
     """
     [수정됨] Nate 기사 상세 페이지에서 두 가지 유형의 요약을 순차적으로 추출합니다.
@@ -42,9 +41,8 @@ def get_nate_summary(url):
     """
     try:
         # 1. 상세 페이지 HTML 요청
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        detail_soup = BeautifulSoup(response.text, 'html.parser')
+        # 필요한 요소를 찾으면 나머지 본문은 받지 않습니다. (부제목이 비어 있으면 아래에서 전체를 다시 받음)
+        detail_soup = crawler_utils.fetch_partial(url, ['div.subArea.subTitle'])
         
         summary = ""
 
@@ -60,6 +58,9 @@ def get_nate_summary(url):
 
         # 2. (기존) '유형 2'가 없다면, '유형 1' (realArtcContents) 시도
         if not summary:
+            if summary_element_1 is not None:
+                # 빈 부제목에서 읽기를 멈췄으므로 realArtcContents를 아직 받지 못했을 수 있습니다.
+                detail_soup = crawler_utils.parse_html(crawler_utils.fetch(url).text)
             content_area = detail_soup.select_one('div#realArtcContents')
             if content_area:
                 # div#realArtcContents 바로 아래의 첫 번째 텍스트 노드를 찾습니다.
@@ -81,7 +82,7 @@ def get_nate_summary(url):
         print(f"Nate 요약 추출 실패 ({url}): {e}")
         return ""
 
-def process_article(article, base_url):
+def process_article(article, base_url, position=0):
     link_element = article.select_one('a.lt1')
     if not link_element:
         print("No link element found")
@@ -95,10 +96,8 @@ def process_article(article, base_url):
     full_link = urljoin(base_url, href_link)
     parsed_url = urlparse(full_link)
     clean_url = urlunparse((parsed_url.scheme, parsed_url.netloc, parsed_url.path, '', '', ''))
-    
-    if clean_url in processed_links:
-        print(f"Duplicate URL: {clean_url}")
-        return None
+    if pagination_guard:
+        pagination_guard.see(clean_url, position)
     
     title_element = article.select_one('h2.tit')
     if not title_element:
@@ -108,7 +107,7 @@ def process_article(article, base_url):
     text_content = title_element.get_text(strip=True)
     
     # 👈 공통 유틸리티 함수 사용
-    if text_content in processed_titles or not crawler_utils.is_relevant(text_content, keywords, exclude_keywords):
+    if not crawler_utils.is_relevant(text_content, keywords, exclude_keywords):
         return None
     
     time_element = article.select_one('span.medium em')
@@ -117,82 +116,95 @@ def process_article(article, base_url):
         print("No time element found")
         return None
     
-    # 유연한 시간 형식 처리
-    try:
-        if '-' in published_time:  # 예: 04-18 20:54
-            parsed_time = datetime.strptime(published_time, '%m-%d %H:%M')
-            parsed_time = parsed_time.replace(year=datetime.now().year)  # 연도 추가
-        else:  # 예: 2025.04.18 20:54
-            parsed_time = datetime.strptime(published_time, '%Y.%m.%d %H:%M')
-        formatted_time = parsed_time.isoformat()
-    except ValueError as e:
-        print(f"Invalid time format: {published_time}, Error: {e}")
+    # 유연한 시간 형식 처리 (예: 04-18 20:54 -> 연도 추정, 2025.04.18 20:54)
+    parsed_time = crawler_time.parse(published_time, ['%m-%d %H:%M', '%Y.%m.%d %H:%M'])
+    if parsed_time is None:
+        print(f"Invalid time format: {published_time}")
         return None
+    formatted_time = crawler_time.iso(parsed_time)
     
     img_element = article.select_one('img')
     img_url = img_element.get('src', '') if img_element else ''
 
-    summary = get_nate_summary(clean_url)
-    
-    processed_links.add(clean_url)
-    processed_titles.add(text_content)
-    print(f"Article processed: {text_content}")
+    # 링크와 제목을 예약한 경우에만 요약 요청 (같은 기사를 두 번 요청하지 않음)
+    if not processed_links.claim(clean_url) or not processed_titles.claim(text_content):
+        print(f"Duplicate article: {clean_url}")
+        return None
     return {
         'title': text_content,
         'time': formatted_time,
         'img': img_url,
         'url': clean_url,
         #'original_url': clean_url,
-        'summary': summary  # 👈 요약 필드 추가
+        'summary': ''  # 👈 요약 필드 추가 (complete_article에서 채움)
     }
 
+def complete_article(article):
+    """(공유 풀에서 실행) 상세 페이지의 요약을 채웁니다."""
+    article['summary'] = get_nate_summary(article['url'])
+    print(f"Article processed: {article['title']}")
+    return article
+
 def scrape_page(url):
+    """목록 페이지 하나를 처리하고 새 기사 수를 반환합니다. (요약 요청은 pipeline에서 진행)"""
     print(f"Scraping URL: {url}")
-    articles = []
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = crawler_utils.fetch_listing(url)
+        if response is None:
+            print(f"변경 없음, 건너뜀: {url}")
+            return 0
+        soup = crawler_utils.parse_html(response.text)
         article_elements = soup.select('div.mlt01')
         print(f"Found {len(article_elements)} articles")
         
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = [executor.submit(process_article, article, url) for article in article_elements]
-            for future in as_completed(futures):
-                article = future.result()
-                if article:
-                    articles.append(article)
+        count = 0
+        for position, element in enumerate(article_elements):
+            article = process_article(element, url, position)
+            if article:
+                pipeline.submit(complete_article, article)
+                count += 1
         
-        return articles
+        return count
     except Exception as e:
         print(f"페이지 처리 실패 ({url}): {e}")
-        return []
+        crawler_utils.discard_listing(url)  # 다음 실행에서 이 목록 페이지를 다시 처리
+        return 0
 
 # --- ⬇️ main 함수 (공통 유틸리티를 사용하도록 수정) ⬇️ ---
 def main():
-    global processed_links, processed_titles
+    global keywords, exclude_keywords, processed_links, processed_titles, pagination_guard, pipeline
+    keywords, exclude_keywords = crawler_utils.load_keywords()
+    pipeline = crawler_utils.DetailPipeline('Nate')
     
     #crawler_utils.ensure_file_exists(result_filename)
-    processed_links = crawler_utils.get_existing_links(result_filename)
+    processed_links = crawler_utils.ClaimSet(crawler_utils.get_existing_links(result_filename), 'Nate')
+    processed_titles = crawler_utils.ClaimSet(name='Nate 제목')
+    pagination_guard = crawler_utils.PaginationGuard(result_filename, processed_links, max_pages=10)
     
     all_articles = []
     
-    for base_url in base_urls:
+    scheduler = crawler_utils.SectionScheduler(result_filename)
+    for base_url in scheduler.due(base_urls): # 수집 예정 시각이 된 섹션만
+        section_count = len(all_articles)
         for date in get_date_list():
+            pagination_guard.start()
             page = 1
             while page <= 10:
                 url = f'{base_url}&type=c&date={date}&page={page}'
-                articles = scrape_page(url)
-                all_articles.extend(articles)
-                if not articles:
+                new_count = scrape_page(url)
+                if pagination_guard.end_page() or not new_count:
                     break
                 page += 1
-                time.sleep(1)
+        all_articles.extend(pipeline.drain())
+        scheduler.record(base_url, len(all_articles) - section_count)
+    pagination_guard.finish()
+    scheduler.finish()
     
     if all_articles:
         crawler_utils.save_articles_to_json(result_filename, all_articles, today)
     else:
         print("No new articles found")
+        crawler_utils.commit_listings()  # 저장할 기사는 없지만 목록 페이지는 모두 처리함
 
 if __name__ == "__main__":
     main()
@@ -1,18 +1,15 @@
 # Naver_Crawler.py
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
-import json
 import os
-import re
 import crawler_utils  # 👈 공통 유틸리티 임포트
+import crawler_time  # 👈 공통 시각 파싱
 
 # --- ⬇️ 공통 코드 (대부분 삭제됨) ⬇️ ---
 NEWS_JSON_DIR = 'news_json'
 result_filename = os.path.join(NEWS_JSON_DIR, 'naver_News.json') # 👈 고유값
 
 # 1. 공통 유틸리티에서 키워드와 날짜 가져오기
-keywords, exclude_keywords = crawler_utils.load_keywords()
+# 키워드는 임포트 시점이 아니라 main()에서 로드합니다. (cold start 단축)
+keywords, exclude_keywords = [], []
 today = crawler_utils.get_today_string()
 
 # 2. 고유한 URL 리스트
@@ -37,12 +34,12 @@ processed_titles = set()
 
 # --- ⬇️ 이 크롤러만의 '고유한' 로직 (그대로 둠) ⬇️ ---
 
+@crawler_utils.cached_details(required=(0,))  # 게시 시각이 없으면 캐시하지 않고 다음 실행에서 다시 요청
 def extract_article_details(url):
     """네이버 기사 페이지에서 상세 정보 추출 (고유 로직)"""
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # 필요한 요소를 찾으면 나머지 본문은 받지 않습니다.
+        soup = crawler_utils.fetch_partial(url, ['span[class*="ARTICLE_DATE_TIME"]', '.media_end_summary', 'img#img1'])
         
         # 시간 정보 추출
         time_element = soup.select_one('span[class*="ARTICLE_DATE_TIME"]')
@@ -50,17 +47,13 @@ def extract_article_details(url):
         if time_element:
             published_time_data = time_element.get('data-date-time', '')
             if published_time_data:
-                try:
-                    dt = datetime.strptime(published_time_data, '%Y-%m-%d %H:%M:%S')
-                    published_time = dt.isoformat()
-                except ValueError as e:
-                    print(f"Invalid time format: {published_time_data}, Error: {e}")
+                published_time = crawler_time.parse_iso(published_time_data, ['%Y-%m-%d %H:%M:%S'])
+                if published_time is None:
+                    print(f"Invalid time format: {published_time_data}")
                     return '', '', ''
         
         # 요약 정보 추출
-        summary_element = soup.select_one('article#dic_area strong[style*="border-left: 2px solid"]')
-        
-        summary = ''
+        summary = ''
         
         # 1. 첫 번째 케이스 시도: .media_end_summary (기존에 작동하던 방식)
         #    이 케이스는 <br> 태그를 포함할 수 있습니다.
@@ -95,9 +88,11 @@ def scrape_page(url):
     print(f"Scraping URL: {url}")
     articles = []
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = crawler_utils.fetch_listing(url)
+        if response is None:
+            print(f"변경 없음, 건너뜀: {url}")
+            return articles
+        soup = crawler_utils.parse_html(response.text)
         article_elements = soup.select('div.section_latest_article ul li')
         print(f"Found {len(article_elements)} articles")
         
@@ -127,6 +122,7 @@ def scrape_page(url):
                         print(f"Article processed: {text_content} ({published_time})")
     except Exception as e:
         print(f"페이지 처리 실패 ({url}): {e}")
+        crawler_utils.discard_listing(url)  # 다음 실행에서 이 목록 페이지를 다시 처리
     return articles
 
 # 5. save_to_json 함수 -> 공통 유틸리티 사용 (삭제됨)
@@ -134,24 +130,29 @@ def scrape_page(url):
 # --- ⬇️ main 함수 (공통 유틸리티를 사용하도록 수정) ⬇️ ---
 
 def main():
-    global processed_links, processed_titles
+    global keywords, exclude_keywords, processed_links
+    keywords, exclude_keywords = crawler_utils.load_keywords()
     
     # 1. 공통 함수로 파일 생성 및 기존 링크 로드
     #crawler_utils.ensure_file_exists(result_filename)
     processed_links = crawler_utils.get_existing_links(result_filename)
+    scheduler = crawler_utils.SectionScheduler(result_filename)
     
     all_articles = []
     
-    # 2. 고유한 스크래핑 로직 실행
-    for url in urls:
+    # 2. 고유한 스크래핑 로직 실행 (수집 예정 시각이 된 섹션만)
+    for url in scheduler.due(urls):
         articles = scrape_page(url)
+        scheduler.record(url, len(articles))
         all_articles.extend(articles)
+    scheduler.finish()
     
     # 3. 공통 함수로 저장
     if all_articles:
         crawler_utils.save_articles_to_json(result_filename, all_articles, today)
     else:
         print("No new articles found")
+        crawler_utils.commit_listings()  # 저장할 기사는 없지만 목록 페이지는 모두 처리함
 
 if __name__ == "__main__":
     main()
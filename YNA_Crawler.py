@@ -1,23 +1,17 @@
 # YNA_Crawler.py
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
-import json
 import os
 import re
-import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
 import urllib.parse
 import crawler_utils  # 👈 공통 유틸리티 임포트
-import crawler_config # 👈 설정 파일 임포트
+import crawler_time  # 👈 공통 시각 파싱
 
 # --- ⬇️ 공통 코드 (삭제 및 utils로 대체) ⬇️ ---
 NEWS_JSON_DIR = 'news_json'
 result_filename = os.path.join(NEWS_JSON_DIR, 'yna_News.json') # 👈 고유값
 
 # 1. 공통 유틸리티에서 키워드와 날짜 가져오기
-keywords, exclude_keywords = crawler_utils.load_keywords()
+# 키워드는 임포트 시점이 아니라 main()에서 로드합니다. (cold start 단축)
+keywords, exclude_keywords = [], []
 today = crawler_utils.get_today_string()
 
 # 2. 고유한 URL 리스트
@@ -42,13 +36,14 @@ base_urls = [
 
 processed_links = set()
 processed_titles = set()
+pagination_guard = None  # main()에서 생성 (이미 본 기사만 나오면 페이지 넘김 중단)
 
 # 3. is_relevant_article, get_existing_links, save_to_json 함수
 # (이 파일에서 모두 삭제 -> crawler_utils가 대신 처리)
 
 # --- ⬇️ 이 크롤러만의 '고유한' 로직 (그대로 둠) ⬇️ ---
 
-def process_article(article, base_url):
+def process_article(article, base_url, position=0):
     """(고유 로직)"""
     title_element = article.select_one('span.title01')
     title = title_element.text.strip() if title_element else ''
@@ -63,6 +58,8 @@ def process_article(article, base_url):
     full_link = 'https:' + href_link if href_link.startswith('//') else href_link
     parsed_url = urllib.parse.urlparse(full_link)
     clean_link = urllib.parse.urlunparse(parsed_url._replace(query=''))
+    if pagination_guard:
+        pagination_guard.see(clean_link, position)
     
     if clean_link in processed_links:
         return None
@@ -94,22 +91,17 @@ def process_article(article, base_url):
     published_time = ''
     if time_element:
         time_str = time_element.text.strip()
-        try:
-            current_year = datetime.now().year
-            if '-' in time_str:
-                parsed_time = datetime.strptime(f"{current_year}-{time_str}", '%Y-%m-%d %H:%M')
-            else:
-                parsed_time = datetime.strptime(time_str, '%Y-%m-%d %H:%M')
-            published_time = parsed_time.isoformat()
-        except ValueError as e:
-            print(f"Invalid time format: {time_str}, Error: {e}")
+        # 'MM-DD HH:MM'(연도 추정) 또는 'YYYY-MM-DD HH:MM'
+        published_time = crawler_time.parse_iso(time_str, ['%m-%d %H:%M', '%Y-%m-%d %H:%M'])
+        if published_time is None:
+            print(f"Invalid time format: {time_str}")
             return None
     
     img_element = article.select_one('img')
     img_url = img_element.get('src', '') if img_element else ''
     
-    processed_links.add(clean_link)
-    processed_titles.add(title)
+    if not processed_links.claim(clean_link) or not processed_titles.claim(title):
+        return None
     print(f"Article processed: {title} ({published_time})")
     return {
         'title': title,
@@ -125,51 +117,62 @@ def scrape_page(url, page):
     articles = []
     try:
         full_url = f"{url}/{page}" if page > 1 else url
-        response = requests.get(full_url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = crawler_utils.fetch_listing(full_url)
+        if response is None:
+            print(f"변경 없음, 건너뜀: {full_url}")
+            return []
+        soup = crawler_utils.parse_html(response.text)
         article_elements = soup.select('ul.list01 li') # 👈 고유 선택자
         print(f"Found {len(article_elements)} articles")
         
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = [executor.submit(process_article, article, url) for article in article_elements]
-            for future in as_completed(futures):
-                article = future.result()
-                if article:
-                    articles.append(article)
+        # 목록 페이지만으로 처리가 끝나므로(상세 요청 없음) 스레드 없이 순서대로 처리
+        for position, element in enumerate(article_elements):
+            article = process_article(element, url, position)
+            if article:
+                articles.append(article)
         
         return articles
     except Exception as e:
         print(f"페이지 처리 실패 ({full_url}): {e}")
+        crawler_utils.discard_listing(full_url)  # 다음 실행에서 이 목록 페이지를 다시 처리
         return []
 
 # --- ⬇️ main 함수 (공통 유틸리티를 사용하도록 수정) ⬇️ ---
 
 def main():
-    global processed_links, processed_titles
+    global keywords, exclude_keywords, processed_links, processed_titles, pagination_guard
+    keywords, exclude_keywords = crawler_utils.load_keywords()
     
     # 1. 공통 함수로 파일 생성 및 기존 링크 로드
     #crawler_utils.ensure_file_exists(result_filename)
-    processed_links = crawler_utils.get_existing_links(result_filename)
+    processed_links = crawler_utils.ClaimSet(crawler_utils.get_existing_links(result_filename), 'YNA')
+    processed_titles = crawler_utils.ClaimSet(name='YNA 제목')
+    pagination_guard = crawler_utils.PaginationGuard(result_filename, processed_links, max_pages=5)
     
     all_articles = []
     
     # 2. 고유한 스크래핑 로직 실행
-    for url in base_urls:
+    scheduler = crawler_utils.SectionScheduler(result_filename)
+    for url in scheduler.due(base_urls): # 수집 예정 시각이 된 섹션만
+        pagination_guard.start()
+        section_count = len(all_articles)
         page = 1
         while page <= 5: # 👈 YNA 고유의 페이지네이션 로직
             articles = scrape_page(url, page)
             all_articles.extend(articles)
-            if not articles:
+            if pagination_guard.end_page() or not articles:
                 break
             page += 1
-            time.sleep(2)
+        scheduler.record(url, len(all_articles) - section_count)
+    pagination_guard.finish()
+    scheduler.finish()
     
     # 3. 공통 함수로 저장
     if all_articles:
         crawler_utils.save_articles_to_json(result_filename, all_articles, today)
     else:
         print("No new articles found")
+        crawler_utils.commit_listings()  # 저장할 기사는 없지만 목록 페이지는 모두 처리함
 
 if __name__ == "__main__":
     main()
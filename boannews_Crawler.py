@@ -1,18 +1,15 @@
 # boannews_Crawler.py
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
-import json
+from datetime import timedelta
 import os
-import re
-import time
 import crawler_utils # 👈 공통 유틸리티 임포트
+import crawler_time  # 👈 공통 시각 파싱
 
 # --- ⬇️ 공통 코드 ⬇️ ---
 NEWS_JSON_DIR = 'news_json'
 result_filename = os.path.join(NEWS_JSON_DIR, 'boannews_News.json') # 👈 고유값
 
-keywords, exclude_keywords = crawler_utils.load_keywords()
+# 키워드는 임포트 시점이 아니라 main()에서 로드합니다. (cold start 단축)
+keywords, exclude_keywords = [], []
 today = crawler_utils.get_today_string()
 
 # --- ⬇️ 고유 로직 ⬇️ ---
@@ -20,29 +17,30 @@ base_url = 'https://www.boannews.com/media/t_list.asp' # 👈 고유값
 
 processed_links = set()
 processed_titles = set()
+pagination_guard = None  # main()에서 생성 (이미 본 기사만 나오면 페이지 넘김 중단)
 
 def parse_article_datetime(datetime_str):
     """기사 날짜시간 파싱 ('2025년 07월 31일 13:44' 형식)"""
-    try:
-        dt = datetime.strptime(datetime_str, "%Y년 %m월 %d일 %H:%M")
-        return dt
-    except ValueError as e:
-        print(f"날짜시간 파싱 오류: {datetime_str}, {e}")
-        return None
+    dt = crawler_time.parse(datetime_str, ["%Y년 %m월 %d일 %H:%M"])
+    if dt is None:
+        print(f"날짜시간 파싱 오류: {datetime_str}")
+    return dt
 
 def is_within_two_days(datetime_obj):
     """기사 날짜가 현재로부터 2일 이내인지 확인"""
     if not datetime_obj:
         return False
-    two_days_ago = datetime.now() - timedelta(days=2)
+    two_days_ago = crawler_time.now() - timedelta(days=2)
     return datetime_obj >= two_days_ago
 
+@crawler_utils.cached_details
 def extract_article_details(url):
     """개별 기사 페이지에서 상세 정보 추출"""
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # 요약이 본문 전체 텍스트의 앞부분이라 본문 컨테이너가 닫힐 때까지 받아야 하므로
+        # 부분 다운로드(fetch_partial)로는 아낄 것이 없습니다.
+        response = crawler_utils.fetch(url)
+        soup = crawler_utils.parse_html(response.text)
         
         img_element = soup.select_one('.news_content img, .view_content img, #news_content img')
         img_url = img_element.get('src', '') if img_element else ''
@@ -90,9 +88,11 @@ def scrape_page(page_num=1):
     try:
         page_url = f"{base_url}?Page={page_num}" if page_num > 1 else base_url
             
-        response = requests.get(page_url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = crawler_utils.fetch_listing(page_url)
+        if response is None:
+            print(f"변경 없음, 건너뜀: {page_url}")
+            return articles, True # Stop
+        soup = crawler_utils.parse_html(response.text)
         
         media_div = soup.select_one('#media')
         if not media_div:
@@ -107,7 +107,7 @@ def scrape_page(page_num=1):
 
         found_old_articles = False
         
-        for news_txt_element in news_txt_elements:
+        for position, news_txt_element in enumerate(news_txt_elements):
             title = news_txt_element.get_text(strip=True)
             if not title:
                 continue
@@ -123,6 +123,8 @@ def scrape_page(page_num=1):
                 full_link = f"https://www.boannews.com/media/{article_link}"
             else:
                 full_link = article_link
+            if pagination_guard:
+                pagination_guard.see(full_link, position)
             
             writer_element = None
             current_element = news_txt_element.parent
@@ -160,15 +162,13 @@ def scrape_page(page_num=1):
             # 👈 공통 유틸리티 함수 사용
             is_relevant = crawler_utils.is_relevant(title, keywords, exclude_keywords)
             
-            if full_link not in processed_links and text_content not in processed_titles and is_relevant:
+            # 링크와 제목을 예약한 경우에만 상세 페이지 요청 (같은 기사를 두 번 요청하지 않음)
+            if is_relevant and processed_links.claim(full_link) and processed_titles.claim(title):
                 img_url, summary = extract_article_details(full_link)
                 
-                processed_links.add(full_link)
-                processed_titles.add(title)
-                
                 article_data = {
                     'title': title,
-                    'time': article_datetime.isoformat(),
+                    'time': crawler_time.iso(article_datetime),
                     'img': img_url,
                     'url': full_link,
                     #'original_url': full_link,
@@ -182,28 +182,40 @@ def scrape_page(page_num=1):
             
     except Exception as e:
         print(f"페이지 처리 실패 (page {page_num}): {e}")
+        crawler_utils.discard_listing(page_url)  # 다음 실행에서 이 목록 페이지를 다시 처리
         return [], True # Stop on error
 
 # --- ⬇️ main 함수 (공통 유틸리티를 사용하도록 수정) ⬇️ ---
 def main():
-    global processed_links, processed_titles
+    global keywords, exclude_keywords, processed_links, processed_titles, pagination_guard
+    keywords, exclude_keywords = crawler_utils.load_keywords()
     
     #crawler_utils.ensure_file_exists(result_filename)
-    processed_links = crawler_utils.get_existing_links(result_filename)
+    processed_links = crawler_utils.ClaimSet(crawler_utils.get_existing_links(result_filename), 'boannews')
+    processed_titles = crawler_utils.ClaimSet(name='boannews 제목')
+    pagination_guard = crawler_utils.PaginationGuard(result_filename, processed_links, max_pages=10)
     
     all_articles = []
     page_num = 1
     
+    # boannews는 목록이 하나뿐이므로 그 목록 전체를 하나의 섹션으로 취급합니다.
+    scheduler = crawler_utils.SectionScheduler(result_filename)
+    if not scheduler.due([base_url]):
+        return
+    
     while True:
         articles, stop = scrape_page(page_num)
         all_articles.extend(articles)
+        stop = pagination_guard.end_page() or stop # 이미 본 기사만 나온 페이지면 중지
         
         if stop or page_num >= 10: # 10페이지 제한 또는 오래된 기사 발견 시 중지
             print(f"Scraping stopped at page {page_num}.")
             break
             
         page_num += 1
-        time.sleep(2)
+    pagination_guard.finish()
+    scheduler.record(base_url, len(all_articles))
+    scheduler.finish()
     
     if all_articles:
         crawler_utils.save_articles_to_json(result_filename, all_articles, today)
@@ -4,8 +4,135 @@
 모든 크롤러가 참조하는 중앙 설정 파일입니다.
 이 파일의 값을 변경하면 모든 크롤러에 한 번에 적용됩니다.
 """
+import os
 
 # 기사 수집을 위해 필요한 최소 키워드 개수
 # (개인용으로 1개만 포함해도 수집하려면 1로 설정)
 # (원본처럼 2개 이상 포함해야 하면 2로 설정)
 MIN_KEYWORDS_REQUIRED = 1
+
+# 같은 호스트에 연속으로 요청할 때 지켜야 할 최소 간격(초)
+# (crawler_utils.wait_for_host에서 사용, 튜플이면 그 범위에서 무작위로 선택)
+DEFAULT_HOST_MIN_INTERVAL = 1.0
+HOST_MIN_INTERVAL = {
+    'news.daum.net': 2.0,
+    'www.yna.co.kr': 2.0,
+    'news.nate.com': 1.0,
+    'news.google.com': (1.5, 4.0),
+    'www.skyedaily.com': 1.0,
+    'hanmiilbo.kr': 2.0,
+    'www.boannews.com': 2.0,
+    'www.truthdaily.co.kr': 1.0,
+    'www.gukjenews.com': 1.0,
+    'www.fntoday.co.kr': 1.0,
+}
+# 위 간격에 곱할 배수 (scripts/bench_offline.py처럼 로컬 서버로 재생할 때 0으로 두고 지연만 측정)
+HOST_INTERVAL_SCALE = float(os.environ.get('CRAWLER_HOST_INTERVAL_SCALE', '1'))
+
+# 공통 HTTP 요청(crawler_utils.fetch) 설정
+HTTP_TIMEOUT = 10                  # 요청 타임아웃(초)
+HTTP_POOL_MAXSIZE = 5              # 호스트당 최대 동시 연결 수
+HTTP_POOL_MAXSIZE_PER_HOST = {     # 호스트별로 다르게 줄 때 (예: {'news.naver.com': 8})
+    'v.daum.net': 3,               # Daum 상세 페이지는 기존처럼 동시 3개까지
+}
+WORKER_POOL_SIZE = 16              # 실행 전체가 함께 쓰는 상세 처리 스레드 수 (crawler_utils.get_worker_pool)
+HTTP_MAX_RETRIES = 3               # 429/5xx 재시도 횟수
+HTTP_BACKOFF_FACTOR = 0.5          # 재시도 간격: 0.5s, 1s, 2s ...
+HTTP_RETRY_STATUS = (429, 500, 502, 503, 504)
+HTTP_REQUEST_BUDGET = 3000         # 한 번 실행에서 보낼 수 있는 전체 요청 수
+# 설정하면 모든 요청을 이 주소의 재생 서버로 보냅니다. (scripts/bench_offline.py, crawler_utils.replay_url)
+REPLAY_URL = os.environ.get('CRAWLER_REPLAY_URL', '')
+
+# 실행 사이에 유지할 로컬 상태(목록 캐시 등)를 저장할 폴더
+# (GitHub Actions에서는 actions/cache로 이 폴더를 보존합니다)
+CRAWLER_CACHE_DIR = os.environ.get('CRAWLER_CACHE_DIR', '.crawler_cache')
+
+# Firestore 키워드 스냅샷 (crawler_utils.load_keywords)
+# Firestore 문서의 update_time이 바뀌지 않았거나 Firestore에 접속할 수 없으면
+# CRAWLER_CACHE_DIR의 스냅샷을 사용합니다.
+KEYWORD_SNAPSHOT_ENABLED = True
+# 0보다 크면 이 시간 안에 확인한 스냅샷은 Firestore 조회 없이 사용
+KEYWORD_SNAPSHOT_MAX_AGE_MINUTES = float(os.environ.get('CRAWLER_KEYWORD_SNAPSHOT_MAX_AGE', '0'))
+
+# 목록 페이지 조건부 요청 캐시 (crawler_utils.fetch_listing)
+LISTING_CACHE_ENABLED = True
+LISTING_CACHE_MAX_AGE_DAYS = 7     # 이 기간 동안 다시 보지 않은 URL은 캐시에서 제거
+
+# 기사 상세 정보 캐시 (crawler_utils.cached_details)
+DETAIL_CACHE_ENABLED = True
+DETAIL_CACHE_TTL_HOURS = 48        # 이 시간이 지나면 상세 페이지를 다시 요청
+DETAIL_CACHE_MAX_ENTRIES = 20000   # 넘으면 가장 오래 쓰지 않은 URL부터 제거 (LRU)
+
+# 기사 저장 방식
+# 'json'  : 실행마다 news_json/*.json 전체를 다시 씀 (기존 방식)
+# 'jsonl' : news_json/log/<소스>/<날짜>.jsonl에 새 기사만 추가하고,
+#           scripts/compact_news_log.py가 프론트엔드용 JSON을 만들어 줌
+STORAGE_MODE = os.environ.get('CRAWLER_STORAGE_MODE', 'json')
+LOG_KEEP_SEGMENT_DAYS = 2          # 압축 후에도 남겨 둘 최근 세그먼트 일수 (오늘, 어제)
+
+# 보관 정책: 최근 N일치만 news_json/<소스>.json에 두고, 그 이전 날짜 그룹은
+# scripts/archive_news.py가 news_json/archive/<소스>/<YYYY-MM>.jsonl.gz로 옮김
+HOT_RETENTION_DAYS = 30
+
+# HTML 파서 (crawler_utils.parse_html)
+# 'lxml'        : C로 구현된 lxml 파서 (설치되어 있지 않으면 html.parser로 대체)
+# 'html.parser' : 파이썬 표준 라이브러리 파서 (기존 방식)
+# 어느 쪽이든 BeautifulSoup 객체를 돌려주므로 select_one/find_all 등 CSS 선택자는 그대로 동작합니다.
+HTML_PARSER = os.environ.get('CRAWLER_HTML_PARSER', 'lxml')
+
+# 상세 페이지 부분 다운로드 (crawler_utils.fetch_partial)
+# 필요한 요소를 찾으면 나머지 본문을 받지 않고 연결을 닫습니다.
+PARTIAL_FETCH_ENABLED = True
+PARTIAL_FETCH_CHUNK_SIZE = 16384   # 이 크기만큼 받을 때마다 필요한 요소가 모두 왔는지 확인
+
+# 목록 페이지 넘김 조기 종료 (crawler_utils.PaginationGuard)
+# 한 페이지의 기사가 모두 이미 본 URL이거나, 이미 본 URL이 연속으로 N개 나오면
+# 다음 페이지를 요청하지 않습니다. ('이미 본 URL' = 저장된 기사 + 지난 실행에서 목록에서 본 기사)
+PAGINATION_EARLY_STOP = True
+PAGINATION_KNOWN_RUN = 10          # 0이면 '페이지 전체가 이미 본 URL'일 때만 멈춤
+
+# 섹션(목록 URL)별 적응형 수집 주기 (crawler_utils.SectionScheduler)
+# 새 관련 기사가 없으면 다음 수집까지의 간격을 늘리고, 많으면 줄입니다.
+# 예정 시각 전인 섹션은 이번 실행에서 요청하지 않습니다. (CRAWLER_SCHEDULER=0이면 항상 전체 수집)
+SCHEDULER_ENABLED = os.environ.get('CRAWLER_SCHEDULER', '1') != '0'
+SCHEDULER_MIN_INTERVAL_MINUTES = 30    # 워크플로 cron 간격보다 짧을 필요는 없음
+SCHEDULER_MAX_INTERVAL_MINUTES = 360   # 아무리 조용한 섹션도 이 간격 안에는 다시 확인
+SCHEDULER_BACKOFF = 2                  # 빈 수집마다 간격을 곱할 값 (기사가 있으면 나눔)
+SCHEDULER_BUSY_ARTICLES = 3            # 한 번에 이만큼 새 기사가 나오면 바로 최소 간격으로
+SCHEDULER_SLACK_MINUTES = 5            # cron 실행 시각이 조금 늦거나 빨라도 놓치지 않도록 여유
+
+# 유사 기사 묶기 (crawler_store.NearDuplicateIndex)
+# 제목의 글자 2-gram 자카드 유사도가 기준 이상이면 같은 기사로 봅니다.
+# (Google 크롤러의 같은 기사 건너뛰기, scripts/process_two_day_news.py의 'cluster' 번호)
+# Google 크롤러는 예전에 한 페이지 안에서만 fuzz.ratio >= 35로 건너뛰었는데, 이제는 실행 전체에서
+# 이 기준을 씁니다. 의도적으로 더 엄격하게 바꿨습니다. google_News.json 날짜별 제목 55,875쌍 기준으로
+# fuzz.ratio >= 35는 163쌍이었고, 자카드 >= 0.5는 그중 56쌍(모두 포함)입니다. fuzz 35~60의 82쌍은 대부분
+# 주제만 같은 다른 기사(다른 지진, 다른 증시 기사)라 이제 건너뛰지 않습니다. 같은 사건을
+# 매체마다 다르게 쓴 제목(자카드 0.3~0.5)도 따로 저장됩니다.
+NEAR_DUP_THRESHOLD = 0.5
+NEAR_DUP_PERMUTATIONS = 32         # MinHash 서명 길이
+NEAR_DUP_BANDS = 16                # 밴드 수 (밴드당 32 / 16 = 2행, 자카드 0.5에서 후보로 잡힐 확률 약 99%)
+NEAR_DUP_SEED = 20240101           # 서명용 해시 계수 시드
+
+# 실행 지표 (crawler_utils.RunMetrics)
+# 실행마다 소스별 단계 시간(fetch, parse, relevance, detail, save ...), 호스트별 요청 시간/바이트,
+# 카운터(상세 요청, 캐시 적중, 중복 방지 ...)를 JSON 한 줄로 METRICS_FILE에 추가합니다.
+# (scripts/metrics_report.py로 소스/단계별 추세를 볼 수 있습니다)
+METRICS_ENABLED = os.environ.get('CRAWLER_METRICS', '1') != '0'
+METRICS_FILE = os.environ.get('CRAWLER_METRICS_FILE', os.path.join(CRAWLER_CACHE_DIR, 'metrics.jsonl'))
+METRICS_MAX_BYTES = 5 * 1024 * 1024   # 넘으면 오래된 기록 절반을 버림
+
+# 샤드 실행: 여러 러너가 수집을 나눠 맡고 scripts/merge_shards.py가 한 번에 합칩니다.
+# CRAWLER_SHARD='i/N'이면 이 실행은 N개 중 i번째(0부터) 샤드입니다. (crawler_utils.get_shard)
+# - CRAWLER_SHARD_BY='source' : run_all.py가 크롤러(소스)를 나눔 (CRAWLERS 순서로 i, i+N, i+2N ...)
+# - CRAWLER_SHARD_BY='section': 모든 크롤러를 실행하되 섹션(목록 URL)을 URL 해시로 나눔
+# 샤드 실행의 새 기사는 news_json 대신 SHARD_OUTPUT_DIR/shard-<i>/log/<소스>/<날짜>.jsonl에 추가됩니다.
+SHARD = os.environ.get('CRAWLER_SHARD', '')
+SHARD_BY = os.environ.get('CRAWLER_SHARD_BY', 'source')
+SHARD_OUTPUT_DIR = os.environ.get('CRAWLER_SHARD_DIR', 'shards')
+
+# ForTwoDay_News.json과 함께 만들 추가 형식 (scripts/process_two_day_news.py --export)
+# 'parquet', 'arrow' : pandas + pyarrow로 만든 열 형식 파일 (source/date 열은 사전(dictionary) 인코딩)
+# 'min.json'         : 들여쓰기 없는 JSON
+# 'json.gz'          : min.json을 gzip으로 압축한 파일
+TWO_DAY_EXPORT_FORMATS = [fmt for fmt in os.environ.get('CRAWLER_TWO_DAY_EXPORTS', '').split(',') if fmt]
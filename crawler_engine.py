@@ -0,0 +1,221 @@
+# crawler_engine.py
+"""
+[공통 크롤러 엔진]
+사이트별 크롤러 파일에는 선언적인 SPEC(딕셔너리)만 두고, 목록 요청, 페이지 넘김,
+기사 파싱, 상세 요약, 중복 제거, 저장은 이 엔진이 한 곳에서 처리합니다.
+동시성, 캐시, 저장 방식 같은 성능 작업은 여기서 한 번 하면 SPEC을 쓰는 모든 사이트에 적용됩니다.
+
+SPEC 키 (* 표시는 필수):
+    name*              로그에 쓸 사이트 이름
+    result_filename*   저장할 news_json 파일 경로
+    base_url*          상대 링크/이미지 앞에 붙일 주소 (예: 'https://www.gukjenews.com')
+    list_urls*         목록 페이지 URL 목록 (crawler_utils.SectionScheduler가 예정 시각이 된 것만 수집)
+    item*              목록 페이지에서 기사 하나를 고르는 CSS 선택자
+    link               item 안의 링크 선택자 (생략하면 item 자체의 href)
+    title*             item 안의 제목 선택자
+    time*              {'selector': ..., 'formats': [...], 'split': '|', 'scope': 'next'}
+                       - split을 주면 텍스트를 그 문자로 나눈 마지막 조각을 파싱합니다.
+                       - scope='next'면 item 안이 아니라 item 뒤에 처음 나오는 요소에서 찾습니다.
+    img                item 안의 이미지 선택자 (기본 'img')
+    encoding           목록/상세 페이지 인코딩을 강제할 때 (예: 'euc-kr')
+    pagination         {'param': 'page', 'max_pages': 5}
+                       새 기사가 하나도 없거나 이미 본 기사만 있는 페이지(crawler_utils.PaginationGuard)를
+                       만나면 다음 페이지로 넘어가지 않습니다.
+    detail             {'summary': 선택자}
+                       상세 페이지의 요약을 제목과 함께 관련성 검사에 쓰고 결과에 'summary'로 저장합니다.
+                       상세 요청은 crawler_utils.DetailPipeline(공유 스레드 풀)에서 처리되어
+                       다음 목록 페이지를 받는 동안에도 진행됩니다.
+
+사용 예 (Gukje_Crawler.py):
+    SPEC = {'name': 'Gukje', ...}
+
+    def main():
+        crawler_engine.run(SPEC)
+"""
+import crawler_time
+import crawler_utils
+
+
+def absolute_url(spec, href):
+    """상대 경로면 base_url을 붙입니다."""
+    if not href or href.startswith('http'):
+        return href
+    return spec['base_url'] + href
+
+
+def page_url(url, pagination, page):
+    """pagination 규칙에 따른 page번째 목록 URL (1페이지는 원래 URL)"""
+    if page == 1:
+        return url
+    separator = '&' if '?' in url else '?'
+    return f"{url}{separator}{pagination['param']}={page}"
+
+
+def _select_next(element, selector):
+    """element 뒤(자식 포함)에 처음 나오는, selector에 맞는 태그 (BeautifulSoup의 find_next와 같은 순서)"""
+    # bs4/soupsieve는 크롤러 임포트 시점이 아니라 처음 파싱할 때 임포트합니다. (crawler_utils.parse_html과 같음)
+    import soupsieve
+    from bs4 import Tag
+
+    for node in element.next_elements:
+        if isinstance(node, Tag) and soupsieve.match(selector, node):
+            return node
+    return None
+
+
+def parse_time(spec, element):
+    """SPEC의 time 규칙으로 게시 시각을 찾아 ISO 문자열(KST, crawler_time.iso)로 반환합니다. 실패하면 None."""
+    rule = spec['time']
+    if rule.get('scope') == 'next':
+        time_element = _select_next(element, rule['selector'])
+    else:
+        time_element = element.select_one(rule['selector'])
+    if time_element is None:
+        return None
+
+    time_str = time_element.text.strip()
+    if rule.get('split'):
+        time_str = time_str.split(rule['split'])[-1].strip()
+    return crawler_time.parse_iso(time_str, rule['formats'])
+
+
+@crawler_utils.cached_details
+def fetch_summary(url, spec):
+    """상세 페이지에서 SPEC['detail']['summary'] 요소의 텍스트를 가져옵니다."""
+    selector = spec['detail']['summary']
+    try:
+        soup = crawler_utils.fetch_partial(url, [selector], encoding=spec.get('encoding'))
+        summary_element = soup.select_one(selector)
+        return summary_element.text.strip() if summary_element else ''
+    except Exception as e:
+        print(f"[{spec['name']}] 데이터 추출 실패 ({url}): {e}")
+        return ''
+
+
+class SiteCrawler:
+    """SPEC 하나를 실행하는 동안의 상태(키워드, 이미 저장된 URL)를 보관합니다."""
+
+    def __init__(self, spec):
+        self.spec = spec
+        self.keywords, self.exclude_keywords = crawler_utils.load_keywords()
+        self.processed_links = crawler_utils.ClaimSet(crawler_utils.get_existing_links(spec['result_filename']),
+                                                      spec['name'])
+        pagination = spec.get('pagination')
+        self.guard = crawler_utils.PaginationGuard(spec['result_filename'], self.processed_links,
+                                                   max_pages=pagination['max_pages'] if pagination else None)
+
+    def process_article(self, element, position=0):
+        """
+        목록의 기사 요소 하나에서 목록만으로 알 수 있는 정보(제목, 시간, 이미지, URL)를 뽑습니다.
+        대상이 아니면 None. 상세 요약이 필요한 기사는 complete_article에서 마무리합니다.
+        """
+        spec = self.spec
+        link_element = element.select_one(spec['link']) if spec.get('link') else element
+        if link_element is None or not link_element.get('href'):
+            return None
+        href_link = absolute_url(spec, link_element['href'])
+        self.guard.see(href_link, position)
+        if href_link in self.processed_links:
+            return None
+
+        title_element = element.select_one(spec['title'])
+        title = title_element.text.strip() if title_element else ''
+        published_time = parse_time(spec, element)
+        if not title or published_time is None:
+            return None
+        if not spec.get('detail') and not crawler_utils.is_relevant(title, self.keywords, self.exclude_keywords):
+            return None
+        # URL은 기사로 확정된 뒤에 예약합니다. 같은 href의 이미지 링크(제목 없음)가 먼저 나와도
+        # 제목 링크가 버려지지 않고, 예약에 성공한 기사만 상세 요청합니다. (같은 URL을 두 번 요청하지 않음)
+        if not self.processed_links.claim(href_link):
+            return None
+
+        img_element = element.select_one(spec.get('img', 'img'))
+        img_url = absolute_url(spec, img_element.get('src', '')) if img_element else ''
+        return {
+            'title': title,
+            'time': published_time,
+            'img': img_url,
+            'url': href_link,
+        }
+
+    def complete_article(self, article):
+        """(공유 풀에서 실행) 상세 요약을 붙이고 제목+요약으로 관련성을 검사합니다. 대상이 아니면 None."""
+        summary = fetch_summary(article['url'], self.spec)
+        if not crawler_utils.is_relevant(f"{article['title']} {summary}", self.keywords, self.exclude_keywords):
+            return None
+        article['summary'] = summary
+        return article
+
+    def scrape_page(self, url, pipeline):
+        """
+        목록 페이지 하나를 처리해 새 기사 후보 수를 반환합니다.
+        상세 요약이 필요한 후보는 pipeline에 넘기므로, 그 요청이 진행되는 동안 다음 목록 페이지를 받습니다.
+        """
+        spec = self.spec
+        print(f"[{spec['name']}] Scraping URL: {url}")
+        try:
+            response = crawler_utils.fetch_listing(url)
+            if response is None:
+                print(f"변경 없음, 건너뜀: {url}")
+                return 0
+            if spec.get('encoding'):
+                response.encoding = spec['encoding']
+            soup = crawler_utils.parse_html(response.text)
+            elements = soup.select(spec['item'])
+            print(f"Found {len(elements)} articles")
+
+            candidates = 0
+            for position, element in enumerate(elements):
+                article = self.process_article(element, position)
+                if article is None:
+                    continue
+                candidates += 1
+                if spec.get('detail'):
+                    pipeline.submit(self.complete_article, article)
+                else:
+                    self.ready.append(article)
+            return candidates
+        except Exception as e:
+            print(f"[{spec['name']}] 페이지 처리 실패 ({url}): {e}")
+            crawler_utils.discard_listing(url)  # 다음 실행에서 이 목록 페이지를 다시 처리
+            return 0
+
+    def _collect(self, pipeline):
+        """목록에서 바로 확정된 기사와 상세 처리를 마친 기사를 모아 반환합니다."""
+        articles, self.ready = self.ready, []
+        articles.extend(pipeline.drain())
+        return articles
+
+    def crawl(self):
+        pagination = self.spec.get('pagination')
+        max_pages = pagination['max_pages'] if pagination else 1
+        scheduler = crawler_utils.SectionScheduler(self.spec['result_filename'])
+        pipeline = crawler_utils.DetailPipeline(self.spec['name'])
+        self.ready = []
+        all_articles = []
+        for url in scheduler.due(self.spec['list_urls']):
+            self.guard.start()
+            for page in range(1, max_pages + 1):
+                candidates = self.scrape_page(page_url(url, pagination, page), pipeline)
+                if self.guard.end_page() or not candidates:
+                    break
+            section_articles = self._collect(pipeline)
+            scheduler.record(url, len(section_articles))
+            all_articles.extend(section_articles)
+        self.guard.finish()
+        scheduler.finish()
+        return all_articles
+
+
+def run(spec):
+    """SPEC에 따라 크롤링하고 새 기사를 저장합니다. (각 크롤러의 main())"""
+    crawler = SiteCrawler(spec)
+    all_articles = crawler.crawl()
+    if all_articles:
+        crawler_utils.save_articles_to_json(spec['result_filename'], all_articles,
+                                            crawler_utils.get_today_string())
+    else:
+        print("No new articles found")
+        crawler_utils.commit_listings()  # 저장할 기사는 없지만 목록 페이지는 모두 처리함
+    return all_articles
@@ -0,0 +1,442 @@
+# crawler_store.py
+"""
+[news_json 저장소 공통 기능 (표준 라이브러리만 사용)]
+news_json 파일을 읽고 쓰는 데 필요한 기능 중 HTTP/HTML 라이브러리가 필요 없는 것들입니다.
+scripts/process_two_day_news.py, scripts/compact_news_log.py처럼 크롤링하지 않는 작업은
+crawler_utils(requests, bs4 ...) 대신 이 모듈만 임포트해 의존성 설치 없이 실행됩니다.
+크롤러 쪽 코드는 crawler_utils를 통해 같은 이름으로 사용할 수 있습니다.
+
+- JSON 상태 파일 읽기/원자적 쓰기 (load_json_file, write_json_atomic)
+- 날짜 문자열 (format_date_string, parse_group_date)
+- 추가 전용 기사 로그 (append_articles_to_log, iter_log_segments, compact_article_log)
+- 원본 파일 지문 (source_fingerprint)
+- 날짜 그룹 스트리밍 읽기 (iter_date_groups)
+- 유사 기사 색인 (NearDuplicateIndex, numpy가 있으면 사용)
+"""
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import zlib
+from datetime import datetime, timedelta
+import crawler_config
+
+
+# JSON 상태 파일
+def load_json_file(path, default):
+    """JSON 파일을 읽습니다. 없거나 손상되었으면 default를 반환합니다."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return default
+
+def write_json_atomic(path, data, indent=None):
+    """임시 파일에 쓴 뒤 교체하여, 쓰는 도중 중단돼도 기존 파일이 깨지지 않게 합니다."""
+    dir_name = os.path.dirname(path)
+    if dir_name:
+        os.makedirs(dir_name, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=indent)
+    os.replace(tmp_path, path)
+
+
+# 날짜 문자열
+def format_date_string(today_dt):
+    """datetime을 'YYYY년 MM월 DD일 요일' 형식(JSON의 date 키)으로 바꿉니다."""
+    day_map = {
+        'Monday': '월요일', 'Tuesday': '화요일', 'Wednesday': '수요일',
+        'Thursday': '목요일', 'Friday': '금요일', 'Saturday': '토요일', 'Sunday': '일요일'
+    }
+    eng_day = today_dt.strftime('%A')
+    kor_day = day_map.get(eng_day, eng_day)
+    return today_dt.strftime(f'%Y년 %m월 %d일 {kor_day}')
+
+
+# 추가 전용(append-only) 기사 로그 (crawler_config.STORAGE_MODE='jsonl')
+# news_json/daum_News.json -> news_json/log/daum_News/2025-11-23.jsonl
+# 한 줄에 {"date": "2025년 11월 23일 일요일", "article": {...}} 하나씩 기록합니다.
+def _log_dir(result_filename):
+    base = os.path.splitext(result_filename)[0]
+    return os.path.join(os.path.dirname(base), 'log', os.path.basename(base))
+
+def _day_key(date_string):
+    """'2025년 11월 23일 일요일' -> '2025-11-23' (세그먼트 파일 이름)"""
+    day = datetime.strptime(' '.join(date_string.split(' ')[:3]), '%Y년 %m월 %d일')
+    return day.strftime('%Y-%m-%d')
+
+def _read_segment(path):
+    """세그먼트 파일을 읽어 (date 문자열, 기사 리스트)를 반환합니다. 깨진 줄은 건너뜁니다."""
+    date_string = None
+    articles = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            date_string = date_string or record.get('date')
+            if isinstance(record.get('article'), dict):
+                articles.append(record['article'])
+    return date_string, articles
+
+def iter_log_segments(result_filename):
+    """이 소스의 로그 세그먼트를 날짜순으로 (day_key, date 문자열, 기사 리스트)로 돌려줍니다."""
+    log_dir = _log_dir(result_filename)
+    if not os.path.isdir(log_dir):
+        return
+    for name in sorted(os.listdir(log_dir)):
+        if not name.endswith('.jsonl'):
+            continue
+        day_key = name[:-len('.jsonl')]
+        date_string, articles = _read_segment(os.path.join(log_dir, name))
+        if not date_string:
+            # 빈 세그먼트(새 기사 없이 생성된 날)는 파일 이름에서 날짜를 복원
+            date_string = format_date_string(datetime.strptime(day_key, '%Y-%m-%d'))
+        yield day_key, date_string, articles
+
+def append_articles_to_log(result_filename, new_articles, today_string):
+    """
+    오늘 세그먼트에 새 기사만 추가합니다. 비용은 과거 기록이 아니라
+    새 기사 수(와 오늘 세그먼트 크기)에만 비례합니다.
+    """
+    segment_path = os.path.join(_log_dir(result_filename), f"{_day_key(today_string)}.jsonl")
+    os.makedirs(os.path.dirname(segment_path), exist_ok=True)
+
+    existing_urls = set()
+    if os.path.exists(segment_path):
+        existing_urls = {article.get('url') for article in _read_segment(segment_path)[1]}
+
+    unique_new_articles = []
+    for article in new_articles:
+        if article['url'] not in existing_urls:
+            existing_urls.add(article['url'])
+            unique_new_articles.append(article)
+
+    try:
+        # 새 기사가 없어도 파일을 만들어 두면 압축 시 오늘 날짜의 빈 항목이 생깁니다.
+        with open(segment_path, 'a', encoding='utf-8') as f:
+            for article in unique_new_articles:
+                f.write(json.dumps({'date': today_string, 'article': article}, ensure_ascii=False) + '\n')
+        if unique_new_articles:
+            print(f"총 {len(unique_new_articles)}개의 새 기사를 {segment_path}에 추가했습니다.")
+        else:
+            print(f"새로운 기사는 없지만, {segment_path} 세그먼트를 생성/유지했습니다.")
+    except Exception as e:
+        print(f"로그 저장 실패: {e}")
+
+def compact_article_log(result_filename, keep_days=None):
+    """
+    기존 JSON과 로그 세그먼트를 합쳐 프론트엔드가 읽는 [{date, articles}] 형식으로 다시 씁니다.
+    같은 날짜 안에서는 URL로 중복을 제거하므로 여러 번 실행해도 결과가 같습니다.
+    최근 keep_days일을 제외한 세그먼트는 JSON에 반영된 뒤 삭제합니다.
+    (오늘/어제 세그먼트는 다른 실행이 아직 추가할 수 있으므로 남겨 둡니다)
+    """
+    if keep_days is None:
+        keep_days = crawler_config.LOG_KEEP_SEGMENT_DAYS
+
+    segments = list(iter_log_segments(result_filename))
+    if not segments:
+        return 0
+
+    data = load_json_file(result_filename, [])
+    if not isinstance(data, list):
+        data = []
+    groups = {group.get('date'): group for group in data if isinstance(group, dict)}
+
+    added_count = 0
+    for _, date_string, articles in segments:
+        group = groups.get(date_string)
+        if group is None:
+            group = {'date': date_string, 'articles': []}
+            groups[date_string] = group
+            data.append(group)
+        seen_urls = {article.get('url') for article in group['articles']}
+        for article in articles:
+            if article.get('url') not in seen_urls:
+                seen_urls.add(article.get('url'))
+                group['articles'].append(article)
+                added_count += 1
+
+    write_json_atomic(result_filename, data, indent=2)
+
+    cutoff = (datetime.now() - timedelta(days=keep_days - 1)).strftime('%Y-%m-%d')
+    log_dir = _log_dir(result_filename)
+    for day_key, _, _ in segments:
+        if day_key < cutoff:
+            os.remove(os.path.join(log_dir, f"{day_key}.jsonl"))
+
+    print(f"{result_filename}: 로그 세그먼트 {len(segments)}개 압축, 새 기사 {added_count}개 반영")
+    return added_count
+
+
+# 원본 파일 지문 (URL 색인, 증분 집계에서 '변경 없음' 판정에 사용)
+def source_fingerprint(result_filename):
+    """
+    JSON 파일 크기와 마지막 64KB의 해시, 로그 세그먼트 크기로 만든 지문입니다.
+    git checkout은 mtime을 바꾸므로 mtime 대신 내용 기반으로 비교합니다.
+    """
+    parts = []
+    try:
+        size = os.path.getsize(result_filename)
+        with open(result_filename, 'rb') as f:
+            f.seek(max(size - 65536, 0))
+            parts.append(f"{size}:{hashlib.sha1(f.read()).hexdigest()}")
+    except OSError:
+        parts.append('missing')
+    log_dir = _log_dir(result_filename)
+    if os.path.isdir(log_dir):
+        for name in sorted(os.listdir(log_dir)):
+            parts.append(f"{name}:{os.path.getsize(os.path.join(log_dir, name))}")
+    return '|'.join(parts)
+
+
+# 날짜 그룹 스트리밍 읽기
+# news_json/*.json은 json.dump(indent=2)로 저장되므로 최상위 그룹은 항상
+# 줄바꿈 + 공백 2칸 + '{' 로 시작합니다. (문자열 안의 줄바꿈은 \n으로 이스케이프되므로
+# 이 패턴은 구조에서만 나타납니다) 이를 이용해 파일 끝에서부터 그룹 단위로 읽습니다.
+_GROUP_START = b'\n  {\n'
+_STREAM_CHUNK_SIZE = 65536
+
+def parse_group_date(date_string):
+    """'2025년 11월 23일 일요일'(요일 생략 가능) -> datetime, 형식이 다르면 None"""
+    try:
+        return datetime.strptime(' '.join(date_string.split(' ')[:3]), '%Y년 %m월 %d일')
+    except (ValueError, AttributeError):
+        return None
+
+def _is_indented_group_file(f):
+    f.seek(0)
+    head = f.read(len(_GROUP_START) + 1)
+    return head == b'[' + _GROUP_START
+
+def _iter_groups_forward(f):
+    """'[' 다음의 그룹 객체를 하나씩 raw_decode 합니다. 메모리는 그룹 하나 크기만 사용합니다."""
+    decoder = json.JSONDecoder()
+    f.seek(0)
+    buffer = ''
+    pending = b''
+    position = 0
+    started = False
+    eof = False
+    while True:
+        # 다음 값 시작 위치로 이동 (공백, 쉼표, 여는 대괄호 건너뛰기)
+        while position < len(buffer) and buffer[position] in ' \t\r\n,[':
+            if buffer[position] == '[':
+                started = True
+            position += 1
+        if position < len(buffer) and buffer[position] == ']':
+            return
+        if position < len(buffer) and started:
+            try:
+                group, end = decoder.raw_decode(buffer, position)
+                yield group
+                buffer = buffer[end:]
+                position = 0
+                continue
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+        if eof:
+            return
+        chunk = f.read(_STREAM_CHUNK_SIZE)
+        if not chunk:
+            eof = True
+            chunk = b''
+        data = pending + chunk
+        # 멀티바이트 문자가 청크 경계에서 잘리지 않도록 남는 바이트는 다음으로 넘깁니다.
+        try:
+            text = data.decode('utf-8')
+            pending = b''
+        except UnicodeDecodeError as e:
+            if e.start < len(data) - 3:
+                raise
+            text = data[:e.start].decode('utf-8')
+            pending = data[e.start:]
+        buffer += text
+
+def _iter_groups_reverse(f):
+    """
+    indent=2 파일을 끝에서부터 읽으며 (시작 오프셋, 그룹)을 최신 그룹부터 돌려줍니다.
+    필요한 만큼만 뒤에서 읽으므로 오래된 기록은 건드리지 않습니다.
+    """
+    f.seek(0, os.SEEK_END)
+    file_size = f.tell()
+    read_pos = file_size
+    buffer = b''
+    buffer_start = file_size
+    # 마지막 그룹의 끝: 파일 끝의 '\n]' 바로 앞
+    end = None
+    while True:
+        if end is None:
+            stripped = buffer.rstrip()
+            if stripped.endswith(b']'):
+                end = buffer_start + len(stripped) - 1
+        if end is not None:
+            marker = buffer.rfind(_GROUP_START, 0, end - buffer_start)
+            if marker >= 0:
+                start = buffer_start + marker + 1
+                raw = buffer[marker + 1:end - buffer_start].rstrip().rstrip(b',')
+                yield start, json.loads(raw.decode('utf-8'))
+                end = buffer_start + marker
+                # 이미 읽은 뒷부분은 버려서 메모리를 일정하게 유지
+                buffer = buffer[:marker + len(_GROUP_START)]
+                continue
+            if read_pos == 0:
+                return
+        read_size = min(_STREAM_CHUNK_SIZE, read_pos)
+        read_pos -= read_size
+        f.seek(read_pos)
+        buffer = f.read(read_size) + buffer
+        buffer_start = read_pos
+
+def iter_date_groups(result_filename, reverse=False, since=None):
+    """
+    news_json 파일의 {date, articles} 그룹을 전체 리스트를 만들지 않고 하나씩 돌려줍니다.
+    - reverse=True: 최신(파일 끝) 그룹부터 돌려줍니다.
+    - since(datetime): 그보다 오래된 날짜 그룹은 건너뜁니다. reverse=True면 거기서 멈추므로
+      최근 며칠치만 필요할 때 파일 끝부분만 읽게 됩니다. (그룹은 날짜순으로 추가된다고 가정)
+    파일이 없거나 비어 있으면 아무것도 돌려주지 않습니다.
+    """
+    if not os.path.exists(result_filename) or os.path.getsize(result_filename) == 0:
+        return
+    since_day = since.replace(hour=0, minute=0, second=0, microsecond=0) if since else None
+    with open(result_filename, 'rb') as f:
+        if reverse and _is_indented_group_file(f):
+            groups = (group for _, group in _iter_groups_reverse(f))
+        elif reverse:
+            # indent=2가 아닌 파일은 앞에서부터 읽은 뒤 뒤집습니다.
+            groups = reversed(list(_iter_groups_forward(f)))
+        else:
+            groups = _iter_groups_forward(f)
+        for group in groups:
+            if not isinstance(group, dict):
+                continue
+            if since_day is not None:
+                group_day = parse_group_date(group.get('date', ''))
+                if group_day is not None and group_day < since_day:
+                    if reverse:
+                        return
+                    continue
+            yield group
+
+
+# 유사 기사(near-duplicate) 색인
+_NEAR_DUP_PRIME = (1 << 31) - 1   # a * h + b가 int64를 넘지 않도록 31비트 소수 사용
+_NON_WORD_RE = re.compile(r'[\W_]+')
+
+
+def _shingles(text):
+    """공백/문장부호를 뺀 소문자 문자열의 글자 2-gram 집합 (한 글자면 그 글자)"""
+    normalized = _NON_WORD_RE.sub('', text or '').lower()
+    if len(normalized) < 2:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + 2] for i in range(len(normalized) - 1)}
+
+
+def _jaccard(a, b):
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateIndex:
+    """
+    MinHash-LSH로 제목(또는 제목+요약)이 거의 같은 기사를 묶는 색인입니다.
+    글자 2-gram 집합의 MinHash 서명을 밴드로 나눠 버킷에 넣고, 같은 버킷에 들어간
+    후보와만 실제 자카드 유사도를 비교하므로 기사 수에 거의 비례하는 시간에 묶입니다.
+    (유사도 기준: crawler_config.NEAR_DUP_THRESHOLD)
+
+    numpy가 있으면 서명 계산에 사용하고, 없으면 같은 값을 순수 파이썬으로 계산합니다.
+
+    사용법:
+        index = crawler_store.NearDuplicateIndex()
+        if index.find(title) is None:    # 비슷한 기사가 아직 없으면
+            index.add(title)
+        cluster_id = index.add(title)    # 또는 묶음 번호를 받아 기록
+    """
+
+    def __init__(self, threshold=None, permutations=None, bands=None):
+        self.threshold = crawler_config.NEAR_DUP_THRESHOLD if threshold is None else threshold
+        permutations = permutations or crawler_config.NEAR_DUP_PERMUTATIONS
+        self.bands = bands or crawler_config.NEAR_DUP_BANDS
+        self.rows = permutations // self.bands
+        rng = random.Random(crawler_config.NEAR_DUP_SEED)  # 실행이 달라도 같은 서명
+        self._a = [rng.randrange(1, _NEAR_DUP_PRIME) for _ in range(self.bands * self.rows)]
+        self._b = [rng.randrange(0, _NEAR_DUP_PRIME) for _ in range(self.bands * self.rows)]
+        try:
+            import numpy
+            self._np = numpy
+            self._a_col = numpy.array(self._a, dtype=numpy.int64)[:, None]
+            self._b_col = numpy.array(self._b, dtype=numpy.int64)[:, None]
+        except ImportError:
+            self._np = None
+        self._buckets = [{} for _ in range(self.bands)]  # 밴드별 {밴드 값: [문서 번호]}
+        self._shingle_sets = []
+        self._clusters = []
+        self._cluster_count = 0
+        self._lock = threading.Lock()
+
+    def _signature(self, shingles):
+        hashes = [zlib.crc32(s.encode('utf-8')) % _NEAR_DUP_PRIME for s in shingles]
+        if self._np is not None:
+            np = self._np
+            values = (self._a_col * np.array(hashes, dtype=np.int64) + self._b_col) % _NEAR_DUP_PRIME
+            return values.min(axis=1).tolist()
+        return [min((a * h + b) % _NEAR_DUP_PRIME for h in hashes) for a, b in zip(self._a, self._b)]
+
+    def _band_keys(self, signature):
+        rows = self.rows
+        return [tuple(signature[band * rows:(band + 1) * rows]) for band in range(self.bands)]
+
+    def _best_match(self, shingles, band_keys):
+        candidates = set()
+        for buckets, key in zip(self._buckets, band_keys):
+            candidates.update(buckets.get(key, ()))
+        best, best_score = None, self.threshold
+        for doc_id in candidates:
+            score = _jaccard(shingles, self._shingle_sets[doc_id])
+            if score >= best_score:
+                best, best_score = doc_id, score
+        return best
+
+    def find(self, text):
+        """이미 색인된 비슷한 기사의 묶음 번호. 없으면 None."""
+        shingles = _shingles(text)
+        if not shingles:
+            return None
+        band_keys = self._band_keys(self._signature(shingles))
+        with self._lock:
+            match = self._best_match(shingles, band_keys)
+            return None if match is None else self._clusters[match]
+
+    def add(self, text):
+        """기사를 색인에 넣고 묶음 번호를 반환합니다. 비슷한 기사가 없으면 새 번호를 붙입니다."""
+        shingles = _shingles(text)
+        band_keys = self._band_keys(self._signature(shingles)) if shingles else []
+        with self._lock:
+            match = self._best_match(shingles, band_keys) if shingles else None
+            if match is None:
+                cluster_id = self._cluster_count
+                self._cluster_count += 1
+            else:
+                cluster_id = self._clusters[match]
+            doc_id = len(self._shingle_sets)
+            self._shingle_sets.append(shingles)
+            self._clusters.append(cluster_id)
+            for buckets, key in zip(self._buckets, band_keys):
+                buckets.setdefault(key, []).append(doc_id)
+            return cluster_id
+
+    def __len__(self):
+        return len(self._shingle_sets)
+
+    @property
+    def cluster_count(self):
+        return self._cluster_count
@@ -0,0 +1,148 @@
+# crawler_time.py
+"""
+[공통 시각 파싱]
+사이트마다 목록/상세 페이지에 쓰는 시각 문자열('2025.04.18 20:54', '04-18 20:54',
+'2025년 07월 31일 13:44' ...)을 KST(UTC+9) 기준 datetime으로 바꿉니다.
+
+- strptime 형식 문자열을 처음 한 번 정규식으로 바꿔 두고(%Y %m %d %H %M %S만 사용하는 형식),
+  이후에는 정규식 매칭과 int 변환만으로 datetime을 만듭니다. 여러 형식을 차례로 시도할 때도
+  실패한 형식마다 ValueError를 만들지 않습니다. 그 밖의 지시자가 있는 형식은 strptime으로 처리합니다.
+- 연도가 없는 형식('%m-%d %H:%M')은 지금(KST) 기준으로 연도를 정하되, 결과가 하루 넘게 미래면
+  작년으로 봅니다. (1월 1일에 12월 31일 기사를 보는 경우)
+- 날짜가 없는 형식('%H:%M')은 오늘(KST) 날짜를 붙입니다.
+- GitHub Actions 러너는 UTC이므로 '지금'은 datetime.now()가 아니라 now()(KST)를 씁니다.
+
+저장 형식: news_json의 'time'은 기존처럼 시간대 없는 KST 벽시계 시각('2025-04-18T20:54:00')이며
+iso()가 이 형식을 만듭니다.
+
+사용 예:
+    dt = crawler_time.parse('04-18 20:54', ['%m-%d %H:%M', '%Y.%m.%d %H:%M'])
+    article['time'] = crawler_time.iso(dt)
+"""
+import re
+from datetime import datetime, timedelta, timezone
+
+KST = timezone(timedelta(hours=9), 'KST')
+
+_FIELD_PATTERNS = {
+    'Y': ('year', r'(\d{4})'),
+    'm': ('month', r'(\d{1,2})'),
+    'd': ('day', r'(\d{1,2})'),
+    'H': ('hour', r'(\d{1,2})'),
+    'M': ('minute', r'(\d{1,2})'),
+    'S': ('second', r'(\d{1,2})'),
+}
+_compiled = {}
+
+
+def now():
+    """지금 시각 (KST, 시간대 포함)"""
+    return datetime.now(KST)
+
+
+_FULL_FIELDS = ('year', 'month', 'day', 'hour', 'minute', 'second')
+
+
+def _compile(fmt):
+    """
+    strptime 형식을 (정규식, 필드 순서, 연도/날짜 포함 여부)로 바꿉니다.
+    지원하지 않는 지시자가 있으면 None. (그 형식은 strptime으로 처리)
+    """
+    pattern = []
+    fields = []
+    i = 0
+    while i < len(fmt):
+        char = fmt[i]
+        if char == '%':
+            directive = fmt[i + 1:i + 2]
+            if directive == '%':
+                pattern.append('%')
+            elif directive in _FIELD_PATTERNS:
+                name, regex = _FIELD_PATTERNS[directive]
+                if name in fields:
+                    return None
+                fields.append(name)
+                pattern.append(regex)
+            else:
+                return None
+            i += 2
+        elif char.isspace():
+            pattern.append(r'\s+')  # strptime과 같이 형식의 공백은 1개 이상의 공백과 맞음
+            while i + 1 < len(fmt) and fmt[i + 1].isspace():
+                i += 1
+            i += 1
+        else:
+            pattern.append(re.escape(char))
+            i += 1
+    # 정규식 그룹 값을 (year, month, day, hour, minute, second) 순서로 놓을 위치
+    order = tuple(fields.index(name) if name in fields else None for name in _FULL_FIELDS)
+    return re.compile(''.join(pattern), re.IGNORECASE), order, 'year' in fields, 'day' in fields
+
+
+def _get_compiled(fmt):
+    compiled = _compiled.get(fmt)
+    if compiled is None and fmt not in _compiled:
+        compiled = _compiled[fmt] = _compile(fmt)
+    return compiled
+
+
+def _build(groups, order, has_year, has_day, reference):
+    """
+    정규식 그룹 값으로 KST datetime을 만듭니다. 범위를 벗어나면 ValueError.
+    연도가 없으면 reference(지금) 기준으로 추정하고, 날짜도 없으면 reference의 날짜를 씁니다.
+    """
+    values = [0 if index is None else int(groups[index]) for index in order]
+    if has_year:
+        return datetime(*values, tzinfo=KST)
+    reference = to_kst(reference or now())  # UTC 기준 시각이어도 KST 날짜로 추정
+    values[0] = reference.year
+    if not has_day:
+        values[1], values[2] = reference.month, reference.day
+    dt = datetime(*values, tzinfo=KST)
+    if dt - reference > timedelta(days=1):
+        dt = dt.replace(year=dt.year - 1)
+    return dt
+
+
+def parse(text, formats, reference=None):
+    """
+    text를 formats의 형식 중 처음 맞는 것으로 해석해 KST datetime을 반환합니다. 맞는 형식이 없으면 None.
+    reference는 연도/날짜가 없는 형식에 쓸 기준 시각입니다. (기본: 지금, KST로 바꿔서 사용)
+    """
+    if not text:
+        return None
+    text = text.strip()
+    for fmt in formats:
+        compiled = _get_compiled(fmt)
+        if compiled is None:
+            try:
+                return datetime.strptime(text, fmt).replace(tzinfo=KST)
+            except ValueError:
+                continue
+        regex, order, has_year, has_day = compiled
+        match = regex.fullmatch(text)
+        if match is None:
+            continue
+        try:
+            return _build(match.groups(), order, has_year, has_day, reference)
+        except ValueError:  # 13월, 2월 30일처럼 범위를 벗어난 값
+            continue
+    return None
+
+
+def to_kst(dt):
+    """시간대가 있는 datetime을 KST로 바꿉니다. 시간대가 없으면 KST 벽시계 시각으로 봅니다."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=KST)
+    return dt.astimezone(KST)
+
+
+def iso(dt):
+    """news_json에 저장하는 형식: 시간대 없는 KST 시각의 ISO 문자열"""
+    return to_kst(dt).replace(tzinfo=None).isoformat()
+
+
+def parse_iso(text, formats, reference=None):
+    """parse()의 결과를 저장 형식(iso) 문자열로 반환합니다. 실패하면 None."""
+    dt = parse(text, formats, reference)
+    return iso(dt) if dt else None
@@ -1,28 +1,114 @@
+import atexit
+import gzip
+import bisect
+import contextlib
+import contextvars
+import functools
+import hashlib
+import importlib.util
 import json
 import os
+import random
 import re
-from datetime import datetime
+import sys
+import threading
+import zlib
+import time
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from urllib.parse import urlparse, urlunparse
 import crawler_config  # 우리가 만든 설정 파일
+# news_json 읽기/쓰기 기능은 표준 라이브러리만 쓰는 crawler_store에 있고, 크롤러는 여기서 같은 이름으로 사용합니다.
+from crawler_store import (
+    append_articles_to_log, format_date_string, iter_date_groups, iter_log_segments, load_json_file,
+    parse_group_date, source_fingerprint, write_json_atomic, _is_indented_group_file, _iter_groups_reverse,
+)
 
 # [!! Firebase Admin SDK 임포트 !!]
-import firebase_admin
-from firebase_admin import credentials, firestore
+# firebase_admin/firestore는 임포트만 0.3초 가까이 걸리므로 load_keywords()에서
+# 실제로 Firestore를 조회할 때 임포트합니다. (스냅샷만 쓰는 실행은 임포트하지 않음)
 
 # [!! Firebase 초기화 플래그 !!]
 # GitHub Action에서 스크립트가 여러 번 임포트되더라도
 # Firebase 앱이 한 번만 초기화되도록 보장합니다.
 _firebase_initialized = False
 
+# run_all.py처럼 한 프로세스에서 여러 크롤러를 임포트할 때
+# Firestore 키워드를 한 번만 읽도록 성공한 결과를 보관합니다.
+_keyword_cache = None
+
 # 공통 기능 1: 키워드 로드 [!! 대폭 수정됨 !!]
+def _keyword_snapshot_path():
+    return os.path.join(crawler_config.CRAWLER_CACHE_DIR, 'keyword_snapshot.json')
+
+def _keyword_content_hash(keywords, exclude_keywords):
+    payload = json.dumps([keywords, exclude_keywords], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+def _load_keyword_snapshot():
+    """로컬 키워드 스냅샷을 읽습니다. 없거나 내용 해시가 맞지 않으면 None."""
+    if not crawler_config.KEYWORD_SNAPSHOT_ENABLED:
+        return None
+    snapshot = load_json_file(_keyword_snapshot_path(), None)
+    if not isinstance(snapshot, dict):
+        return None
+    keywords = snapshot.get('keywords', [])
+    exclude_keywords = snapshot.get('exclude_keywords', [])
+    if snapshot.get('content_hash') != _keyword_content_hash(keywords, exclude_keywords):
+        print("키워드 스냅샷의 내용 해시가 맞지 않아 무시합니다.")
+        return None
+    return snapshot
+
+def _save_keyword_snapshot(keywords, exclude_keywords, update_time):
+    if not crawler_config.KEYWORD_SNAPSHOT_ENABLED:
+        return
+    try:
+        write_json_atomic(_keyword_snapshot_path(), {
+            'keywords': keywords,
+            'exclude_keywords': exclude_keywords,
+            'content_hash': _keyword_content_hash(keywords, exclude_keywords),
+            'update_time': update_time,
+            'checked_at': time.time(),
+        })
+    except OSError as e:
+        print(f"키워드 스냅샷 저장 실패: {e}")
+
+def _is_snapshot_fresh(snapshot):
+    max_age = crawler_config.KEYWORD_SNAPSHOT_MAX_AGE_MINUTES * 60
+    return max_age > 0 and time.time() - snapshot.get('checked_at', 0) < max_age
+
 def load_keywords():
     """
     [수정됨] News_keyword.json 로컬 파일 대신,
     Firebase Firestore의 'keywords/main' 문서에서 키워드를 직접 로드합니다.
     GitHub Action YML에 설정된 GOOGLE_APPLICATION_CREDENTIALS를 사용합니다.
+
+    마지막으로 읽은 키워드는 CRAWLER_CACHE_DIR/keyword_snapshot.json에
+    내용 해시, 문서 update_time과 함께 저장해 두고,
+    - Firestore 문서의 update_time이 그대로면 스냅샷을 그대로 사용하고,
+    - Firestore에 접속할 수 없으면 빈 리스트 대신 스냅샷으로 대체합니다.
     """
-    global _firebase_initialized
-    
+    if _keyword_cache is not None:
+        return _keyword_cache
+
+    with get_metrics().timer('keywords'):
+        return _load_keywords()
+
+def _load_keywords():
+    global _firebase_initialized, _keyword_cache
+
+    snapshot = _load_keyword_snapshot()
+    if snapshot is not None and _is_snapshot_fresh(snapshot):
+        print(f"최근에 확인한 키워드 스냅샷 사용: {len(snapshot['keywords'])} keywords, "
+              f"{len(snapshot['exclude_keywords'])} exclude_keywords.")
+        _keyword_cache = (snapshot['keywords'], snapshot['exclude_keywords'])
+        return _keyword_cache
+
     try:
+        import firebase_admin
+        from firebase_admin import firestore
+
         # 1. Firebase Admin SDK 초기화 (최초 1회만)
         if not _firebase_initialized:
             # GitHub Action YML에서 GOOGLE_APPLICATION_CREDENTIALS 환경 변수를
@@ -39,74 +125,202 @@ def load_keywords():
         doc = doc_ref.get()
 
         if doc.exists:
-            data = doc.to_dict()
-            
-            # 4. 키워드 목록 평탄화 (is_relevant 함수 호환성 유지)
-            # Firestore 데이터: { "keywords": [ {"category": "A", "items": ["a1", "a2"]}, ... ] }
-            # 변환된 데이터: ["a1", "a2", ...]
-            keywords = [item for cat in data.get('keywords', []) for item in cat.get('items', [])]
-            exclude_keywords = [item for cat in data.get('exclude_keywords', []) for item in cat.get('items', [])]
-            
-            print(f"Firestore loaded: {len(keywords)} keywords, {len(exclude_keywords)} exclude_keywords.")
-            return keywords, exclude_keywords
+            update_time = doc.update_time.isoformat() if doc.update_time else None
+            if snapshot is not None and update_time and snapshot.get('update_time') == update_time:
+                keywords = snapshot['keywords']
+                exclude_keywords = snapshot['exclude_keywords']
+                print(f"Firestore keywords unchanged since {update_time}, using snapshot: "
+                      f"{len(keywords)} keywords, {len(exclude_keywords)} exclude_keywords.")
+            else:
+                data = doc.to_dict()
+
+                # 4. 키워드 목록 평탄화 (is_relevant 함수 호환성 유지)
+                # Firestore 데이터: { "keywords": [ {"category": "A", "items": ["a1", "a2"]}, ... ] }
+                # 변환된 데이터: ["a1", "a2", ...]
+                keywords = [item for cat in data.get('keywords', []) for item in cat.get('items', [])]
+                exclude_keywords = [item for cat in data.get('exclude_keywords', []) for item in cat.get('items', [])]
+                print(f"Firestore loaded: {len(keywords)} keywords, {len(exclude_keywords)} exclude_keywords.")
+
+            # checked_at을 갱신하기 위해 변경이 없어도 다시 저장합니다.
+            _save_keyword_snapshot(keywords, exclude_keywords, update_time)
+            _keyword_cache = (keywords, exclude_keywords)
+            return _keyword_cache
         else:
             print("Error: Firestore document '/keywords/main' not found.")
-            return [], []
 
     except Exception as e:
         print(f"Firestore 키워드 로드 중 치명적인 오류 발생: {e}")
-        # Firestore가 실패하면 크롤링이 잘못될 수 있으므로, 비상용 로컬 파일을
-        # 읽거나, 빈 리스트를 반환하여 크롤러를 안전하게 중지시킵니다.
-        return [], []
+
+    # Firestore가 실패하면 마지막으로 성공한 스냅샷으로 대체합니다.
+    # 스냅샷도 없으면 빈 리스트를 반환합니다. (is_relevant가 모든 기사를 통과시키므로 주의)
+    if snapshot is not None:
+        print(f"로컬 키워드 스냅샷으로 대체합니다 (update_time: {snapshot.get('update_time')}): "
+              f"{len(snapshot['keywords'])} keywords, {len(snapshot['exclude_keywords'])} exclude_keywords.")
+        _keyword_cache = (snapshot['keywords'], snapshot['exclude_keywords'])
+        return _keyword_cache
+    print("Warning: 사용할 키워드 스냅샷이 없어 빈 키워드 목록을 사용합니다.")
+    return [], []
 
 # 공통 기능 2: 오늘 날짜 문자열 생성 (변경 없음)
 def get_today_string():
     """'YYYY년 MM월 DD일 요일' 형식의 오늘 날짜 문자열을 반환합니다."""
-    today_dt = datetime.now()
-    day_map = {
-        'Monday': '월요일', 'Tuesday': '화요일', 'Wednesday': '수요일',
-        'Thursday': '목요일', 'Friday': '금요일', 'Saturday': '토요일', 'Sunday': '일요일'
-    }
-    eng_day = today_dt.strftime('%A')
-    kor_day = day_map.get(eng_day, eng_day)
-    return today_dt.strftime(f'%Y년 %m월 %d일 {kor_day}')
-
-# 공통 기능 3: 기사 관련성 검사 (변경 없음)
+    return format_date_string(datetime.now())
+
+# 공통 기능 3: 기사 관련성 검사
+class KeywordMatcher:
+    """
+    포함/제외 키워드를 하나의 Aho-Corasick 오토마톤으로 컴파일한 매처입니다.
+    텍스트를 한 번만 훑으면서 서로 다른 포함 키워드 수를 세고,
+    제외 키워드를 만나는 즉시 검사를 중단합니다.
+    """
+
+    def __init__(self, keywords, exclude_keywords, min_required=None):
+        if min_required is None:
+            min_required = crawler_config.MIN_KEYWORDS_REQUIRED
+        self.min_required = min_required
+
+        include = {keyword.lower() for keyword in keywords}
+        exclude = {keyword.lower() for keyword in exclude_keywords}
+
+        # 빈 문자열 키워드는 기존 `'' in text` 동작처럼 항상 일치한 것으로 취급
+        self._always_hits = 1 if '' in include else 0
+        self._always_excluded = '' in exclude
+        include.discard('')
+        exclude.discard('')
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._include_out = [()]
+        self._exclude_out = [False]
+
+        for pattern_id, pattern in enumerate(sorted(include)):
+            node = self._insert(pattern)
+            self._include_out[node] += (pattern_id,)
+        for pattern in exclude:
+            node = self._insert(pattern)
+            self._exclude_out[node] = True
+
+        self._has_exclude = bool(exclude)
+        self._build_failure_links()
+
+    def _insert(self, pattern):
+        node = 0
+        for ch in pattern:
+            next_node = self._goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][ch] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._include_out.append(())
+                self._exclude_out.append(False)
+            node = next_node
+        return node
+
+    def _build_failure_links(self):
+        goto, fail = self._goto, self._fail
+        queue = list(goto[0].values())
+        for node in queue:
+            for ch, child in goto[node].items():
+                queue.append(child)
+                fallback = fail[node]
+                while fallback and ch not in goto[fallback]:
+                    fallback = fail[fallback]
+                target = goto[fallback].get(ch, 0)
+                fail[child] = target if target != child else 0
+                # 실패 링크를 따라 도달하는 패턴들도 이 노드에서 함께 보고되도록 병합
+                self._include_out[child] += self._include_out[fail[child]]
+                self._exclude_out[child] = self._exclude_out[child] or self._exclude_out[fail[child]]
+
+    def is_relevant(self, text_content):
+        """포함 키워드가 min_required개 이상이고 제외 키워드가 없으면 True."""
+        if self._always_excluded:
+            return False
+
+        needed = self.min_required - self._always_hits
+        if needed <= 0 and not self._has_exclude:
+            return True
+
+        goto, fail = self._goto, self._fail
+        include_out, exclude_out = self._include_out, self._exclude_out
+        hits = set()
+        node = 0
+        for ch in text_content.lower():
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if not node:
+                continue
+            if exclude_out[node]:
+                return False
+            if include_out[node]:
+                hits.update(include_out[node])
+                if not self._has_exclude and len(hits) >= needed:
+                    return True
+        return len(hits) >= needed
+
+
+# 같은 키워드 리스트로 매번 오토마톤을 다시 만들지 않도록 컴파일 결과를 보관합니다.
+# 리스트 객체 자체를 함께 보관하므로 id()가 재사용될 일은 없습니다.
+_matcher_cache = {}
+
+def get_keyword_matcher(keywords, exclude_keywords):
+    """load_keywords() 결과에 대한 컴파일된 KeywordMatcher를 반환합니다."""
+    cache_key = (id(keywords), len(keywords), id(exclude_keywords), len(exclude_keywords),
+                 crawler_config.MIN_KEYWORDS_REQUIRED)
+    cached = _matcher_cache.get(cache_key)
+    if cached is None:
+        matcher = KeywordMatcher(keywords, exclude_keywords)
+        cached = (keywords, exclude_keywords, matcher)
+        _matcher_cache[cache_key] = cached
+    return cached[2]
+
 def is_relevant(text_content, keywords, exclude_keywords):
     """
     기사 내용이 설정된 키워드(crawler_config)와 일치하는지, 
     제외 키워드에 포함되지 않는지 검사합니다.
-    (load_keywords가 동일한 형식을 반환하므로 수정 필요 없음)
+    키워드마다 `in` 검사를 반복하는 대신, 컴파일된 KeywordMatcher로
+    텍스트를 한 번만 훑습니다. (서로 다른 포함 키워드 수 기준)
     """
     if not keywords:  # 키워드 파일이 없으면 True 반환 (모두 수집)
         return True
-        
-    text_lower = text_content.lower()
-    
-    # 1. 키워드 개수 확인
-    matching_keywords_count = sum(1 for keyword in keywords if keyword.lower() in text_lower)
-    
-    if matching_keywords_count < crawler_config.MIN_KEYWORDS_REQUIRED:
-        return False
-        
-    # 2. 제외 키워드 확인
-    exclude_match = any(keyword.lower() in text_lower for keyword in exclude_keywords)
-    if exclude_match:
-        return False
-        
-    return True
+
+    start = time.perf_counter()
+    relevant = get_keyword_matcher(keywords, exclude_keywords).is_relevant(text_content)
+    get_metrics().add_time('relevance', time.perf_counter() - start)
+    return relevant
 
 # 공통 기능 4: 빈 JSON 파일 생성 (시작 시)
 # (이 함수는 주석 처리되었거나 비어 있었으므로 그대로 둡니다)
 
 
-# 공통 기능 5: 기존 링크 로드 (변경 없음)
+# 공통 기능 5: 기존 링크 로드
 def get_existing_links(result_filename):
+    """
+    이미 저장된 기사 URL의 집합(UrlIndex)을 반환합니다. `in`, `add`, `len`을 지원합니다.
+    URL 색인 사이드카가 최신이면 JSON을 파싱하지 않고 64비트 해시 배열만 읽고,
+    없거나 오래되었으면 JSON(과 로그 세그먼트)에서 다시 만들어 저장합니다.
+    """
+    index = load_url_index(result_filename)
+    if index is None:
+        links = _scan_existing_links(result_filename)
+        index = UrlIndex(url_hash(url) for url in links)
+        write_url_index(result_filename, index)
+    # 보관 파일로 옮겨진 오래된 기사도 중복으로 보도록 보관 URL 색인을 함께 조회
+    archive_index = load_archive_index(result_filename)
+    if archive_index is not None:
+        index.attach_archive(archive_index)
+    return index
+
+def _scan_existing_links(result_filename):
     """
     기존 JSON 파일에서 모든 기사의 URL을 읽어와 Set으로 반환합니다.
     파일이 없거나 손상되었으면 빈 Set을 반환합니다.
     """
     links = set()
+    # 추가 전용 로그(STORAGE_MODE='jsonl')에 아직 압축되지 않은 기사도 포함
+    for _, _, articles in iter_log_segments(result_filename):
+        links.update(article['url'] for article in articles if 'url' in article)
     try:
         # 파일이 비어있거나 존재하지 않으면 빈 Set 반환
         if not os.path.exists(result_filename) or os.stat(result_filename).st_size == 0:
@@ -136,8 +350,39 @@ def save_articles_to_json(result_filename, new_articles, today_string):
     새 기사 목록을 기존 JSON 파일에 오늘 날짜로 추가하여 저장합니다.
     중복 URL은 자동으로 걸러냅니다.
     새 기사가 없더라도 오늘 날짜의 빈 항목을 생성/유지합니다.
+    crawler_config.STORAGE_MODE가 'jsonl'이면 전체 파일을 다시 쓰지 않고
+    오늘 날짜의 로그 세그먼트에 새 기사만 추가합니다.
+    샤드 실행(crawler_config.SHARD)이면 news_json 대신 샤드 폴더의 로그에 추가합니다. (shard_output_path)
     """
-    
+    metrics = get_metrics()
+    metrics.count('articles_new', len(new_articles))
+    with metrics.timer('save'):
+        saved = _save_articles(result_filename, new_articles, today_string)
+    if saved:
+        commit_listings()
+
+def _save_articles(result_filename, new_articles, today_string):
+    """저장에 성공하면 True"""
+    if get_shard() is not None:
+        append_articles_to_log(shard_output_path(result_filename), new_articles, today_string)
+        return True
+    previous_fingerprint = source_fingerprint(result_filename)
+    if crawler_config.STORAGE_MODE == 'jsonl':
+        append_articles_to_log(result_filename, new_articles, today_string)
+        sync_url_index(result_filename, new_articles, previous_fingerprint)
+        return True
+
+    # 오늘 그룹은 보통 파일의 마지막 그룹이므로, 가능하면 파일 끝부분만 다시 씁니다.
+    try:
+        added_count = _save_to_tail_group(result_filename, new_articles, today_string)
+    except (OSError, ValueError) as e:
+        print(f"{result_filename} 끝부분 저장 실패, 전체 저장으로 전환합니다: {e}")
+        added_count = None
+    if added_count is not None:
+        _print_save_result(result_filename, added_count)
+        sync_url_index(result_filename, new_articles, previous_fingerprint)
+        return True
+
     existing_data = []
     
     # --- 파일/폴더 존재 여부 확인 및 초기화 (ensure_file_exists 로직 통합) ---
@@ -179,11 +424,1336 @@ def save_articles_to_json(result_filename, new_articles, today_string):
     try:
         with open(result_filename, 'w', encoding='utf-8') as f:
             json.dump(existing_data, f, ensure_ascii=False, indent=2)
-        
-        if added_count > 0:
-            print(f"총 {added_count}개의 새 기사를 {result_filename}에 저장했습니다.")
-        else:
-            # 이 로그가 뜨면 성공입니다.
-            print(f"새로운 기사는 없지만, {result_filename}의 오늘 날짜 항목을 생성/업데이트했습니다.")
+        _print_save_result(result_filename, added_count)
     except Exception as e:
         print(f"JSON 저장 실패: {e}")
+        return False
+    sync_url_index(result_filename, new_articles, previous_fingerprint)
+    return True
+
+def _print_save_result(result_filename, added_count):
+    if added_count > 0:
+        print(f"총 {added_count}개의 새 기사를 {result_filename}에 저장했습니다.")
+    else:
+        # 이 로그가 뜨면 성공입니다.
+        print(f"새로운 기사는 없지만, {result_filename}의 오늘 날짜 항목을 생성/업데이트했습니다.")
+
+def _dump_group(group):
+    """json.dump(list, indent=2) 안에 들어가는 그룹과 똑같은 모양(2칸 들여쓰기)으로 직렬화"""
+    text = json.dumps(group, ensure_ascii=False, indent=2)
+    return '\n'.join('  ' + line for line in text.split('\n')).encode('utf-8')
+
+def _save_to_tail_group(result_filename, new_articles, today_string):
+    """
+    마지막 그룹만 읽고 그 자리부터 다시 써서, 전체 파일을 파싱/직렬화하지 않고 저장합니다.
+    결과 파일은 json.dump(indent=2)로 전체를 쓴 것과 바이트 단위로 같습니다.
+    indent=2 형식이 아니거나 마지막 그룹이 오늘보다 미래 날짜면 None을 반환합니다.
+    """
+    if not os.path.exists(result_filename) or os.path.getsize(result_filename) == 0:
+        return None
+    with open(result_filename, 'r+b') as f:
+        if not _is_indented_group_file(f):
+            return None
+        last = next(_iter_groups_reverse(f), None)
+        if last is None:
+            return None
+        start, last_group = last
+
+        if last_group.get('date') == today_string:
+            # 오늘 날짜 항목이 있으면, 기존 URL Set을 만들어서 중복 제거
+            existing_urls = {article['url'] for article in last_group.get('articles', [])}
+            unique_new_articles = [
+                article for article in new_articles if article['url'] not in existing_urls
+            ]
+            last_group['articles'].extend(unique_new_articles)
+            write_from, payload = start, _dump_group(last_group)
+            added_count = len(unique_new_articles)
+        else:
+            last_day = parse_group_date(last_group.get('date', ''))
+            today_day = parse_group_date(today_string)
+            if last_day is None or today_day is None or last_day > today_day:
+                return None
+            # 오늘 날짜 항목이 없으면 새로 추가 (new_articles가 비어있어도 추가)
+            f.seek(0, os.SEEK_END)
+            write_from = f.tell() - len(b'\n]')
+            payload = b',\n' + _dump_group({'date': today_string, 'articles': new_articles})
+            added_count = len(new_articles)
+
+        f.seek(write_from)
+        f.write(payload + b'\n]')
+        f.truncate()
+    return added_count
+
+# 공통 기능 7: 호스트별 요청 간격 조절 (politeness)
+_host_lock = threading.Lock()
+_host_next_slot = {}
+
+def wait_for_host(url):
+    """
+    같은 호스트로 보내는 요청 사이에 crawler_config.HOST_MIN_INTERVAL 만큼의
+    간격을 보장합니다. 크롤러마다 time.sleep을 거는 대신 호스트별로만 대기하므로,
+    여러 사이트를 동시에 크롤링해도 서로를 기다리지 않습니다.
+    """
+    host = urlparse(url).netloc
+    interval = crawler_config.HOST_MIN_INTERVAL.get(host, crawler_config.DEFAULT_HOST_MIN_INTERVAL)
+    if isinstance(interval, (tuple, list)):
+        interval = random.uniform(*interval)
+    interval *= crawler_config.HOST_INTERVAL_SCALE
+
+    # 다음 요청 시각을 잠금 안에서 예약하고, 대기는 잠금 밖에서 합니다.
+    with _host_lock:
+        now = time.monotonic()
+        slot = max(now, _host_next_slot.get(host, now))
+        _host_next_slot[host] = slot + interval
+
+    delay = slot - now
+    if delay > 0:
+        time.sleep(delay)
+
+# 공통 기능 8: 호스트별 커넥션 풀을 공유하는 HTTP 요청
+# requests/urllib3(와 bs4)는 임포트에 0.1초 넘게 걸리므로 모듈 임포트 시점이 아니라
+# 처음 요청(파싱)할 때 임포트합니다. (스케줄러가 모든 섹션을 건너뛰는 실행, 집계 스크립트 등)
+_RequestBudgetExceeded = None
+
+def _request_budget_exceeded():
+    """RequestBudgetExceeded 예외 클래스 (requests.RequestException의 하위 클래스, 처음 쓸 때 만듦)"""
+    global _RequestBudgetExceeded
+    if _RequestBudgetExceeded is None:
+        import requests
+
+        class RequestBudgetExceeded(requests.RequestException):
+            """한 번의 실행에서 허용된 전체 요청 수(HTTP_REQUEST_BUDGET)를 넘었을 때 발생합니다."""
+
+        _RequestBudgetExceeded = RequestBudgetExceeded
+    return _RequestBudgetExceeded
+
+def __getattr__(name):
+    # crawler_utils.RequestBudgetExceeded로 접근하면 그때 예외 클래스를 만듭니다.
+    if name == 'RequestBudgetExceeded':
+        return _request_budget_exceeded()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_session_lock = threading.Lock()
+_sessions = {}
+_request_count = 0
+
+def _get_session(host):
+    """호스트별 requests.Session을 (처음 한 번만) 만들어 반환합니다."""
+    session = _sessions.get(host)
+    if session is not None:
+        return session
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    with _session_lock:
+        session = _sessions.get(host)
+        if session is None:
+            pool_size = crawler_config.HTTP_POOL_MAXSIZE_PER_HOST.get(host, crawler_config.HTTP_POOL_MAXSIZE)
+            retry = Retry(
+                total=crawler_config.HTTP_MAX_RETRIES,
+                backoff_factor=crawler_config.HTTP_BACKOFF_FACTOR,
+                status_forcelist=crawler_config.HTTP_RETRY_STATUS,
+                allowed_methods=frozenset(['GET', 'HEAD']),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            # pool_block=True: 풀 크기를 넘는 동시 요청은 새 연결 대신 빈 연결을 기다립니다.
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size,
+                                  max_retries=retry, pool_block=True)
+            session = requests.Session()
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            _sessions[host] = session
+    return session
+
+def fetch(url, polite=False, timeout=None, **kwargs):
+    """
+    requests.get 대신 사용하는 공통 요청 함수입니다.
+    - 호스트별 Session을 재사용해 keep-alive 연결로 TCP/TLS 핸드셰이크를 줄입니다.
+    - 429/5xx 응답은 지수 백오프로 재시도합니다.
+    - polite=True면 목록 페이지처럼 wait_for_host로 호스트별 간격을 지킵니다.
+    - 실행당 요청 수가 HTTP_REQUEST_BUDGET을 넘으면 RequestBudgetExceeded를 발생시킵니다.
+    최종 응답이 4xx/5xx이면 raise_for_status()로 예외가 발생합니다.
+    """
+    import requests
+
+    session = _reserve_request(url, polite)
+    metrics = get_metrics()
+    start = time.perf_counter()
+    try:
+        response = session.get(replay_url(url), timeout=timeout or crawler_config.HTTP_TIMEOUT, **kwargs)
+    except requests.RequestException:
+        metrics.record_fetch(urlparse(url).netloc, time.perf_counter() - start, 0, failed=True)
+        raise
+    metrics.record_fetch(urlparse(url).netloc, time.perf_counter() - start, len(response.content),
+                         failed=response.status_code >= 400)
+    response.raise_for_status()
+    return response
+
+def replay_url(url):
+    """
+    crawler_config.REPLAY_URL이 설정되어 있으면 요청을 그 로컬 서버로 보냅니다. (오프라인 벤치마크)
+    https://news.daum.net/world?page=2 -> <REPLAY_URL>/https/news.daum.net/world?page=2
+    호스트별 Session, 요청 간격, 지표는 원래 URL의 호스트 기준 그대로입니다.
+    """
+    if not crawler_config.REPLAY_URL:
+        return url
+    parsed = urlparse(url)
+    replayed = f"{crawler_config.REPLAY_URL.rstrip('/')}/{parsed.scheme}/{parsed.netloc}{parsed.path or '/'}"
+    return f"{replayed}?{parsed.query}" if parsed.query else replayed
+
+def _reserve_request(url, polite):
+    """요청 예산을 하나 차감하고 (polite면 호스트 간격을 기다린 뒤) 호스트의 Session을 반환합니다."""
+    global _request_count
+
+    with _session_lock:
+        if _request_count >= crawler_config.HTTP_REQUEST_BUDGET:
+            raise _request_budget_exceeded()(f"요청 예산 초과 ({crawler_config.HTTP_REQUEST_BUDGET}회): {url}")
+        _request_count += 1
+
+    if polite:
+        with get_metrics().timer('polite_wait'):
+            wait_for_host(url)
+
+    return _get_session(urlparse(url).netloc)
+
+# 공통 기능 9: 실행 간에 유지되는 로컬 상태 파일 (crawler_config.CRAWLER_CACHE_DIR)
+def _keyword_fingerprint():
+    """현재 로드된 키워드의 해시. 키워드가 바뀌면 '변경 없음' 판정을 무효화하는 데 씁니다."""
+    if _keyword_cache is None:
+        return None
+    payload = json.dumps([_keyword_cache, crawler_config.MIN_KEYWORDS_REQUIRED], ensure_ascii=False)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+# 공통 기능 10: 목록 페이지 조건부 요청 캐시 (ETag / Last-Modified / 본문 해시)
+class ListingCache:
+    """
+    목록 페이지 URL별로 ETag, Last-Modified, 본문 해시를 디스크에 보관합니다.
+    다음 실행에서 If-None-Match/If-Modified-Since를 보내고, 304이거나 본문 해시가
+    같으면 '변경 없음'으로 판단해 HTML 파싱을 건너뛰게 합니다.
+
+    바뀐 페이지의 새 검증자는 소스(RunMetrics.current_source)별로 보류해 두었다가, 크롤러가 기사를
+    저장한 뒤(commit_listings) 확정합니다. 파싱/저장 전에 실패하거나 중단된 실행의 검증자가 남으면
+    다음 실행이 그 페이지를 '변경 없음'으로 건너뛰어 기사를 놓치기 때문입니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = load_json_file(path, {})
+        self.pending = {}
+        self.stats = {'requests': 0, 'not_modified': 0, 'same_body': 0}
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        with self._lock:
+            return self.entries.get(url)
+
+    def put(self, url, entry):
+        with self._lock:
+            self.entries[url] = entry
+
+    def stage(self, source, url, entry):
+        with self._lock:
+            self.pending.setdefault(source, {})[url] = entry
+
+    def discard(self, source, url):
+        with self._lock:
+            self.pending.get(source, {}).pop(url, None)
+
+    def commit(self, source):
+        with self._lock:
+            self.entries.update(self.pending.pop(source, {}))
+
+    def record(self, outcome):
+        with self._lock:
+            self.stats['requests'] += 1
+            if outcome in self.stats:
+                self.stats[outcome] += 1
+
+    def save(self):
+        """오래된 항목을 정리하고 파일로 저장한 뒤 적중률을 출력합니다. (확정되지 않은 검증자는 버림)"""
+        cutoff = time.time() - crawler_config.LISTING_CACHE_MAX_AGE_DAYS * 86400
+        with self._lock:
+            self.entries = {url: e for url, e in self.entries.items() if e.get('updated', 0) >= cutoff}
+            try:
+                write_json_atomic(self.path, self.entries)
+            except OSError as e:
+                print(f"목록 캐시 저장 실패 ({self.path}): {e}")
+            stats = dict(self.stats)
+        if stats['requests']:
+            hits = stats['not_modified'] + stats['same_body']
+            print(f"목록 캐시: {stats['requests']}회 요청, 304 {stats['not_modified']}회, "
+                  f"본문 동일 {stats['same_body']}회 (적중률 {hits / stats['requests']:.0%})")
+
+
+_listing_cache = None
+
+def _get_listing_cache():
+    global _listing_cache
+    if _listing_cache is None:
+        with _session_lock:
+            if _listing_cache is None:
+                path = os.path.join(crawler_config.CRAWLER_CACHE_DIR, 'listing_cache.json')
+                _listing_cache = ListingCache(path)
+                atexit.register(_listing_cache.save)
+    return _listing_cache
+
+def fetch_listing(url, **kwargs):
+    """
+    목록(섹션) 페이지용 fetch입니다. 호스트별 간격(polite)을 지키고,
+    지난 실행 이후 페이지가 바뀌지 않았으면 None을 반환합니다.
+    None을 받은 크롤러는 파싱 없이 그 페이지를 건너뛰면 됩니다.
+    """
+    if not crawler_config.LISTING_CACHE_ENABLED:
+        return fetch(url, polite=True, **kwargs)
+
+    cache = _get_listing_cache()
+    entry = cache.get(url)
+    fingerprint = _keyword_fingerprint()
+    # 키워드가 바뀌었으면 같은 페이지라도 다시 걸러야 하므로 검증자를 보내지 않습니다.
+    reusable = bool(entry) and fingerprint is not None and entry.get('keywords') == fingerprint
+
+    headers = dict(kwargs.pop('headers', None) or {})
+    if reusable:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+
+    response = fetch(url, polite=True, headers=headers, **kwargs)
+    if response.status_code == 304:
+        cache.record('not_modified')
+        get_metrics().count('listing_not_modified')
+        cache.put(url, dict(entry, updated=time.time()))
+        return None
+
+    body_hash = hashlib.sha1(response.content).hexdigest()
+    if reusable and entry.get('body_hash') == body_hash:
+        cache.record('same_body')
+        get_metrics().count('listing_unchanged')
+        cache.put(url, dict(entry, updated=time.time()))
+        return None
+
+    # 바뀐 페이지: 크롤러가 이 페이지의 기사를 저장한 뒤(commit_listings)에만 검증자를 확정합니다.
+    cache.stage(RunMetrics.current_source(), url, {
+        'etag': response.headers.get('ETag'),
+        'last_modified': response.headers.get('Last-Modified'),
+        'body_hash': body_hash,
+        'keywords': fingerprint,
+        'updated': time.time(),
+    })
+    cache.record('changed')
+    return response
+
+def discard_listing(url):
+    """
+    fetch_listing으로 받은 목록 페이지를 처리하다 실패했을 때 호출합니다.
+    그 페이지의 새 검증자를 버려서, 다음 실행이 '변경 없음'으로 건너뛰지 않고 다시 처리합니다.
+    """
+    if _listing_cache is not None:
+        _listing_cache.discard(RunMetrics.current_source(), url)
+
+def commit_listings():
+    """
+    이 소스가 이번 실행에서 받은 목록 페이지의 검증자를 확정합니다.
+    save_articles_to_json이 저장을 마친 뒤 호출하며, 새 기사가 없어 저장하지 않는 크롤러는 직접 호출합니다.
+    """
+    if _listing_cache is not None:
+        _listing_cache.commit(RunMetrics.current_source())
+
+
+# 공통 기능 11: 기사 상세 정보 캐시 (URL -> 시간/이미지/요약)
+class DetailCache:
+    """
+    상세 페이지에서 뽑은 값(요약, 이미지, 시간 등)을 URL별로 디스크에 보관합니다.
+    TTL이 지난 항목은 버리고, 최대 개수를 넘으면 가장 오래 쓰지 않은 항목부터 지웁니다(LRU).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = OrderedDict(load_json_file(path, {}))
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, url):
+        ttl = crawler_config.DETAIL_CACHE_TTL_HOURS * 3600
+        with self._lock:
+            entry = self.entries.get(url)
+            if entry is None or time.time() - entry['t'] > ttl:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(url)
+            self.hits += 1
+            return entry['v']
+
+    def put(self, url, value):
+        with self._lock:
+            self.entries[url] = {'v': value, 't': time.time()}
+            self.entries.move_to_end(url)
+            while len(self.entries) > crawler_config.DETAIL_CACHE_MAX_ENTRIES:
+                self.entries.popitem(last=False)
+
+    def save(self):
+        ttl = crawler_config.DETAIL_CACHE_TTL_HOURS * 3600
+        now = time.time()
+        with self._lock:
+            live = OrderedDict((url, e) for url, e in self.entries.items() if now - e['t'] <= ttl)
+            try:
+                write_json_atomic(self.path, live)
+            except OSError as e:
+                print(f"상세 캐시 저장 실패 ({self.path}): {e}")
+        if self.hits or self.misses:
+            print(f"상세 캐시: 적중 {self.hits}회, 미적중 {self.misses}회 (항목 {len(live)}개)")
+
+
+_detail_cache = None
+
+def _get_detail_cache():
+    global _detail_cache
+    if _detail_cache is None:
+        with _session_lock:
+            if _detail_cache is None:
+                path = os.path.join(crawler_config.CRAWLER_CACHE_DIR, 'detail_cache.json')
+                _detail_cache = DetailCache(path)
+                atexit.register(_detail_cache.save)
+    return _detail_cache
+
+def cached_details(func=None, required=()):
+    """
+    extract_article_details(url) 같은 상세 추출 함수에 붙이는 데코레이터입니다.
+    캐시에 있으면 요청 없이 바로 반환하고, 없으면 함수를 호출해 결과를 저장합니다.
+    모든 값이 비어 있는 결과(추출 실패)는 다음 실행에서 다시 시도하도록 저장하지 않습니다.
+    required에 튜플 결과의 위치를 주면 그 값이 비어 있을 때도 저장하지 않습니다.
+    (예: @cached_details(required=(0,)) - 게시 시각 없이 요약만 있는 결과를 48시간 동안 재사용하지 않도록)
+    url 뒤의 인자(crawler_engine의 사이트 spec 등)는 그대로 전달되며 캐시 키에는 쓰이지 않습니다.
+    """
+    if func is None:
+        return functools.partial(cached_details, required=required)
+
+    def is_complete(value):
+        if isinstance(value, tuple):
+            return any(value) and all(value[index] for index in required)
+        return bool(value)
+
+    @functools.wraps(func)
+    def wrapper(url, *args):
+        metrics = get_metrics()
+        if crawler_config.DETAIL_CACHE_ENABLED:
+            value = _get_detail_cache().get(url)
+            if isinstance(value, list):
+                value = tuple(value)
+            # 이 규칙 전에 저장된 불완전한 항목은 없는 것으로 봄
+            if value is not None and is_complete(value):
+                metrics.count('detail_cache_hits')
+                return value
+        metrics.count('detail_fetches')
+        with metrics.timer('detail'):
+            value = func(url, *args)
+        if crawler_config.DETAIL_CACHE_ENABLED and is_complete(value):
+            _get_detail_cache().put(url, value)
+        return value
+    return wrapper
+
+
+# 공통 기능 12: 추가 전용(append-only) 기사 로그 -> crawler_store.py
+
+
+# 공통 기능 13: URL 색인 사이드카 (64비트 URL 해시의 정렬 배열)
+# .crawler_cache/url_index/<소스>.idx 파일 구조:
+#   b'URLIDX1\n' + 4바이트 헤더 길이 + 헤더 JSON(원본 지문) + uint64 정렬 배열
+_URL_INDEX_MAGIC = b'URLIDX1\n'
+
+def normalize_url(url):
+    """색인용 URL 정규화: 공백/프래그먼트 제거, 스킴과 호스트 소문자화"""
+    parsed = urlparse(url.strip())
+    return urlunparse((parsed.scheme.lower(), parsed.netloc.lower(), parsed.path,
+                       parsed.params, parsed.query, ''))
+
+def url_hash(url):
+    """정규화된 URL의 64비트 해시 (blake2b)"""
+    digest = hashlib.blake2b(normalize_url(url).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+class UrlIndex:
+    """
+    get_existing_links가 돌려주는 URL 집합입니다. 전체 URL 문자열 대신
+    정렬된 64비트 해시 배열을 이분 탐색하고, 이번 실행에서 추가된 URL만 별도 set에 둡니다.
+    """
+
+    def __init__(self, hashes=()):
+        self._sorted = array('Q', sorted(set(hashes)))
+        self._added = set()
+        self._archives = []
+
+    @classmethod
+    def from_sorted_bytes(cls, raw):
+        index = cls()
+        index._sorted.frombytes(raw)
+        return index
+
+    def _in_sorted(self, value):
+        i = bisect.bisect_left(self._sorted, value)
+        return i < len(self._sorted) and self._sorted[i] == value
+
+    def __contains__(self, url):
+        value = url_hash(url)
+        if value in self._added or self._in_sorted(value):
+            return True
+        return any(archive._in_sorted(value) for archive in self._archives)
+
+    def attach_archive(self, archive):
+        """보관(archive) 색인을 조회 대상에 붙입니다. 저장할 때는 포함되지 않습니다."""
+        self._archives.append(archive)
+
+    def add(self, url):
+        self._added.add(url_hash(url))
+
+    def update(self, urls):
+        for url in urls:
+            self.add(url)
+
+    def __len__(self):
+        own = len(self._sorted) + sum(1 for value in self._added if not self._in_sorted(value))
+        return own + sum(len(archive) for archive in self._archives)
+
+    def sorted_hashes(self):
+        return array('Q', sorted(set(self._sorted).union(self._added)))
+
+
+def _url_index_path(result_filename):
+    source = os.path.splitext(os.path.basename(result_filename))[0]
+    return os.path.join(crawler_config.CRAWLER_CACHE_DIR, 'url_index', f"{source}.idx")
+
+def _read_url_index(path):
+    """색인 파일을 읽어 (지문, UrlIndex)를 반환합니다. 형식이 맞지 않으면 (None, None)"""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+    except OSError:
+        return None, None
+    if not raw.startswith(_URL_INDEX_MAGIC):
+        return None, None
+    offset = len(_URL_INDEX_MAGIC)
+    header_len = int.from_bytes(raw[offset:offset + 4], 'little')
+    offset += 4
+    try:
+        header = json.loads(raw[offset:offset + header_len].decode('utf-8'))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None, None
+    body = raw[offset + header_len:]
+    if len(body) % 8:
+        return None, None
+    return header.get('fingerprint'), UrlIndex.from_sorted_bytes(body)
+
+def load_url_index(result_filename):
+    """원본과 지문이 일치하는 색인이 있으면 UrlIndex를, 없거나 오래되었으면 None을 반환합니다."""
+    fingerprint, index = _read_url_index(_url_index_path(result_filename))
+    if index is None or fingerprint != source_fingerprint(result_filename):
+        return None
+    return index
+
+def write_url_index(result_filename, index):
+    _write_url_index_file(_url_index_path(result_filename), index, source_fingerprint(result_filename))
+
+def _write_url_index_file(path, index, fingerprint):
+    header = json.dumps({'fingerprint': fingerprint}).encode('utf-8')
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_URL_INDEX_MAGIC)
+            f.write(len(header).to_bytes(4, 'little'))
+            f.write(header)
+            f.write(index.sorted_hashes().tobytes())
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"URL 색인 저장 실패 ({path}): {e}")
+
+def sync_url_index(result_filename, new_articles, previous_fingerprint):
+    """
+    저장 직후 호출합니다. 저장 전 원본과 일치하던 색인이면 새 URL만 합치고,
+    그렇지 않으면 원본에서 색인을 다시 만듭니다.
+    """
+    fingerprint, index = _read_url_index(_url_index_path(result_filename))
+    if index is None or fingerprint != previous_fingerprint:
+        index = UrlIndex(url_hash(url) for url in _scan_existing_links(result_filename))
+    else:
+        index.update(article['url'] for article in new_articles if 'url' in article)
+    write_url_index(result_filename, index)
+
+
+# 공통 기능 14: 날짜 그룹 스트리밍 읽기 -> crawler_store.py
+
+
+# 공통 기능 15: 보관(archive) 계층
+# 최근 HOT_RETENTION_DAYS일만 news_json/<소스>.json에 남기고, 그 이전 날짜 그룹은
+# news_json/archive/<소스>/<YYYY-MM>.jsonl.gz (한 줄에 그룹 하나)로 옮깁니다.
+# 중복 검사는 보관 파일 대신 news_json/archive/<소스>/urls.idx(64비트 해시 배열)만 읽습니다.
+# 색인의 지문은 보관 파일들의 크기이므로, 보관 파일에 추가한 뒤 색인을 쓰기 전에 중단됐으면
+# 다음에 읽을 때 보관 파일에서 색인을 다시 만듭니다.
+
+def _archive_dir(result_filename):
+    source = os.path.splitext(os.path.basename(result_filename))[0]
+    return os.path.join(os.path.dirname(result_filename), 'archive', source)
+
+def iter_archived_groups(result_filename):
+    """보관 파일의 날짜 그룹을 월 순서대로 돌려줍니다."""
+    archive_dir = _archive_dir(result_filename)
+    if not os.path.isdir(archive_dir):
+        return
+    for name in sorted(os.listdir(archive_dir)):
+        if not name.endswith('.jsonl.gz'):
+            continue
+        with gzip.open(os.path.join(archive_dir, name), 'rt', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+def _archive_fingerprint(archive_dir):
+    names = sorted(name for name in os.listdir(archive_dir) if name.endswith('.jsonl.gz'))
+    return ','.join(f"{name}:{os.path.getsize(os.path.join(archive_dir, name))}" for name in names)
+
+def load_archive_index(result_filename):
+    """보관 URL 색인을 읽습니다. 색인이 없거나 보관 파일과 맞지 않으면 보관 파일에서 다시 만듭니다."""
+    archive_dir = _archive_dir(result_filename)
+    if not os.path.isdir(archive_dir):
+        return None
+    index_path = os.path.join(archive_dir, 'urls.idx')
+    fingerprint, index = _read_url_index(index_path)
+    current = _archive_fingerprint(archive_dir)
+    if index is None or fingerprint != current:
+        index = UrlIndex(url_hash(article['url'])
+                         for group in iter_archived_groups(result_filename)
+                         for article in group.get('articles', []) if 'url' in article)
+        _write_url_index_file(index_path, index, current)
+    return index
+
+def archive_old_groups(result_filename, hot_days=None):
+    """
+    hot_days일보다 오래된 날짜 그룹을 월별 gzip JSON Lines 보관 파일로 옮기고,
+    원본 JSON에는 최근 그룹만 남깁니다. 옮긴 그룹 수를 반환합니다.
+    보관 파일에 먼저 쓰고 원본을 나중에 바꾸므로, 중간에 중단돼도 기사가 사라지지 않습니다.
+    이미 보관 색인에 있는 기사(지난 실행이 보관한 뒤 원본을 바꾸기 전에 중단된 경우)는 다시 보관하지 않습니다.
+    """
+    if hot_days is None:
+        hot_days = crawler_config.HOT_RETENTION_DAYS
+    cutoff = (datetime.now() - timedelta(days=hot_days)).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    hot_groups, old_groups = [], []
+    for group in iter_date_groups(result_filename):
+        group_day = parse_group_date(group.get('date', ''))
+        (old_groups if group_day is not None and group_day < cutoff else hot_groups).append(group)
+    if not old_groups:
+        return 0
+
+    archive_dir = _archive_dir(result_filename)
+    os.makedirs(archive_dir, exist_ok=True)
+    index = load_archive_index(result_filename)
+    by_month = {}
+    for group in old_groups:
+        articles = group.get('articles', [])
+        pending = [article for article in articles if 'url' not in article or article['url'] not in index]
+        if articles and not pending:
+            continue  # 이미 보관된 그룹
+        by_month.setdefault(parse_group_date(group['date']).strftime('%Y-%m'), []).append(dict(group, articles=pending))
+    for month, groups in sorted(by_month.items()):
+        # gzip은 여러 멤버를 이어 붙여도 하나의 스트림으로 읽히므로 텍스트 추가 모드('at')로 씁니다.
+        with gzip.open(os.path.join(archive_dir, f"{month}.jsonl.gz"), 'at', encoding='utf-8') as f:
+            for group in groups:
+                f.write(json.dumps(group, ensure_ascii=False) + '\n')
+
+    index.update(article['url'] for groups in by_month.values() for group in groups
+                 for article in group['articles'] if 'url' in article)
+    _write_url_index_file(os.path.join(archive_dir, 'urls.idx'), index, _archive_fingerprint(archive_dir))
+
+    write_json_atomic(result_filename, hot_groups, indent=2)
+    print(f"{result_filename}: {len(old_groups)}개 날짜 그룹을 {archive_dir}로 보관, "
+          f"{len(hot_groups)}개 그룹 유지")
+    return len(old_groups)
+
+
+# 공통 기능 16: HTML 파서 선택 (crawler_config.HTML_PARSER)
+_html_parser = None
+
+def get_html_parser():
+    """설정된 BeautifulSoup 트리 빌더 이름을 반환합니다. lxml이 없으면 html.parser로 대체합니다."""
+    global _html_parser
+    if _html_parser is None:
+        parser = crawler_config.HTML_PARSER
+        if parser == 'lxml':
+            if importlib.util.find_spec('lxml') is None:
+                print("lxml이 설치되어 있지 않아 html.parser를 사용합니다.")
+                parser = 'html.parser'
+        _html_parser = parser
+    return _html_parser
+
+def parse_html(markup, parse_only=None):
+    """
+    목록/상세 페이지 HTML을 파싱합니다. 모든 크롤러는 BeautifulSoup을 직접 만들지 않고
+    이 함수를 사용하므로, 파서는 crawler_config.HTML_PARSER 한 곳에서 바꿀 수 있습니다.
+    parse_only에 bs4.SoupStrainer를 넘기면 필요한 태그만 트리로 만듭니다.
+    """
+    from bs4 import BeautifulSoup
+
+    with get_metrics().timer('parse'):
+        return BeautifulSoup(markup, get_html_parser(), parse_only=parse_only)
+
+
+# 공통 기능 17: 상세 페이지 부분 다운로드 (필요한 요소를 찾으면 연결 종료)
+# 복합 선택자의 한 부분: 태그, .클래스, #아이디, [속성], [속성(=|*=|^=|$=|~=||=)값]
+_SELECTOR_PART_RE = re.compile(
+    r'(?P<tag>[\w-]+|\*)|\.(?P<cls>[\w-]+)|#(?P<id>[\w-]+)'
+    r'|\[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[*^$~|]?=)\s*'
+    r'(?:"(?P<dq>[^"]*)"|\'(?P<sq>[^\']*)\'|(?P<bare>[^\]\s]+))\s*)?\]')
+_COMBINATOR_RE = re.compile(r'\s*[>+~]\s*|\s+')
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.I)
+
+class PartialFetchStats:
+    """
+    호스트별로 읽은 바이트, 조기 종료 횟수, 필드를 찾기까지 걸린 시간을 모읍니다.
+    bytes와 full_bytes는 모두 전송된(gzip이면 압축된) 바이트 기준입니다. full_bytes는 Content-Length이며,
+    헤더가 없으면 실제로 읽은 바이트로 셉니다.
+    """
+
+    def __init__(self):
+        self.hosts = {}
+        self._lock = threading.Lock()
+
+    def record(self, host, bytes_read, full_size, stopped_early, elapsed):
+        with self._lock:
+            entry = self.hosts.setdefault(host, {'pages': 0, 'bytes': 0, 'full_bytes': 0,
+                                                 'early': 0, 'seconds': 0.0})
+            entry['pages'] += 1
+            entry['bytes'] += bytes_read
+            entry['full_bytes'] += full_size or bytes_read
+            entry['early'] += 1 if stopped_early else 0
+            entry['seconds'] += elapsed
+
+    def report(self):
+        with self._lock:
+            hosts = dict(self.hosts)
+        for host, e in sorted(hosts.items()):
+            print(f"부분 다운로드 [{host}]: {e['pages']}페이지, {e['bytes'] / 1024:.0f}KB / {e['full_bytes'] / 1024:.0f}KB 수신 "
+                  f"(페이지당 {e['bytes'] / e['pages'] / 1024:.1f}KB), 조기 종료 {e['early']}회, "
+                  f"필드까지 평균 {e['seconds'] / e['pages'] * 1000:.0f}ms")
+
+
+_partial_stats = None
+
+def _get_partial_stats():
+    global _partial_stats
+    if _partial_stats is None:
+        with _session_lock:
+            if _partial_stats is None:
+                _partial_stats = PartialFetchStats()
+                atexit.register(_partial_stats.report)
+    return _partial_stats
+
+def _subject_parts(selector):
+    """
+    선택자의 대안(쉼표)마다 마지막 복합 선택자(= 실제로 고르는 요소)의 조건 목록을 반환합니다.
+    'div.a > p.b, img#c' -> [[p, .b], [img, #c]]. :not() 같은 의사 클래스가 있어
+    해석할 수 없는 대안은 None(모든 요소가 후보)으로 둡니다.
+    """
+    subjects = []
+    for alternative in selector.split(','):
+        alternative = alternative.strip()
+        parts, pos = [], 0
+        while pos < len(alternative):
+            match = _SELECTOR_PART_RE.match(alternative, pos)
+            if match:
+                parts.append(match)
+            else:
+                match = _COMBINATOR_RE.match(alternative, pos)
+                if not match or not parts:
+                    parts = None
+                    break
+                parts = []  # 조상 조건은 건너뛰고 마지막 복합 선택자만 남깁니다.
+            pos = match.end()
+        subjects.append(parts or None)
+    return subjects
+
+def _part_matches(element, part):
+    if part['tag']:
+        return part['tag'] == '*' or part['tag'].lower() == element.tag.lower()
+    if part['cls']:
+        return part['cls'] in element.get('class', '').split()
+    if part['id']:
+        return element.get('id') == part['id']
+    value = element.get(part['attr'])
+    if value is None or not part['op']:
+        return value is not None
+    expected = next(v for v in (part['dq'], part['sq'], part['bare']) if v is not None)
+    op = part['op']
+    if op == '*=':
+        return expected in value
+    if op == '^=':
+        return value.startswith(expected)
+    if op == '$=':
+        return value.endswith(expected)
+    if op == '~=':
+        return expected in value.split()
+    if op == '|=':
+        return value == expected or value.startswith(expected + '-')
+    return value == expected
+
+def _may_match(element, subjects):
+    """닫힌 lxml 요소가 선택자의 대상 요소일 수 있으면 True (조상 조건은 보지 않으므로 후보일 뿐)"""
+    if not isinstance(element.tag, str):  # 주석, 처리 명령
+        return False
+    return any(parts is None or all(_part_matches(element, part) for part in parts) for parts in subjects)
+
+def _is_complete(element):
+    """요소 뒤에 다른 노드가 파싱되었으면 (= 닫는 태그까지 받았으면) True"""
+    last = element
+    while getattr(last, 'contents', None):
+        last = last.contents[-1]
+    return last.next_element is not None
+
+def _partial_encoding(response, data, encoding):
+    if encoding:
+        return encoding
+    if response.encoding:
+        return response.encoding
+    match = _META_CHARSET_RE.search(data[:4096])
+    return match.group(1).decode('ascii') if match else 'utf-8'
+
+def fetch_partial(url, selectors, encoding=None, timeout=None, **kwargs):
+    """
+    상세 페이지를 스트리밍으로 받으면서, selectors의 모든 CSS 선택자에 해당하는 요소를
+    (닫는 태그까지) 찾으면 나머지 본문을 받지 않고 연결을 닫습니다.
+    찾은 시점까지의 HTML을 parse_html로 파싱한 BeautifulSoup 객체를 반환합니다.
+
+    받은 청크는 lxml의 증분 파서(HTMLPullParser)에 이어서 넣고, 닫힌 요소가 선택자의
+    대상 요소 조건(태그/클래스/ID/속성)에 맞을 때만 BeautifulSoup으로 한 번 파싱해 확인하므로
+    청크마다 전체 버퍼를 다시 디코딩/파싱하지 않습니다. lxml이 없으면 끝까지 받아서 파싱합니다.
+
+    select_one의 첫 번째 결과는 문서 앞부분부터 결정되므로, 선택자에 맞는 요소가
+    완성된 뒤에 멈춰도 전체 페이지를 파싱한 결과와 같습니다. 선택자 중 하나라도
+    페이지에 없으면 끝까지 받게 되므로, 대체(fallback) 선택자는 넣지 않는 것이 좋습니다.
+    encoding을 주면 (예: SkyDaily의 'euc-kr') 응답 헤더 대신 그 인코딩으로 디코딩합니다.
+    """
+    if not crawler_config.PARTIAL_FETCH_ENABLED:
+        response = fetch(url, timeout=timeout, **kwargs)
+        if encoding:
+            response.encoding = encoding
+        return parse_html(response.text)
+
+    import codecs
+    import requests
+    try:
+        from lxml import etree
+    except ImportError:
+        etree = None
+
+    host = urlparse(url).netloc
+    session = _reserve_request(url, polite=False)
+    metrics = get_metrics()
+    start = time.monotonic()
+    try:
+        response = session.get(replay_url(url), timeout=timeout or crawler_config.HTTP_TIMEOUT, stream=True, **kwargs)
+    except requests.RequestException:
+        metrics.record_fetch(host, time.monotonic() - start, 0, failed=True)
+        raise
+    try:
+        if response.status_code >= 400:
+            metrics.record_fetch(host, time.monotonic() - start, 0, failed=True)
+            response.raise_for_status()
+        subjects = [_subject_parts(selector) for selector in selectors]
+        seen = [False] * len(selectors)
+        data = bytearray()
+        charset = decoder = None
+        parser = etree.HTMLPullParser(events=('end',)) if etree is not None else None
+        soup = checked = None
+        stopped_early = False
+        for chunk in response.iter_content(chunk_size=crawler_config.PARTIAL_FETCH_CHUNK_SIZE):
+            data.extend(chunk)
+            if parser is None:
+                continue
+            if decoder is None:
+                # <meta charset>를 찾을 만큼 받을 때까지는 디코딩을 미룹니다.
+                if not (encoding or response.encoding) and len(data) < 4096:
+                    continue
+                charset = _partial_encoding(response, data, encoding)
+                decoder = codecs.getincrementaldecoder(charset)(errors='ignore')
+                chunk = data
+            parser.feed(decoder.decode(bytes(chunk)))
+            candidate = False
+            for _, element in parser.read_events():
+                for i, alternatives in enumerate(subjects):
+                    if _may_match(element, alternatives):
+                        seen[i] = candidate = True
+            # 모든 선택자의 후보 요소가 닫혔을 때만 BeautifulSoup으로 확인합니다.
+            if not (candidate and all(seen)):
+                continue
+            soup = parse_html(bytes(data).decode(charset, errors='ignore'))
+            found = [soup.select_one(selector) for selector in selectors]
+            if all(element is not None and _is_complete(element) for element in found):
+                stopped_early = True
+                break
+            checked = len(data)
+        # 마지막 청크에서 확인한 soup은 전체 문서이므로 다시 파싱하지 않습니다.
+        if not stopped_early and checked != len(data):
+            soup = parse_html(bytes(data).decode(charset or _partial_encoding(response, data, encoding),
+                                                 errors='replace'))
+        # Content-Length는 전송 크기(gzip이면 압축된 크기)이므로, 읽은 양도 압축 해제 전 크기로 비교합니다.
+        full_size = int(response.headers.get('Content-Length') or 0)
+        wire_read = response.raw.tell() if hasattr(response.raw, 'tell') else len(data)
+        _get_partial_stats().record(host, wire_read, full_size, stopped_early, time.monotonic() - start)
+        metrics.record_fetch(host, time.monotonic() - start, len(data))
+        if stopped_early:
+            metrics.count('partial_early_stops')
+        return soup
+    finally:
+        response.close()
+
+
+# 공통 기능 18: 이미 본 URL만 나오면 목록 페이지 넘김 중단
+class PaginationGuard:
+    """
+    페이지 넘김 루프에서 '이 페이지 다음으로 넘어갈 필요가 있는지'를 판단합니다.
+    저장된 기사(get_existing_links)뿐 아니라 관련 없어 저장하지 않은 기사도
+    지난 실행에서 목록에서 봤다면 이미 본 URL로 칩니다. (.crawler_cache/url_index/<소스>.seen.idx)
+    키워드가 바뀌면 관련성 판단이 달라지므로 본 URL 기록은 버립니다.
+
+    사용법:
+        guard = crawler_utils.PaginationGuard(result_filename, processed_links, max_pages=10)
+        for url in urls:
+            guard.start()
+            for page in range(1, 11):
+                ...  # 기사마다 guard.see(article_url, position)
+                if guard.end_page():
+                    break
+        guard.finish()
+    """
+
+    def __init__(self, result_filename, known_links, max_pages=None):
+        self.name = os.path.splitext(os.path.basename(result_filename))[0]
+        self.known_links = known_links
+        self.max_pages = max_pages
+        self.path = _url_index_path(result_filename)[:-len('.idx')] + '.seen.idx'
+        self.fingerprint = _keyword_fingerprint()
+        stored_fingerprint, seen = _read_url_index(self.path)
+        if seen is None or self.fingerprint is None or stored_fingerprint != self.fingerprint:
+            seen = UrlIndex()
+        self.seen = seen
+        self.pages = 0
+        self.stops = 0
+        self.pages_saved = 0
+        self._lock = threading.Lock()
+        self._page_items = []
+        self._page_number = 0
+        self._run = 0
+
+    def start(self):
+        """새 목록(섹션)의 페이지 넘김을 시작합니다."""
+        self._page_number = 0
+        self._run = 0
+
+    def see(self, url, position=0):
+        """목록에서 본 기사 URL을 기록합니다. 스레드에서 호출해도 되며 position은 페이지 안 순서입니다."""
+        known = url in self.known_links or url in self.seen
+        with self._lock:
+            self._page_items.append((position, url, known))
+
+    def end_page(self):
+        """페이지 처리가 끝나면 호출합니다. 다음 페이지로 넘어가지 말아야 하면 True."""
+        with self._lock:
+            items = sorted(self._page_items, key=lambda item: item[0])
+            self._page_items = []
+        self.pages += 1
+        self._page_number += 1
+        for _, url, _ in items:
+            self.seen.add(url)
+        if not crawler_config.PAGINATION_EARLY_STOP or not items:
+            return False
+
+        stop = all(known for _, _, known in items)
+        run_limit = crawler_config.PAGINATION_KNOWN_RUN
+        for _, _, known in items:
+            self._run = self._run + 1 if known else 0
+            if run_limit and self._run >= run_limit:
+                stop = True
+        if stop:
+            self.stops += 1
+            if self.max_pages:
+                self.pages_saved += max(self.max_pages - self._page_number, 0)
+        return stop
+
+    def finish(self):
+        """본 URL 기록을 저장하고, 요청한 페이지 수와 절약한 페이지 수를 출력합니다."""
+        if self.fingerprint is not None:
+            _write_url_index_file(self.path, self.seen, self.fingerprint)
+        saved = f", 최대 페이지 대비 {self.pages_saved}페이지 절약" if self.max_pages else ''
+        print(f"[{self.name}] 목록 {self.pages}페이지 요청, 이미 본 기사만 나와 {self.stops}번 조기 종료{saved}")
+
+
+# 공통 기능 19: 섹션별 적응형 수집 주기
+class SectionScheduler:
+    """
+    목록(섹션) URL마다 '실행당 새 관련 기사 수'를 기록해 다음 수집 예정 시각을 정합니다.
+    새 기사가 없으면 간격을 SCHEDULER_BACKOFF배로 늘리고(최대 SCHEDULER_MAX_INTERVAL_MINUTES),
+    새 기사가 있으면 줄입니다(최소 SCHEDULER_MIN_INTERVAL_MINUTES).
+    상태는 .crawler_cache/schedule/<소스>.json에 저장되며, 키워드가 바뀌면 초기화됩니다.
+
+    사용법:
+        scheduler = crawler_utils.SectionScheduler(result_filename)
+        for url in scheduler.due(urls):
+            articles = scrape_page(url)
+            scheduler.record(url, len(articles))
+        scheduler.finish()
+    """
+
+    def __init__(self, result_filename):
+        self.name = os.path.splitext(os.path.basename(result_filename))[0]
+        self.path = os.path.join(crawler_config.CRAWLER_CACHE_DIR, 'schedule', f"{self.name}.json")
+        state = load_json_file(self.path, {})
+        self.fingerprint = _keyword_fingerprint()
+        if state.get('keywords') != self.fingerprint:
+            state = {}
+        self.sections = state.get('sections', {})
+        self._lock = threading.Lock()
+
+    def due(self, section_urls):
+        """지금 수집할 차례인 섹션 URL만 순서대로 반환합니다. (섹션 샤드 실행이면 이 샤드의 섹션 중에서)"""
+        section_urls = shard_sections(section_urls)
+        if not crawler_config.SCHEDULER_ENABLED:
+            return section_urls
+        now = time.time()
+        due = [url for url in section_urls if self.sections.get(url, {}).get('next_due', 0) <= now]
+        skipped = len(section_urls) - len(due)
+        if skipped:
+            print(f"[{self.name}] 섹션 {len(section_urls)}개 중 {len(due)}개 수집 "
+                  f"({skipped}개는 다음 예정 시각 전이라 건너뜀)")
+        return due
+
+    def record(self, section_url, new_articles):
+        """섹션을 한 번 수집한 결과(새 관련 기사 수)로 다음 예정 시각을 정합니다."""
+        min_interval = crawler_config.SCHEDULER_MIN_INTERVAL_MINUTES
+        max_interval = crawler_config.SCHEDULER_MAX_INTERVAL_MINUTES
+        with self._lock:
+            entry = self.sections.setdefault(section_url, {'interval': min_interval, 'fetches': 0, 'articles': 0})
+            if new_articles >= crawler_config.SCHEDULER_BUSY_ARTICLES:
+                interval = min_interval
+            elif new_articles > 0:
+                interval = max(entry['interval'] / crawler_config.SCHEDULER_BACKOFF, min_interval)
+            else:
+                interval = min(entry['interval'] * crawler_config.SCHEDULER_BACKOFF, max_interval)
+            entry['interval'] = interval
+            entry['fetches'] += 1
+            entry['articles'] += new_articles
+            entry['last_yield'] = new_articles
+            entry['next_due'] = time.time() + (interval - crawler_config.SCHEDULER_SLACK_MINUTES) * 60
+
+    def finish(self):
+        """상태를 저장합니다."""
+        try:
+            write_json_atomic(self.path, {'keywords': self.fingerprint, 'sections': self.sections}, indent=2)
+        except OSError as e:
+            print(f"수집 주기 저장 실패 ({self.path}): {e}")
+
+
+# 공통 기능 20: 유사 기사(near-duplicate) 색인 -> crawler_store.py
+
+
+# 공통 기능 21: 실행 전체가 함께 쓰는 작업 스레드 풀과 상세 요청 파이프라인
+_worker_pool = None
+_worker_pool_lock = threading.Lock()
+
+
+def get_worker_pool():
+    """
+    프로세스 전체가 함께 쓰는 ThreadPoolExecutor (crawler_config.WORKER_POOL_SIZE)를 반환합니다.
+    페이지마다 풀을 새로 만들지 않고, run_all로 여러 크롤러를 동시에 실행해도 전체 스레드 수가 고정됩니다.
+    호스트별 동시 요청 수는 fetch의 커넥션 풀(HTTP_POOL_MAXSIZE, pool_block=True)이 제한합니다.
+    """
+    global _worker_pool
+    if _worker_pool is None:
+        with _worker_pool_lock:
+            if _worker_pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+                _worker_pool = ThreadPoolExecutor(max_workers=crawler_config.WORKER_POOL_SIZE,
+                                                  thread_name_prefix='crawler-worker')
+    return _worker_pool
+
+
+class DetailPipeline:
+    """
+    목록 페이지는 호출한 스레드에서 순서대로 처리하고, 상세 페이지 요청은 공유 풀에 넘겨
+    다음 목록 페이지를 받는 동안 앞 페이지의 상세 요청이 계속 진행되도록 합니다.
+    (풀 작업 안에서 다시 풀에 작업을 넣고 기다리면 안 됩니다)
+
+    사용법:
+        pipeline = crawler_utils.DetailPipeline()
+        for page in ...:
+            for element in elements:
+                candidate = process_article(element)        # 목록에서 알 수 있는 정보만
+                if candidate:
+                    pipeline.submit(complete_article, candidate)  # 상세 요청은 풀에서
+        articles = pipeline.drain()                         # 제출 순서대로, None과 예외는 제외
+    """
+
+    def __init__(self, name=''):
+        self.name = name
+        self._futures = []
+
+    def submit(self, func, *args):
+        # 풀 스레드에서도 같은 지표 소스(set_metrics_source)로 기록되도록 컨텍스트를 넘깁니다.
+        future = get_worker_pool().submit(contextvars.copy_context().run, func, *args)
+        self._futures.append(future)
+        return future
+
+    def __len__(self):
+        return len(self._futures)
+
+    def drain(self):
+        """지금까지 제출한 작업을 모두 기다려 결과 목록을 반환하고 비웁니다."""
+        futures, self._futures = self._futures, []
+        results = []
+        for future in futures:
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"[{self.name}] 상세 처리 실패: {e}")
+                continue
+            if result:
+                results.append(result)
+        return results
+
+
+# 공통 기능 22: 스레드 안전한 URL/제목 예약 (중복 상세 요청 방지)
+class ClaimSet:
+    """
+    '이미 처리했는지 확인'과 '처리 중으로 표시'를 한 번에(잠금 안에서) 하는 집합입니다.
+    claim()이 True를 돌려준 스레드만 상세 페이지를 요청하므로, 같은 기사를 두 스레드가
+    동시에 요청하고 저장하는 일이 생기지 않습니다. `in`, `add`, `len`을 지원해
+    기존의 processed_links/processed_titles 자리에 그대로 쓸 수 있습니다.
+
+    known에는 get_existing_links()의 결과처럼 이미 저장된 항목의 집합을 넘깁니다.
+    이번 실행에서 예약된 항목을 다시 claim하면 '막은 중복 요청'으로 세어 종료 시 출력합니다.
+
+    사용법:
+        processed_links = crawler_utils.ClaimSet(crawler_utils.get_existing_links(result_filename), 'Nate')
+        if not processed_links.claim(url):
+            return None
+        summary = get_summary(url)   # 이 URL을 요청하는 스레드는 하나뿐
+    """
+
+    def __init__(self, known=None, name=''):
+        self.known = known if known is not None else set()
+        self.name = name
+        self.claimed = set()
+        self.redundant = 0   # 이번 실행에서 이미 예약된 항목을 다시 요청하려던 횟수
+        self.existing = 0    # 이미 저장된 항목이라 건너뛴 횟수
+        self._lock = threading.Lock()
+        _register_claim_set(self)
+
+    def claim(self, key):
+        """key를 아직 아무도 처리하지 않았으면 예약하고 True, 아니면 False를 반환합니다."""
+        with self._lock:
+            if key in self.claimed:
+                self.redundant += 1
+                get_metrics().count('dedup_hits')
+                return False
+            if key in self.known:
+                self.existing += 1
+                get_metrics().count('known_skips')
+                return False
+            self.claimed.add(key)
+            return True
+
+    def add(self, key):
+        with self._lock:
+            self.claimed.add(key)
+
+    def __contains__(self, key):
+        return key in self.claimed or key in self.known
+
+    def __len__(self):
+        return len(self.known) + len(self.claimed)
+
+    def report(self):
+        if self.redundant or self.claimed:
+            print(f"[{self.name}] 예약 {len(self.claimed)}건, 이미 저장된 항목 {self.existing}회 건너뜀, "
+                  f"중복 상세 요청 {self.redundant}회 방지")
+
+
+_claim_sets = []
+
+def _register_claim_set(claim_set):
+    with _session_lock:
+        if not _claim_sets:
+            atexit.register(lambda: [s.report() for s in list(_claim_sets)])
+        _claim_sets.append(claim_set)
+
+
+# 공통 기능 23: 실행 지표 (단계별 시간, 호스트별 요청, 카운터)
+# 실행이 끝나면 한 줄짜리 JSON 기록을 crawler_config.METRICS_FILE에 추가합니다.
+# 단계/카운터는 '소스'(크롤러 모듈 이름)별로 모읍니다. run_all은 크롤러마다 set_metrics_source로
+# 소스를 정하고, 단독 실행(python Daum_crawler.py)이면 실행한 스크립트 이름을 씁니다.
+_metrics_source = contextvars.ContextVar('crawler_metrics_source', default=None)
+_process_started = (datetime.now(), time.perf_counter())  # crawler_utils 임포트 시각 ~ 프로세스 시작
+
+
+def set_metrics_source(name):
+    """이 스레드(와 여기서 시작한 작업)의 지표를 name 소스로 기록합니다."""
+    _metrics_source.set(name)
+
+
+class RunMetrics:
+    """
+    stages  : 소스 -> 단계 -> [횟수, 누적 초]  (fetch, polite_wait, parse, relevance, detail, save ...)
+    counters: 소스 -> 이름 -> 값               (detail_fetches, detail_cache_hits, dedup_hits ...)
+    hosts   : 호스트 -> 요청 수, 누적 초, 받은 바이트, 실패 수
+    누적 초는 스레드별 시간을 더한 값이므로 동시에 진행된 요청은 합산되고, 단계는 겹칠 수 있습니다.
+    (detail에는 그 안의 fetch/parse 시간이 포함됨)
+    """
+
+    def __init__(self):
+        self.started, self._start = _process_started
+        self.stages = {}
+        self.counters = {}
+        self.hosts = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def current_source():
+        source = _metrics_source.get()
+        if source is None:
+            source = os.path.splitext(os.path.basename(sys.argv[0] or ''))[0] or 'python'
+        return source
+
+    def add_time(self, stage, seconds, source=None):
+        source = source or self.current_source()
+        with self._lock:
+            entry = self.stages.setdefault(source, {}).setdefault(stage, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+
+    def count(self, name, n=1, source=None):
+        source = source or self.current_source()
+        with self._lock:
+            counters = self.counters.setdefault(source, {})
+            counters[name] = counters.get(name, 0) + n
+
+    def record_fetch(self, host, seconds, nbytes, failed=False):
+        with self._lock:
+            entry = self.hosts.setdefault(host, {'requests': 0, 'seconds': 0.0, 'bytes': 0, 'errors': 0})
+            entry['requests'] += 1
+            entry['seconds'] += seconds
+            entry['bytes'] += nbytes
+            entry['errors'] += 1 if failed else 0
+        self.add_time('fetch', seconds)
+        self.count('bytes_downloaded', nbytes)
+
+    @contextlib.contextmanager
+    def timer(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - start)
+
+    def to_record(self):
+        with self._lock:
+            sources = sorted(set(self.stages) | set(self.counters))
+            return {
+                'started': self.started.isoformat(timespec='seconds'),
+                'entry': os.path.basename(sys.argv[0] or ''),
+                'wall_seconds': round(time.perf_counter() - self._start, 3),
+                'requests': _request_count,
+                'sources': {
+                    source: {
+                        'stages': {stage: {'count': count, 'seconds': round(seconds, 4)}
+                                   for stage, (count, seconds) in sorted(self.stages.get(source, {}).items())},
+                        'counters': dict(sorted(self.counters.get(source, {}).items())),
+                    }
+                    for source in sources
+                },
+                'hosts': {host: dict(entry, seconds=round(entry['seconds'], 4))
+                          for host, entry in sorted(self.hosts.items())},
+            }
+
+    def write(self):
+        """이번 실행의 기록을 METRICS_FILE에 한 줄로 추가합니다. 파일이 너무 크면 오래된 기록부터 버립니다."""
+        path = crawler_config.METRICS_FILE
+        record = self.to_record()
+        if not record['sources'] and not record['hosts']:
+            return  # 크롤링 없이 끝난 실행 (스크립트의 도움말 출력 등)
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            if os.path.getsize(path) > crawler_config.METRICS_MAX_BYTES:
+                with open(path, 'r', encoding='utf-8') as f:
+                    lines = f.readlines()
+                with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+                    f.writelines(lines[len(lines) // 2:])
+                os.replace(f"{path}.tmp", path)
+        except OSError as e:
+            print(f"실행 지표 저장 실패 ({path}): {e}")
+            return
+        print(f"실행 지표: {record['wall_seconds']:.1f}s, 요청 {record['requests']}회 -> {path}")
+
+
+_metrics = None
+
+def get_metrics():
+    """이번 실행의 RunMetrics (처음 호출할 때 만들고, 종료 시 기록하도록 등록)"""
+    global _metrics
+    if _metrics is None:
+        with _session_lock:
+            if _metrics is None:
+                _metrics = RunMetrics()
+                if crawler_config.METRICS_ENABLED:
+                    atexit.register(_metrics.write)
+    return _metrics
+
+
+# 공통 기능 24: 샤드 실행 (crawler_config.SHARD = 'i/N')
+# 샤드마다 결과를 SHARD_OUTPUT_DIR/shard-<i>/에 따로 쓰므로 러너들이 news_json을 두고 다투지 않고,
+# scripts/merge_shards.py가 모든 샤드의 결과를 소스별 JSON에 합칩니다.
+def parse_shard(text):
+    """'1/4' -> (1, 4). 빈 문자열이면 None, 형식이 틀리면 ValueError."""
+    if not text:
+        return None
+    index, _, count = text.partition('/')
+    index, count = int(index), int(count)
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"샤드는 'i/N' (0 <= i < N) 형식이어야 합니다: {text}")
+    return index, count
+
+def get_shard():
+    """이 실행의 (샤드 번호, 샤드 수). 샤드 실행이 아니면 None."""
+    return parse_shard(crawler_config.SHARD)
+
+def shard_items(items, shard=None):
+    """순서가 정해진 목록(크롤러 이름 등)을 샤드끼리 겹치지 않게 나눠 이 샤드의 몫만 반환합니다."""
+    shard = shard or get_shard()
+    items = list(items)
+    if shard is None:
+        return items
+    index, count = shard
+    return items[index::count]
+
+def shard_sections(section_urls, shard=None):
+    """
+    CRAWLER_SHARD_BY='section'이면 섹션 URL을 URL 해시(crc32)로 나눠 이 샤드의 몫만 반환합니다.
+    URL 목록에 섹션이 추가되거나 빠져도 다른 섹션의 샤드는 바뀌지 않습니다.
+    """
+    shard = shard or get_shard()
+    section_urls = list(section_urls)
+    if shard is None or crawler_config.SHARD_BY != 'section':
+        return section_urls
+    index, count = shard
+    return [url for url in section_urls if zlib.crc32(url.encode('utf-8')) % count == index]
+
+def shard_output_path(result_filename, shard=None):
+    """news_json/daum_News.json -> shards/shard-<i>/daum_News.json (로그는 shards/shard-<i>/log/daum_News/)"""
+    index, _ = shard or get_shard()
+    return os.path.join(crawler_config.SHARD_OUTPUT_DIR, f"shard-{index}", os.path.basename(result_filename))
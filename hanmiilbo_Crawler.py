@@ -1,18 +1,15 @@
 # hanmiilbo_Crawler.py
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
-import json
+from datetime import timedelta
 import os
-import re
-import time
 import crawler_utils # 👈 공통 유틸리티 임포트
+import crawler_time  # 👈 공통 시각 파싱
 
 # --- ⬇️ 공통 코드 ⬇️ ---
 NEWS_JSON_DIR = 'news_json'
 result_filename = os.path.join(NEWS_JSON_DIR, 'hanmiilbo_News.json') # 👈 고유값
 
-keywords, exclude_keywords = crawler_utils.load_keywords()
+# 키워드는 임포트 시점이 아니라 main()에서 로드합니다. (cold start 단축)
+keywords, exclude_keywords = [], []
 today = crawler_utils.get_today_string()
 
 # --- ⬇️ 고유 로직 ⬇️ ---
@@ -27,24 +24,26 @@ urls = [
 
 processed_links = set()
 processed_titles = set()
+pagination_guard = None  # main()에서 생성 (이미 본 기사만 나오면 페이지 넘김 중단)
 
 def is_within_two_days(article_date_str):
     """기사 날짜가 현재로부터 2일 이내인지 확인"""
-    try:
-        article_date = datetime.strptime(article_date_str, "%Y-%m-%d")
-        two_days_ago = datetime.now() - timedelta(days=2)
-        two_days_ago = two_days_ago.replace(hour=0, minute=0, second=0, microsecond=0)
-        return article_date >= two_days_ago
-    except ValueError as e:
-        print(f"날짜 파싱 오류: {article_date_str}, {e}")
+    article_date = crawler_time.parse(article_date_str, ["%Y-%m-%d"])
+    if article_date is None:
+        print(f"날짜 파싱 오류: {article_date_str}")
         return False
+    two_days_ago = crawler_time.now() - timedelta(days=2)
+    two_days_ago = two_days_ago.replace(hour=0, minute=0, second=0, microsecond=0)
+    return article_date >= two_days_ago
 
+@crawler_utils.cached_details
 def extract_article_details(url):
     """개별 기사 페이지에서 상세 정보 추출"""
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # 요약이 본문 전체 텍스트의 앞부분이라 본문 컨테이너가 닫힐 때까지 받아야 하므로
+        # 부분 다운로드(fetch_partial)로는 아낄 것이 없습니다.
+        response = crawler_utils.fetch(url)
+        soup = crawler_utils.parse_html(response.text)
         
         img_element = soup.select_one('.article_body img, .view_body img, .content img')
         img_url = img_element.get('src', '') if img_element else ''
@@ -74,9 +73,11 @@ def scrape_page(url, page_num=1):
         else:
             page_url = url
             
-        response = requests.get(page_url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = crawler_utils.fetch_listing(page_url)
+        if response is None:
+            print(f"변경 없음, 건너뜀: {page_url}")
+            return articles, True # Stop
+        soup = crawler_utils.parse_html(response.text)
         
         basic_list = soup.select_one('div.basicList')
         if not basic_list:
@@ -91,7 +92,7 @@ def scrape_page(url, page_num=1):
 
         found_old_articles = False
         
-        for element in article_elements:
+        for position, element in enumerate(article_elements):
             title_element = element.select_one('dt.title a')
             if not title_element:
                 continue
@@ -107,6 +108,8 @@ def scrape_page(url, page_num=1):
                 full_link = f"https://hanmiilbo.kr/{href}"
             else:
                 full_link = href
+            if pagination_guard:
+                pagination_guard.see(full_link, position)
             
             date_element = element.select_one('dd.registDate')
             if not date_element:
@@ -122,17 +125,11 @@ def scrape_page(url, page_num=1):
             # 👈 공통 유틸리티 함수 사용
             is_relevant = crawler_utils.is_relevant(title, keywords, exclude_keywords)
             
-            if full_link not in processed_links and text_content not in processed_titles and is_relevant:
+            # 링크와 제목을 예약한 경우에만 상세 페이지 요청 (같은 기사를 두 번 요청하지 않음)
+            if is_relevant and processed_links.claim(full_link) and processed_titles.claim(title):
                 img_url, summary = extract_article_details(full_link)
                 
-                try:
-                    dt = datetime.strptime(article_date, "%Y-%m-%d")
-                    published_time = dt.isoformat()
-                except ValueError:
-                    published_time = article_date
-                
-                processed_links.add(full_link)
-                processed_titles.add(title)
+                published_time = crawler_time.parse_iso(article_date, ["%Y-%m-%d"]) or article_date
                 
                 article_data = {
                     'title': title,
@@ -150,29 +147,39 @@ def scrape_page(url, page_num=1):
             
     except Exception as e:
         print(f"페이지 처리 실패 ({url}, page {page_num}): {e}")
+        crawler_utils.discard_listing(page_url)  # 다음 실행에서 이 목록 페이지를 다시 처리
         return [], True # Stop on error
 
 # --- ⬇️ main 함수 (공통 유틸리티를 사용하도록 수정) ⬇️ ---
 def main():
-    global processed_links, processed_titles
+    global keywords, exclude_keywords, processed_links, processed_titles, pagination_guard
+    keywords, exclude_keywords = crawler_utils.load_keywords()
     
     #crawler_utils.ensure_file_exists(result_filename)
-    processed_links = crawler_utils.get_existing_links(result_filename)
+    processed_links = crawler_utils.ClaimSet(crawler_utils.get_existing_links(result_filename), 'hanmiilbo')
+    processed_titles = crawler_utils.ClaimSet(name='hanmiilbo 제목')
+    pagination_guard = crawler_utils.PaginationGuard(result_filename, processed_links, max_pages=10)
     
     all_articles = []
     
-    for url in urls:
+    scheduler = crawler_utils.SectionScheduler(result_filename)
+    for url in scheduler.due(urls): # 수집 예정 시각이 된 섹션만
+        pagination_guard.start()
+        section_count = len(all_articles)
         page_num = 1
         while True:
             articles, stop = scrape_page(url, page_num)
             all_articles.extend(articles)
+            stop = pagination_guard.end_page() or stop # 이미 본 기사만 나온 페이지면 중지
             
             if stop or page_num >= 10: # 10페이지 제한 또는 오래된 기사 발견 시 중지
                 print(f"Scraping stopped for {url} at page {page_num}.")
                 break
                 
             page_num += 1
-            time.sleep(2)  # 섹션 간 요청 간격 조절
+        scheduler.record(url, len(all_articles) - section_count)
+    pagination_guard.finish()
+    scheduler.finish()
     
     if all_articles:
         crawler_utils.save_articles_to_json(result_filename, all_articles, today)
@@ -0,0 +1,126 @@
+# run_all.py
+"""
+[통합 실행기]
+모든 사이트 크롤러를 플러그인처럼 임포트해서 하나의 asyncio 이벤트 루프 위에서
+동시에 실행합니다.
+
+- Python 시작, Firebase 초기화, Firestore 키워드 조회는 프로세스당 한 번만 일어납니다.
+- 크롤러 사이의 전역 sleep 대신 crawler_utils.wait_for_host가 호스트별 간격만 지키므로,
+  전체 소요 시간은 '모든 크롤러 시간의 합'이 아니라 '가장 느린 크롤러' 수준이 됩니다.
+
+사용법:
+    python run_all.py                 # 전체 크롤러 실행
+    python run_all.py Naver Daum      # 일부만 실행
+    python run_all.py --shard 0/3     # 3개 러너 중 0번: CRAWLERS 순서로 3개마다 하나씩 실행
+    python run_all.py --shard 0/3 --shard-by section   # 모든 크롤러를 실행하되 섹션 URL을 나눔
+    (샤드 실행의 결과는 shards/shard-<i>/에 쓰이고 scripts/merge_shards.py가 news_json에 합칩니다)
+"""
+import argparse
+import asyncio
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+import time
+import crawler_config
+import crawler_utils
+
+# 플러그인 이름 -> 모듈 이름 (각 모듈은 main() 함수를 제공해야 합니다)
+CRAWLERS = {
+    'Naver': 'Naver_Crawler',
+    'Daum': 'Daum_crawler',
+    'Nate': 'Nate_Crawler',
+    'YNA': 'YNA_Crawler',
+    'Google': 'Google_Crawler',
+    'SkyDaily': 'SkyDaily_Crawler',
+    'VOA': 'VOA_Crawler',
+    'hanmiilbo': 'hanmiilbo_Crawler',
+    'boannews': 'boannews_Crawler',
+    'truthdaily': 'truthdaily_Crawler',
+    'FnNews': 'FnNews_Crawler',
+    'Gukje': 'Gukje_Crawler',
+    'FNToday': 'FNToday_Crawler',
+}
+
+
+def load_plugins(names):
+    """크롤러 모듈을 임포트합니다. 임포트에 실패한 크롤러는 건너뜁니다."""
+    plugins = {}
+    for name in names:
+        try:
+            plugins[name] = importlib.import_module(CRAWLERS[name])
+        except Exception as e:
+            print(f"[{name}] 크롤러 임포트 실패: {e}")
+    return plugins
+
+
+async def run_crawler(name, module):
+    """블로킹 크롤러의 main()을 별도 스레드에서 실행하고 소요 시간을 반환합니다."""
+    start = time.monotonic()
+    # 이 태스크(와 to_thread로 넘긴 컨텍스트)의 지표를 크롤러 모듈 이름으로 기록
+    # (단독 실행 python Daum_crawler.py의 소스 이름과 같음)
+    crawler_utils.set_metrics_source(module.__name__)
+    try:
+        await asyncio.to_thread(module.main)
+        status = 'ok'
+    except Exception as e:
+        print(f"[{name}] 크롤러 실행 실패: {e}")
+        status = 'failed'
+    elapsed = time.monotonic() - start
+    crawler_utils.get_metrics().add_time('total', elapsed)
+    crawler_utils.get_metrics().count('failed', 1 if status == 'failed' else 0)
+    print(f"[{name}] 완료 ({status}, {elapsed:.1f}s)")
+    return name, status, elapsed
+
+
+async def run_all(names=None):
+    names = list(names or CRAWLERS)
+
+    # 1. 키워드는 여기서 한 번만 로드 (각 크롤러의 main()은 캐시된 결과를 사용)
+    crawler_utils.load_keywords()
+
+    # 2. 플러그인 임포트 후 동시에 실행
+    # asyncio.to_thread가 쓰는 기본 실행기는 min(32, CPU 수 + 4) 스레드라 2코어 러너에서는
+    # 크롤러가 6개씩만 돌므로, 크롤러 수만큼 스레드를 가진 실행기로 바꿉니다.
+    plugins = load_plugins(names)
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=max(len(plugins), 1), thread_name_prefix='crawler-main'))
+    start = time.monotonic()
+    results = await asyncio.gather(*(run_crawler(name, module) for name, module in plugins.items()))
+    total = time.monotonic() - start
+
+    print("\n--- 크롤러별 소요 시간 ---")
+    for name, status, elapsed in sorted(results, key=lambda r: r[2], reverse=True):
+        print(f"{name:<12} {status:<7} {elapsed:7.1f}s")
+    print(f"전체 소요 시간: {total:.1f}s (순차 실행 시 약 {sum(r[2] for r in results):.1f}s)")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='모든 뉴스 크롤러를 동시에 실행합니다.')
+    parser.add_argument('crawlers', nargs='*', metavar='CRAWLER',
+                        help=f"실행할 크롤러 이름 (생략 시 전체): {', '.join(CRAWLERS)}")
+    parser.add_argument('--shard', metavar='I/N', default=crawler_config.SHARD,
+                        help='N개 샤드 중 I번째(0부터)만 실행 (기본: CRAWLER_SHARD)')
+    parser.add_argument('--shard-by', choices=('source', 'section'), default=crawler_config.SHARD_BY,
+                        help='크롤러를 나눌지(source), 섹션 URL을 나눌지(section) (기본: CRAWLER_SHARD_BY)')
+    args = parser.parse_args()
+    unknown = [name for name in args.crawlers if name not in CRAWLERS]
+    if unknown:
+        parser.error(f"알 수 없는 크롤러: {', '.join(unknown)}")
+    try:
+        shard = crawler_utils.parse_shard(args.shard)
+    except ValueError as e:
+        parser.error(str(e))
+
+    names = args.crawlers or list(CRAWLERS)
+    if shard is not None:
+        crawler_config.SHARD, crawler_config.SHARD_BY = args.shard, args.shard_by
+        if args.shard_by == 'source':
+            names = crawler_utils.shard_items(names, shard)
+        print(f"샤드 {shard[0]}/{shard[1]} ({args.shard_by}): {', '.join(names) or '실행할 크롤러 없음'}")
+        if not names:
+            return
+    asyncio.run(run_all(names))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# scripts/archive_news.py
+"""
+[보관 정리]
+news_json/<소스>.json에서 HOT_RETENTION_DAYS일보다 오래된 날짜 그룹을
+news_json/archive/<소스>/<YYYY-MM>.jsonl.gz로 옮겨, 매 실행 파싱/저장하는 파일을 작게 유지합니다.
+중복 검사용 URL 해시 색인(news_json/archive/<소스>/urls.idx)도 함께 갱신합니다.
+
+사용법: python scripts/archive_news.py [--days 30]
+"""
+import argparse
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import crawler_config
+import crawler_utils
+
+NEWS_JSON_DIR = 'news_json'
+SKIP_PREFIX = 'ForTwoDay_News.'  # 이틀치 결과 파일과 내보낸 형식 (ForTwoDay_News.min.json 등)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='오래된 날짜 그룹을 월별 압축 보관 파일로 옮깁니다.')
+    parser.add_argument('--days', type=int, default=crawler_config.HOT_RETENTION_DAYS,
+                        help='원본 JSON에 남겨 둘 최근 일수')
+    args = parser.parse_args()
+
+    total = 0
+    for name in sorted(os.listdir(NEWS_JSON_DIR)):
+        if not name.endswith('.json') or name.startswith(SKIP_PREFIX):
+            continue
+        total += crawler_utils.archive_old_groups(os.path.join(NEWS_JSON_DIR, name), hot_days=args.days)
+    print(f"보관 완료: 총 {total}개 날짜 그룹")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# scripts/bench_keyword_matcher.py
+"""
+[마이크로 벤치마크] 키워드 관련성 검사
+
+기존 선형 스캔(`keyword.lower() in text_lower`를 키워드마다 반복)과
+crawler_utils.KeywordMatcher(Aho-Corasick)를
+news_json/ForTwoDay_News.json에 저장된 제목들로 비교합니다.
+
+키워드는 News_keyword.js(운영 키워드 스냅샷)에서 읽습니다.
+사용법: python scripts/bench_keyword_matcher.py [--repeat 5]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import crawler_config
+import crawler_utils
+
+
+def load_keyword_snapshot(path):
+    """News_keyword.js의 `const keyword = {...};` 객체를 읽어 평탄화합니다."""
+    with open(path, 'r', encoding='utf-8') as f:
+        source = f.read()
+    body = source[source.index('{'):source.rindex('}') + 1]
+    data = json.loads(body)
+    keywords = [item for cat in data.get('keywords', []) for item in cat.get('items', [])]
+    exclude_keywords = [item for cat in data.get('exclude_keywords', []) for item in cat.get('items', [])]
+    return keywords, exclude_keywords
+
+
+def load_titles(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [article.get('title', '') for group in data for article in group.get('articles', [])]
+
+
+def linear_is_relevant(text_content, keywords, exclude_keywords):
+    """기존 crawler_utils.is_relevant 구현 (비교 기준)"""
+    if not keywords:
+        return True
+    text_lower = text_content.lower()
+    matching_keywords_count = sum(1 for keyword in keywords if keyword.lower() in text_lower)
+    if matching_keywords_count < crawler_config.MIN_KEYWORDS_REQUIRED:
+        return False
+    exclude_match = any(keyword.lower() in text_lower for keyword in exclude_keywords)
+    if exclude_match:
+        return False
+    return True
+
+
+def best_of(repeat, func):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='키워드 매처 마이크로 벤치마크')
+    parser.add_argument('--keywords', default=os.path.join(ROOT_DIR, 'News_keyword.js'))
+    parser.add_argument('--titles', default=os.path.join(ROOT_DIR, 'news_json', 'ForTwoDay_News.json'))
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    keywords, exclude_keywords = load_keyword_snapshot(args.keywords)
+    titles = load_titles(args.titles)
+    print(f"키워드 {len(keywords)}개, 제외 키워드 {len(exclude_keywords)}개, 제목 {len(titles)}개")
+
+    start = time.perf_counter()
+    matcher = crawler_utils.KeywordMatcher(keywords, exclude_keywords)
+    build_time = time.perf_counter() - start
+
+    linear_time, linear_result = best_of(
+        args.repeat, lambda: [linear_is_relevant(t, keywords, exclude_keywords) for t in titles])
+    matcher_time, matcher_result = best_of(
+        args.repeat, lambda: [matcher.is_relevant(t) for t in titles])
+
+    # MIN_KEYWORDS_REQUIRED > 1이면 중복 키워드를 세지 않는 차이로 결과가 달라질 수 있습니다.
+    mismatches = sum(1 for a, b in zip(linear_result, matcher_result) if a != b)
+
+    per_title = lambda seconds: seconds / max(len(titles), 1) * 1e6
+    print(f"오토마톤 빌드: {build_time * 1000:.1f} ms")
+    print(f"선형 스캔:     {linear_time * 1000:.1f} ms ({per_title(linear_time):.1f} µs/제목)")
+    print(f"Aho-Corasick:  {matcher_time * 1000:.1f} ms ({per_title(matcher_time):.1f} µs/제목)")
+    print(f"속도 향상:     x{linear_time / matcher_time:.1f}")
+    print(f"관련 기사 수: 선형 {sum(linear_result)}, 매처 {sum(matcher_result)}, 불일치 {mismatches}")
+
+
+if __name__ == '__main__':
+    main()
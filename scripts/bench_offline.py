@@ -0,0 +1,245 @@
+# scripts/bench_offline.py
+"""
+[오프라인 벤치마크] 기록된 HTML 픽스처로 크롤러 main() 전체 실행 시간 측정
+
+scripts/record_fixtures.py로 기록한 fixtures/<크롤러>/의 목록/상세 페이지를 로컬 HTTP 서버로
+재생하고, 크롤러마다 main()을 별도 프로세스에서 끝까지 실행해 시간을 잽니다.
+네트워크 없이도 같은 입력으로 반복 측정할 수 있으므로 동시성/캐시 변경 전후를 비교할 때 씁니다.
+
+- 요청 경로: crawler_config.REPLAY_URL(CRAWLER_REPLAY_URL)을 설정하면 crawler_utils.fetch/fetch_partial이
+  https://host/path?query를 <서버>/https/host/path?query로 보냅니다. 호스트별 Session과 지표는 원래 호스트 기준입니다.
+- 응답 선택: URL이 정확히 같은 픽스처 -> 같은 호스트의 목록 URL(페이지 번호만 다른 경우 포함)이면 목록 픽스처
+  -> 같은 호스트의 그 밖의 URL은 상세 픽스처 -> 없으면 404.
+- 지연 주입: 응답마다 --latency 초 (+ 0~--jitter 초 무작위)를 기다린 뒤 보냅니다. 무작위 값은 --seed로 고정됩니다.
+- 호스트 간격: 기본은 crawler_config.HOST_INTERVAL_SCALE=0 (정중한 대기 없이 지연만 측정). --polite면 실제 간격 사용.
+- 실행 환경: 크롤러마다 임시 폴더를 작업 폴더로 써서 저장소의 news_json과 .crawler_cache를 건드리지 않습니다.
+  (--with-existing이면 저장소의 결과 파일을 복사해 두고 '이미 저장된 기사' 경로까지 측정합니다)
+  키워드는 저장소의 .crawler_cache/keyword_snapshot.json을 복사해 Firestore 조회 없이 사용합니다.
+- 단계별 시간: 실행이 남긴 지표(crawler_utils.RunMetrics)에서 fetch(요청), parse(HTML 파싱),
+  relevance(키워드 필터), save(저장)와 detail(상세 처리), polite_wait(호스트 간격 대기)를 읽습니다.
+  상세 처리는 여러 스레드에서 동시에 진행되므로 단계 시간의 합은 전체 시간보다 클 수 있습니다.
+- 픽스처는 저장소에 커밋하지 않습니다. 새로 받은 저장소에서는 record_fixtures.py로 먼저 기록해야 하며,
+  기록된 픽스처가 하나도 없거나 지정한 크롤러의 픽스처가 없으면 오류(종료 코드 2)로 끝납니다.
+
+사용법:
+    python scripts/bench_offline.py                          # 픽스처가 있는 전체 크롤러
+    python scripts/bench_offline.py Daum Nate --latency 0.2 --jitter 0.1 --repeat 3
+    python scripts/bench_offline.py --warm --repeat 3        # 캐시/결과 파일을 반복 사이에 유지
+"""
+import argparse
+import importlib
+import json
+import os
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import crawler_config
+from record_fixtures import FIXTURES_DIR, listing_urls
+from run_all import CRAWLERS
+
+STAGES = ('fetch', 'parse', 'relevance', 'save', 'detail', 'polite_wait')
+
+
+class FixtureIndex:
+    """재생할 픽스처: 정확한 URL, (호스트, 목록 경로), 호스트별 상세 페이지 -> (본문, Content-Type)"""
+
+    def __init__(self, fixtures_dir, names):
+        self.exact = {}
+        self.listings = {}
+        self.details = {}
+        self.crawlers = []
+        for name in names:
+            manifest_path = os.path.join(fixtures_dir, name, 'manifest.json')
+            if not os.path.exists(manifest_path):
+                continue
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            for entry in manifest:
+                with open(os.path.join(fixtures_dir, name, entry['file']), 'rb') as f:
+                    page = (f.read(), entry.get('content_type') or 'text/html')
+                url = urlparse(entry['url'])
+                self.exact[(url.netloc, url.path, url.query)] = page
+                if entry['kind'] == 'listing':
+                    for listing_url in listing_urls(importlib.import_module(CRAWLERS[name])):
+                        listing = urlparse(listing_url)
+                        self.listings.setdefault((listing.netloc, listing.path), page)
+                else:
+                    self.details.setdefault(url.netloc, page)
+            if manifest:
+                self.crawlers.append(name)
+
+    def lookup(self, netloc, path, query):
+        return (self.exact.get((netloc, path, query))
+                or self.listings.get((netloc, path))
+                or self.details.get(netloc))
+
+
+def make_server(index, latency, jitter, seed):
+    rng = random.Random(seed)
+    rng_lock = threading.Lock()
+    served = {'hits': 0, 'misses': 0}
+
+    class ReplayHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # keep-alive (크롤러의 커넥션 풀 재사용을 그대로 측정)
+
+        def do_GET(self):
+            # /<scheme>/<host>/<path>?<query>
+            target = urlparse(self.path)
+            _, _, rest = target.path.partition('/')
+            _, _, rest = rest.partition('/')
+            netloc, _, path = rest.partition('/')
+            page = index.lookup(netloc, '/' + path, target.query)
+
+            with rng_lock:
+                delay = latency + (rng.uniform(0, jitter) if jitter else 0)
+                served['hits' if page else 'misses'] += 1
+            if delay:
+                time.sleep(delay)
+
+            body, content_type = page or (b'not recorded', 'text/plain')
+            self.send_response(200 if page else 404)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            try:
+                self.wfile.write(body)
+            except (BrokenPipeError, ConnectionResetError):
+                pass  # fetch_partial이 필요한 요소를 찾고 연결을 닫은 경우
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ReplayHandler)
+    server.daemon_threads = True
+    return server, served
+
+
+def prepare_workdir(workdir, module, with_existing):
+    """임시 작업 폴더에 news_json과 캐시 폴더(키워드 스냅샷 포함)를 준비합니다."""
+    os.makedirs(os.path.join(workdir, os.path.dirname(module.result_filename)), exist_ok=True)
+    cache_dir = os.path.join(workdir, 'cache')
+    os.makedirs(cache_dir, exist_ok=True)
+    snapshot = os.path.join(ROOT_DIR, crawler_config.CRAWLER_CACHE_DIR, 'keyword_snapshot.json')
+    if os.path.exists(snapshot):
+        shutil.copy(snapshot, cache_dir)
+    existing = os.path.join(ROOT_DIR, module.result_filename)
+    target = os.path.join(workdir, module.result_filename)
+    if with_existing and os.path.exists(existing) and not os.path.exists(target):
+        shutil.copy(existing, target)
+    return cache_dir
+
+
+def run_once(name, workdir, cache_dir, replay_url, polite):
+    """크롤러 하나를 별도 프로세스로 실행해 (소요 초, 종료 코드, 지표 기록)을 반환합니다."""
+    module_name = CRAWLERS[name]
+    metrics_file = os.path.join(cache_dir, 'bench_metrics.jsonl')
+    env = dict(os.environ,
+               PYTHONPATH=os.pathsep.join(filter(None, [ROOT_DIR, os.environ.get('PYTHONPATH')])),
+               CRAWLER_REPLAY_URL=replay_url,
+               CRAWLER_CACHE_DIR=cache_dir,
+               CRAWLER_SCHEDULER='0',
+               CRAWLER_METRICS='1',
+               CRAWLER_METRICS_FILE=metrics_file,
+               CRAWLER_KEYWORD_SNAPSHOT_MAX_AGE=str(10 ** 9),
+               CRAWLER_HOST_INTERVAL_SCALE='1' if polite else '0')
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, os.path.join(ROOT_DIR, f'{module_name}.py')],
+                            cwd=workdir, env=env, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    elapsed = time.perf_counter() - start
+
+    record = None
+    if os.path.exists(metrics_file):
+        with open(metrics_file, 'r', encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        if lines:
+            record = json.loads(lines[-1])
+    if result.returncode != 0:
+        print(result.stdout.decode('utf-8', errors='replace')[-2000:])
+    return elapsed, result.returncode, record
+
+
+def stage_seconds(record, module_name):
+    source = (record or {}).get('sources', {}).get(module_name, {})
+    stages = source.get('stages', {})
+    return {stage: stages.get(stage, {}).get('seconds', 0.0) for stage in STAGES}, source.get('counters', {})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기록된 픽스처로 크롤러 전체 실행 시간을 측정합니다.')
+    parser.add_argument('crawlers', nargs='*', metavar='CRAWLER',
+                        help=f"측정할 크롤러 이름 (생략 시 전체): {', '.join(CRAWLERS)}")
+    parser.add_argument('--fixtures-dir', default=FIXTURES_DIR)
+    parser.add_argument('--latency', type=float, default=0.0, help='응답마다 주입할 지연(초)')
+    parser.add_argument('--jitter', type=float, default=0.0, help='지연에 더할 무작위 값의 최대(초)')
+    parser.add_argument('--seed', type=int, default=0, help='지연 무작위 값의 시드')
+    parser.add_argument('--repeat', type=int, default=1, help='크롤러마다 반복 실행할 횟수 (중앙값 보고)')
+    parser.add_argument('--warm', action='store_true', help='반복 사이에 캐시와 결과 파일을 유지')
+    parser.add_argument('--with-existing', action='store_true', help='저장소의 결과 파일을 복사해 두고 실행')
+    parser.add_argument('--polite', action='store_true', help='crawler_config.HOST_MIN_INTERVAL 간격을 지킴')
+    args = parser.parse_args()
+    unknown = [name for name in args.crawlers if name not in CRAWLERS]
+    if unknown:
+        parser.error(f"알 수 없는 크롤러: {', '.join(unknown)}")
+
+    names = args.crawlers or list(CRAWLERS)
+    index = FixtureIndex(args.fixtures_dir, names)
+    missing = [name for name in names if name not in index.crawlers]
+    # 픽스처는 저장소에 커밋하지 않으므로, 새로 받은 저장소에서는 먼저 기록해야 합니다.
+    record_command = ' '.join(['python scripts/record_fixtures.py'] + (missing if args.crawlers else []))
+    if not index.crawlers:
+        parser.error(f"{args.fixtures_dir}에 픽스처가 없습니다. 먼저 '{record_command}'로 기록하세요.")
+    if missing and args.crawlers:
+        parser.error(f"픽스처가 없는 크롤러: {', '.join(missing)} ('{record_command}'로 기록하세요)")
+    if missing:
+        print(f"픽스처가 없어 건너뜁니다: {', '.join(missing)} (scripts/record_fixtures.py로 기록하세요)")
+    if not os.path.exists(os.path.join(ROOT_DIR, crawler_config.CRAWLER_CACHE_DIR, 'keyword_snapshot.json')):
+        print("키워드 스냅샷이 없어 Firestore 조회를 시도합니다. (실패하면 모든 기사가 관련 기사로 처리됨)")
+
+    server, served = make_server(index, args.latency, args.jitter, args.seed)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    replay_url = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"재생 서버: {replay_url} (지연 {args.latency}s + 0~{args.jitter}s)")
+
+    header = f"{'크롤러':<12} {'전체':>8} " + ' '.join(f"{stage:>11}" for stage in STAGES) + f" {'요청':>5} {'기사':>5}"
+    print(header)
+    failed = False
+    try:
+        for name in index.crawlers:
+            module = importlib.import_module(CRAWLERS[name])
+            runs = []
+            with tempfile.TemporaryDirectory(prefix=f'bench-{name}-') as base:
+                for attempt in range(args.repeat):
+                    workdir = os.path.join(base, 'run' if args.warm else f'run{attempt}')
+                    cache_dir = prepare_workdir(workdir, module, args.with_existing)
+                    elapsed, returncode, record = run_once(name, workdir, cache_dir, replay_url, args.polite)
+                    failed = failed or returncode != 0
+                    runs.append((elapsed, record))
+
+            elapsed, record = sorted(runs, key=lambda run: run[0])[len(runs) // 2]
+            stages, counters = stage_seconds(record, CRAWLERS[name])
+            print(f"{name:<12} {elapsed:7.2f}s " + ' '.join(f"{stages[stage]:10.2f}s" for stage in STAGES)
+                  + f" {(record or {}).get('requests', 0):>5} {counters.get('articles_new', 0):>5}")
+            if args.repeat > 1:
+                timings = [run[0] for run in runs]
+                print(f"{'':<12} 최소 {min(timings):.2f}s, 최대 {max(timings):.2f}s, "
+                      f"표준편차 {statistics.pstdev(timings):.2f}s")
+    finally:
+        server.shutdown()
+
+    print(f"\n응답 {served['hits']}회, 픽스처 없음(404) {served['misses']}회")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
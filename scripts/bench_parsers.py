@@ -0,0 +1,85 @@
+# scripts/bench_parsers.py
+"""
+[마이크로 벤치마크] HTML 파서별 페이지 파싱 시간
+
+scripts/record_fixtures.py로 기록한 fixtures/<크롤러>/*.html을
+html.parser, lxml(BeautifulSoup 트리 빌더)로 파싱해 페이지당 시간을 비교합니다.
+selectolax가 설치되어 있으면 참고용으로 함께 측정합니다.
+(크롤러는 BeautifulSoup API를 쓰므로 crawler_config.HTML_PARSER로는 선택할 수 없습니다)
+
+사용법: python scripts/bench_parsers.py [--repeat 5] [CRAWLER ...]
+"""
+import argparse
+import importlib.util
+import os
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from bs4 import BeautifulSoup
+
+from record_fixtures import FIXTURES_DIR, load_manifest
+from run_all import CRAWLERS
+
+
+def available_backends():
+    backends = {'html.parser': lambda html: BeautifulSoup(html, 'html.parser')}
+    if importlib.util.find_spec('lxml') is not None:
+        backends['lxml'] = lambda html: BeautifulSoup(html, 'lxml')
+    else:
+        print("lxml이 설치되어 있지 않아 건너뜁니다.")
+    try:
+        from selectolax.parser import HTMLParser
+        backends['selectolax'] = HTMLParser
+    except ImportError:
+        pass
+    return backends
+
+
+def best_of(repeat, func):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HTML 파서 벤치마크')
+    parser.add_argument('crawlers', nargs='*', metavar='CRAWLER',
+                        help=f"측정할 크롤러 이름 (생략 시 전체): {', '.join(CRAWLERS)}")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    backends = available_backends()
+    names = list(backends)
+    totals = dict.fromkeys(names, 0.0)
+    pages = 0
+
+    print(f"{'페이지':<24} {'크기':>9}  " + '  '.join(f"{name:>12}" for name in names))
+    for crawler in args.crawlers or CRAWLERS:
+        for entry in load_manifest(crawler):
+            with open(os.path.join(FIXTURES_DIR, crawler, entry['file']), 'rb') as f:
+                html = f.read().decode(entry.get('encoding') or 'utf-8', errors='replace')
+            timings = {name: best_of(args.repeat, lambda: parse(html)) for name, parse in backends.items()}
+            for name in names:
+                totals[name] += timings[name]
+            pages += 1
+            label = f"{crawler}/{entry['kind']}"
+            print(f"{label:<24} {len(html):>9,}  "
+                  + '  '.join(f"{timings[name] * 1000:9.2f} ms" for name in names))
+
+    if not pages:
+        print(f"{FIXTURES_DIR}에 픽스처가 없습니다. scripts/record_fixtures.py를 먼저 실행하세요.")
+        return
+    print(f"\n페이지 평균 ({pages}개): "
+          + ', '.join(f"{name} {totals[name] / pages * 1000:.2f} ms" for name in names))
+    if 'lxml' in totals:
+        print(f"lxml 속도 향상: x{totals['html.parser'] / totals['lxml']:.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+# scripts/bench_startup.py
+"""
+[시작 시간 벤치마크] 크롤러 모듈 임포트 비용
+
+크롤러마다 새 파이썬 프로세스에서 `python -X importtime -c "import <모듈>"`을 실행해
+모듈 임포트에 걸린 누적 시간과 가장 무거운 임포트 목록을 출력합니다.
+(main()은 실행하지 않으므로 네트워크 요청이나 Firestore 조회는 일어나지 않습니다)
+
+사용법:
+    python scripts/bench_startup.py                # 전체 크롤러
+    python scripts/bench_startup.py Google Naver   # 일부만
+    python scripts/bench_startup.py --top 10 --repeat 3
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from run_all import CRAWLERS
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력에서 (모듈, 자체 µs, 누적 µs, 깊이) 목록을 만듭니다."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_part, cumulative_part, name_part = line[len('import time:'):].split('|', 2)
+        # 이름 앞 공백이 1칸이면 최상위, 중첩될 때마다 2칸씩 늘어남
+        depth = (len(name_part) - len(name_part.lstrip()) - 1) // 2
+        rows.append((name_part.strip(), int(self_part), int(cumulative_part), depth))
+    return rows
+
+
+def measure(module_name):
+    """모듈 하나를 새 프로세스에서 임포트하고 importtime 결과를 반환합니다."""
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module_name}'],
+        cwd=ROOT_DIR, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr.strip().splitlines()[-1])
+    rows = parse_importtime(completed.stderr)
+    # 최상위 모듈의 누적 시간 = 이 모듈 임포트에 걸린 전체 시간
+    total = next((cumulative for name, _, cumulative, _ in rows if name == module_name), 0)
+    return total, rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤러 모듈 임포트 시간 벤치마크')
+    parser.add_argument('crawlers', nargs='*', metavar='CRAWLER',
+                        help=f"측정할 크롤러 이름 (생략 시 전체): {', '.join(CRAWLERS)}")
+    parser.add_argument('--top', type=int, default=5, help='크롤러마다 출력할 무거운 최상위 임포트 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 측정 횟수 (최솟값 사용)')
+    args = parser.parse_args()
+    unknown = [name for name in args.crawlers if name not in CRAWLERS]
+    if unknown:
+        parser.error(f"알 수 없는 크롤러: {', '.join(unknown)}")
+
+    results = []
+    for name in args.crawlers or CRAWLERS:
+        module_name = CRAWLERS[name]
+        try:
+            runs = [measure(module_name) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            print(f"[{name}] 임포트 실패: {e}")
+            continue
+        total, rows = min(runs, key=lambda run: run[0])
+        results.append((name, total))
+
+        print(f"\n[{name}] {module_name}: {total / 1000:.1f} ms")
+        # 크롤러 모듈이 직접 임포트한 모듈(깊이가 한 단계 아래) 중 무거운 순서
+        direct = [row for row in rows if row[3] == 1]
+        for child, _, cumulative, _ in sorted(direct, key=lambda row: row[2], reverse=True)[:args.top]:
+            print(f"    {cumulative / 1000:8.1f} ms  {child}")
+
+    if results:
+        print("\n--- 크롤러별 임포트 시간 ---")
+        for name, total in sorted(results, key=lambda r: r[1], reverse=True):
+            print(f"{name:<12} {total / 1000:7.1f} ms")
+        print(f"합계: {sum(total for _, total in results) / 1000:.1f} ms "
+              f"(워크플로마다 각 크롤러를 새 프로세스로 실행할 때의 임포트 비용)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,283 @@
+# scripts/bench_time_parsing.py
+"""
+[마이크로 벤치마크 + 정확성 검사] 게시 시각 파싱
+
+news_json에 저장된 기사 시각을 사이트별 원래 표기('2025.04.18 20:54', '04-18 20:54' ...)로
+다시 써서, 크롤러들이 쓰던 기존 strptime/try-except 방식과 crawler_time.parse를 비교합니다.
+
+- 정확성: 두 방식의 결과가 같은지 확인합니다. 연도가 없는 표기에서 crawler_time이 작년으로
+  추정한 경우(기존 방식은 항상 올해)는 '연도 추정'으로 따로 셉니다.
+- 속도: 같은 문자열 목록을 반복 파싱해 한 건당 시간을 비교합니다.
+- 경계 사례: 저장된 기사로는 나오지 않는 경우를 EDGE_CASES로 고정된 기준 시각에서 확인합니다.
+  (두 자리 연도(strptime 경로), 새해를 넘는 연도 추정, 윤일, KST 변환, 잘못된 입력 -> None,
+  정규식 경로와 strptime의 결과 일치)
+
+불일치나 경계 사례 실패가 있으면 종료 코드 1을 반환합니다.
+
+사용법: python scripts/bench_time_parsing.py [--limit 2000] [--repeat 5] [CRAWLER ...]
+"""
+import argparse
+import importlib
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import crawler_time
+import crawler_utils
+from run_all import CRAWLERS
+
+
+# --- 기존 크롤러의 파싱 코드 (비교 기준) ---
+def legacy_daum(time_str):
+    try:
+        return datetime.strptime(time_str, '%Y.%m.%d. %H:%M:%S')
+    except ValueError:
+        try:
+            current_date = datetime.now().strftime('%Y-%m-%d')
+            return datetime.strptime(f'{current_date} {time_str}', '%Y-%m-%d %H:%M')
+        except ValueError:
+            return None
+
+
+def legacy_nate(published_time):
+    try:
+        if '-' in published_time:
+            return datetime.strptime(published_time, '%m-%d %H:%M').replace(year=datetime.now().year)
+        return datetime.strptime(published_time, '%Y.%m.%d %H:%M')
+    except ValueError:
+        return None
+
+
+def legacy_yna(time_str):
+    try:
+        current_year = datetime.now().year
+        if '-' in time_str:
+            return datetime.strptime(f"{current_year}-{time_str}", '%Y-%m-%d %H:%M')
+        return datetime.strptime(time_str, '%Y-%m-%d %H:%M')
+    except ValueError:
+        return None
+
+
+def legacy_truthdaily(article_time):
+    try:
+        return datetime.strptime(f"{datetime.now().year}-{article_time}", "%Y-%m-%d %H:%M")
+    except ValueError:
+        return None
+
+
+def legacy_cascade(formats):
+    """crawler_engine.parse_time과 사이트별 단일 형식 파서가 쓰던 방식"""
+    def parse(time_str):
+        for fmt in formats:
+            try:
+                return datetime.strptime(time_str, fmt)
+            except ValueError:
+                continue
+        return None
+    return parse
+
+
+# 크롤러 -> (원래 표기로 되돌릴 형식들, crawler_time에 넘기는 형식들, 기존 파서)
+SITES = {
+    'Naver': (['%Y-%m-%d %H:%M:%S'], ['%Y-%m-%d %H:%M:%S'], None),
+    'Daum': (['%Y.%m.%d. %H:%M:%S'], ['%Y.%m.%d. %H:%M:%S', '%H:%M'], legacy_daum),
+    'Nate': (['%m-%d %H:%M', '%Y.%m.%d %H:%M'], ['%m-%d %H:%M', '%Y.%m.%d %H:%M'], legacy_nate),
+    'YNA': (['%m-%d %H:%M'], ['%m-%d %H:%M', '%Y-%m-%d %H:%M'], legacy_yna),
+    'hanmiilbo': (['%Y-%m-%d'], ['%Y-%m-%d'], None),
+    'boannews': (['%Y년 %m월 %d일 %H:%M'], ['%Y년 %m월 %d일 %H:%M'], None),
+    'truthdaily': (['%m-%d %H:%M'], ['%m-%d %H:%M'], legacy_truthdaily),
+}
+
+
+def site_rules(name):
+    """SITES에 없으면 크롤러 모듈의 SPEC['time']['formats']를 사용합니다. (crawler_engine 사이트)"""
+    if name in SITES:
+        render, formats, legacy = SITES[name]
+        return render, formats, legacy or legacy_cascade(formats)
+    spec = getattr(importlib.import_module(CRAWLERS[name]), 'SPEC', None)
+    if spec is None:
+        return None
+    formats = spec['time']['formats']
+    return formats[:1], formats, legacy_cascade(formats)
+
+
+def iter_articles(name):
+    """
+    크롤러 결과 파일의 기사 (최신 날짜부터).
+    결과 파일이 없으면 ForTwoDay_News.json에서 그 소스의 기사를 사용합니다.
+    """
+    result_filename = importlib.import_module(CRAWLERS[name]).result_filename
+    path = os.path.join(ROOT_DIR, result_filename)
+    source = None
+    if not os.path.exists(path):
+        source = os.path.splitext(os.path.basename(result_filename))[0].replace('_News', '')
+        path = os.path.join(ROOT_DIR, 'news_json', 'ForTwoDay_News.json')
+    for group in crawler_utils.iter_date_groups(path, reverse=True):
+        for article in group.get('articles', []):
+            if source is None or article.get('source') == source:
+                yield article
+
+
+def sample_strings(name, render_formats, limit):
+    """결과 파일의 기사 시각을 사이트 표기 문자열로 바꿉니다. (최신 기사부터 limit개)"""
+    strings = []
+    for article in iter_articles(name):
+        try:
+            dt = datetime.fromisoformat(article.get('time', ''))
+        except ValueError:
+            continue
+        strings.append(dt.strftime(render_formats[len(strings) % len(render_formats)]))
+        if len(strings) >= limit:
+            break
+    return strings
+
+
+def check(strings, formats, legacy):
+    """(일치, 연도 추정, 기존 방식만 실패, 불일치 예시 목록)"""
+    same = inferred = legacy_failed = 0
+    mismatches = []
+    for text in strings:
+        expected = legacy(text)
+        parsed = crawler_time.parse(text, formats)
+        actual = parsed.replace(tzinfo=None) if parsed else None
+        if actual == expected:
+            same += 1
+        elif expected is None and actual is not None:
+            legacy_failed += 1  # 예: 기존 '%m-%d' 파싱은 1900년 기준이라 2월 29일에 실패
+        elif expected is not None and actual == expected.replace(year=expected.year - 1):
+            inferred += 1
+        else:
+            mismatches.append((text, expected, actual))
+    return same, inferred, legacy_failed, mismatches
+
+
+# --- 경계 사례 (기준 시각 고정) ---
+KST = crawler_time.KST
+NEW_YEAR = datetime(2026, 1, 1, 0, 10, tzinfo=KST)  # 1월 1일 00:10에 크롤링
+LEAP_DAY = datetime(2024, 3, 1, 9, 0, tzinfo=KST)
+
+# (설명, 문자열, 형식들, 기준 시각, 기대 결과 (KST datetime 또는 None))
+EDGE_CASES = [
+    ('두 자리 연도 (%y는 strptime 경로)', '25.04.18 20:54', ['%y.%m.%d %H:%M'], None,
+     datetime(2025, 4, 18, 20, 54, tzinfo=KST)),
+    ('새해: 작년 12월 31일 기사', '12-31 23:50', ['%m-%d %H:%M'], NEW_YEAR,
+     datetime(2025, 12, 31, 23, 50, tzinfo=KST)),
+    ('새해: 오늘 기사는 올해', '01-01 00:05', ['%m-%d %H:%M'], NEW_YEAR,
+     datetime(2026, 1, 1, 0, 5, tzinfo=KST)),
+    ('새해: 시각만 있는 형식은 오늘(KST) 날짜', '00:05', ['%H:%M'], NEW_YEAR,
+     datetime(2026, 1, 1, 0, 5, tzinfo=KST)),
+    ('UTC로 12월 31일이어도 KST 날짜 사용', '00:05', ['%H:%M'],
+     datetime(2025, 12, 31, 15, 10, tzinfo=timezone.utc), datetime(2026, 1, 1, 0, 5, tzinfo=KST)),
+    ('윤일 (연도 없는 형식)', '02-29 10:00', ['%m-%d %H:%M'], LEAP_DAY,
+     datetime(2024, 2, 29, 10, 0, tzinfo=KST)),
+    ('한 자리 월/일/시', '2025.4.8 9:05', ['%Y.%m.%d %H:%M'], None, datetime(2025, 4, 8, 9, 5, tzinfo=KST)),
+    ('여러 공백', '2025.04.18  20:54', ['%Y.%m.%d %H:%M'], None, datetime(2025, 4, 18, 20, 54, tzinfo=KST)),
+    ('첫 형식 실패 후 다음 형식', '2025.04.18 20:54', ['%m-%d %H:%M', '%Y.%m.%d %H:%M'], None,
+     datetime(2025, 4, 18, 20, 54, tzinfo=KST)),
+    ('AM/PM (%p는 strptime 경로)', '2025-04-18 08:54 PM', ['%Y-%m-%d %I:%M %p'], None,
+     datetime(2025, 4, 18, 20, 54, tzinfo=KST)),
+    ('잘못된 입력: 빈 문자열', '', ['%Y.%m.%d %H:%M'], None, None),
+    ('잘못된 입력: None', None, ['%Y.%m.%d %H:%M'], None, None),
+    ('잘못된 입력: 13월', '2025.13.01 10:00', ['%Y.%m.%d %H:%M'], None, None),
+    ('잘못된 입력: 2월 30일', '2025.02.30 10:00', ['%Y.%m.%d %H:%M'], None, None),
+    ('잘못된 입력: 시각 없음', '2025.04.18', ['%Y.%m.%d %H:%M'], None, None),
+    ('잘못된 입력: 뒤에 남는 문자', '2025.04.18 20:54 입력', ['%Y.%m.%d %H:%M'], None, None),
+    ('잘못된 입력: 글자', '어제', ['%Y.%m.%d %H:%M', '%m-%d %H:%M'], None, None),
+]
+
+
+def strptime_kst(text, formats):
+    """연도가 있는 형식의 기준 결과: strptime (정규식 경로와 같은 값을 돌려줘야 함)"""
+    return legacy_cascade(formats)(text.strip()) if text else None
+
+
+def check_edge_cases():
+    """EDGE_CASES를 확인하고 실패한 (설명, 문자열, 기대, 결과) 목록을 반환합니다."""
+    failures = []
+    for label, text, formats, reference, expected in EDGE_CASES:
+        actual = crawler_time.parse(text, formats, reference)
+        if actual != expected or (actual is not None and actual.utcoffset() != timedelta(hours=9)):
+            failures.append((label, text, expected, actual))
+        # 연도가 있는 형식은 strptime과도 같아야 합니다.
+        if reference is None and actual is not None:
+            baseline = strptime_kst(text, formats)
+            if baseline is None or baseline.replace(tzinfo=KST) != actual:
+                failures.append((f"{label} (strptime과 다름)", text, baseline, actual))
+    # 저장 형식은 시간대 없는 KST 시각 (UTC 시각을 넘기면 KST로 변환)
+    stored = crawler_time.iso(datetime(2025, 4, 18, 11, 54, tzinfo=timezone.utc))
+    if stored != '2025-04-18T20:54:00':
+        failures.append(('iso(): UTC -> KST', '2025-04-18 11:54 UTC', '2025-04-18T20:54:00', stored))
+    if crawler_time.now().utcoffset() != timedelta(hours=9):
+        failures.append(('now()는 KST', '', timedelta(hours=9), crawler_time.now().utcoffset()))
+    return failures
+
+
+def best_of(repeat, func, strings):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for text in strings:
+            func(text)
+        timings.append(time.perf_counter() - start)
+    return min(timings) / len(strings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='게시 시각 파싱 벤치마크와 정확성 검사')
+    parser.add_argument('crawlers', nargs='*', metavar='CRAWLER',
+                        help=f"측정할 크롤러 이름 (생략 시 전체): {', '.join(CRAWLERS)}")
+    parser.add_argument('--limit', type=int, default=2000, help='크롤러마다 사용할 최대 기사 수')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    unknown = [name for name in args.crawlers if name not in CRAWLERS]
+    if unknown:
+        parser.error(f"알 수 없는 크롤러: {', '.join(unknown)}")
+
+    os.chdir(ROOT_DIR)
+    edge_failures = check_edge_cases()
+    print(f"경계 사례: {len(EDGE_CASES) + 2 - len(edge_failures)}/{len(EDGE_CASES) + 2} 통과")
+    for label, text, expected, actual in edge_failures:
+        print(f"    {label}: {text!r} -> {actual} (기대 {expected})")
+    failed = bool(edge_failures)
+    total_legacy = total_fast = 0.0
+    print(f"{'크롤러':<12} {'건수':>6} {'기존':>10} {'crawler_time':>13} {'배':>6}  정확성")
+    for name in args.crawlers or CRAWLERS:
+        rules = site_rules(name)
+        if rules is None:
+            continue
+        render_formats, formats, legacy = rules
+        strings = sample_strings(name, render_formats, args.limit)
+        if not strings:
+            continue
+
+        same, inferred, legacy_failed, mismatches = check(strings, formats, legacy)
+        legacy_time = best_of(args.repeat, legacy, strings)
+        fast_time = best_of(args.repeat, lambda text: crawler_time.parse(text, formats), strings)
+        total_legacy += legacy_time * len(strings)
+        total_fast += fast_time * len(strings)
+
+        status = f"일치 {same}"
+        if inferred:
+            status += f", 연도 추정 {inferred}"
+        if legacy_failed:
+            status += f", 기존 방식 실패 {legacy_failed}"
+        if mismatches:
+            status += f", 불일치 {len(mismatches)}"
+            failed = True
+        print(f"{name:<12} {len(strings):>6} {legacy_time * 1e6:8.2f}µs {fast_time * 1e6:11.2f}µs "
+              f"{legacy_time / fast_time:5.1f}x  {status}")
+        for text, expected, actual in mismatches[:3]:
+            print(f"    {text!r}: 기존 {expected}, crawler_time {actual}")
+
+    if total_fast:
+        print(f"\n전체: 기존 {total_legacy * 1000:.1f} ms, crawler_time {total_fast * 1000:.1f} ms "
+              f"(x{total_legacy / total_fast:.1f})")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,40 @@
+# scripts/compact_news_log.py
+"""
+[로그 압축]
+STORAGE_MODE='jsonl'로 쌓인 news_json/log/<소스>/<날짜>.jsonl 세그먼트를
+news_json/<소스>.json([{date, articles}] 형식)에 합쳐 프론트엔드용 파일을 만듭니다.
+
+사용법: python scripts/compact_news_log.py [--keep-days 2]
+"""
+import argparse
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import crawler_config
+import crawler_store
+
+NEWS_JSON_DIR = 'news_json'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='추가 전용 기사 로그를 JSON으로 압축합니다.')
+    parser.add_argument('--keep-days', type=int, default=crawler_config.LOG_KEEP_SEGMENT_DAYS,
+                        help='압축 후에도 남겨 둘 최근 세그먼트 일수')
+    args = parser.parse_args()
+
+    log_root = os.path.join(NEWS_JSON_DIR, 'log')
+    if not os.path.isdir(log_root):
+        print(f"{log_root} 폴더가 없습니다. 압축할 로그가 없습니다.")
+        return
+
+    for source in sorted(os.listdir(log_root)):
+        if os.path.isdir(os.path.join(log_root, source)):
+            result_filename = os.path.join(NEWS_JSON_DIR, f"{source}.json")
+            crawler_store.compact_article_log(result_filename, keep_days=args.keep_days)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# scripts/merge_shards.py
+"""
+[샤드 결과 병합]
+샤드 실행(run_all.py --shard i/N)이 shards/shard-<i>/log/<소스>/<날짜>.jsonl에 남긴 새 기사를
+news_json/<소스>.json에 합칩니다. 러너마다 news_json을 커밋/푸시하지 않고,
+이 스크립트를 실행하는 병합 단계 하나만 커밋하므로 푸시 충돌이 생기지 않습니다.
+
+- 같은 소스를 여러 샤드가 수집했으면(섹션 샤드) URL로 중복을 제거하고,
+  이미 news_json에 저장된 URL(crawler_utils.get_existing_links)도 건너뜁니다.
+- 저장은 crawler_utils.save_articles_to_json을 그대로 쓰므로 STORAGE_MODE('json'/'jsonl')를 따릅니다.
+- 합친 세그먼트는 삭제합니다. (--keep이면 남김) 다시 실행해도 결과는 같습니다.
+- --two-day면 이어서 scripts/process_two_day_news.py --incremental로 ForTwoDay_News.json을 갱신합니다.
+
+사용법:
+    python scripts/merge_shards.py                      # shards/ 아래 모든 샤드
+    python scripts/merge_shards.py --shards-dir artifacts --two-day
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import crawler_config
+import crawler_utils
+
+NEWS_JSON_DIR = 'news_json'
+
+
+def collect_shard_articles(shards_dir):
+    """
+    소스 -> {날짜 문자열: 기사 리스트}, 그리고 읽은 세그먼트 경로 목록.
+    샤드 번호 순서, 세그먼트 날짜 순서로 읽습니다.
+    """
+    sources = {}
+    segment_paths = []
+    shard_names = sorted((name for name in os.listdir(shards_dir) if name.startswith('shard-')),
+                         key=lambda name: (len(name), name))  # shard-2가 shard-10보다 먼저
+    for shard_name in shard_names:
+        log_root = os.path.join(shards_dir, shard_name, 'log')
+        if not os.path.isdir(log_root):
+            continue
+        for source in sorted(os.listdir(log_root)):
+            # 샤드 폴더의 가상 결과 파일 경로로 crawler_utils의 로그 읽기를 그대로 사용
+            shard_result = os.path.join(shards_dir, shard_name, f"{source}.json")
+            for day_key, date_string, articles in crawler_utils.iter_log_segments(shard_result):
+                sources.setdefault(source, {}).setdefault(date_string, []).extend(articles)
+                segment_paths.append(os.path.join(log_root, source, f"{day_key}.jsonl"))
+    return sources, segment_paths
+
+
+def merge_source(source, dated_articles):
+    """한 소스의 샤드 기사를 news_json/<소스>.json에 날짜순으로 저장하고 새 기사 수를 반환합니다."""
+    result_filename = os.path.join(NEWS_JSON_DIR, f"{source}.json")
+    existing_links = crawler_utils.get_existing_links(result_filename)
+    added = 0
+    for date_string in sorted(dated_articles, key=lambda d: crawler_utils.parse_group_date(d) or d):
+        new_articles = []
+        for article in dated_articles[date_string]:
+            url = article.get('url')
+            if url and url not in existing_links:
+                existing_links.add(url)
+                new_articles.append(article)
+        crawler_utils.save_articles_to_json(result_filename, new_articles, date_string)
+        added += len(new_articles)
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description='샤드 실행 결과를 news_json에 합칩니다.')
+    parser.add_argument('--shards-dir', default=crawler_config.SHARD_OUTPUT_DIR)
+    parser.add_argument('--keep', action='store_true', help='합친 세그먼트를 삭제하지 않음')
+    parser.add_argument('--two-day', action='store_true',
+                        help='병합 후 process_two_day_news.py --incremental 실행')
+    args = parser.parse_args()
+    shards_dir = os.path.abspath(args.shards_dir)
+
+    os.chdir(ROOT_DIR)  # news_json 경로는 저장소 루트 기준
+    crawler_config.SHARD = ''  # 병합은 샤드 폴더가 아니라 news_json에 저장
+    if not os.path.isdir(shards_dir):
+        print(f"{shards_dir} 폴더가 없습니다. 합칠 샤드 결과가 없습니다.")
+        return 0
+
+    sources, segment_paths = collect_shard_articles(shards_dir)
+    total = 0
+    for source, dated_articles in sorted(sources.items()):
+        added = merge_source(source, dated_articles)
+        total += added
+        print(f"[{source}] 샤드 기사 {sum(map(len, dated_articles.values()))}개 중 새 기사 {added}개 병합")
+    print(f"샤드 세그먼트 {len(segment_paths)}개에서 새 기사 {total}개를 병합했습니다.")
+
+    if not args.keep:
+        for path in segment_paths:
+            os.remove(path)
+
+    if args.two_day:
+        return subprocess.call([sys.executable, os.path.join(ROOT_DIR, 'scripts', 'process_two_day_news.py'),
+                                '--incremental'])
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
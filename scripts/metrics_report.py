@@ -0,0 +1,92 @@
+# scripts/metrics_report.py
+"""
+[실행 지표 보고서]
+crawler_config.METRICS_FILE(.crawler_cache/metrics.jsonl)에 쌓인 실행 기록을 읽어
+- 최근 실행 목록 (시작 시각, 실행 파일, 소요 시간, 요청 수)
+- 소스/단계별 평균 시간과, 가장 최근 실행이 그 평균보다 크게 느려진 단계
+- 호스트별 요청 수, 평균 응답 시간, 받은 바이트
+를 출력합니다.
+
+사용법:
+    python scripts/metrics_report.py                  # 최근 20회
+    python scripts/metrics_report.py --runs 50 --file path/to/metrics.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import crawler_config
+
+REGRESSION_RATIO = 1.5  # 최근 실행이 이전 평균의 이 배수를 넘으면 표시
+
+
+def load_records(path, runs):
+    records = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # 기록 중에 끊긴 줄
+    return records[-runs:]
+
+
+def stage_seconds(records):
+    """(소스, 단계) -> 실행별 누적 초 목록 (오래된 실행부터)"""
+    series = {}
+    for record in records:
+        for source, data in record.get('sources', {}).items():
+            for stage, entry in data.get('stages', {}).items():
+                series.setdefault((source, stage), []).append(entry['seconds'])
+    return series
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤러 실행 지표 보고서')
+    parser.add_argument('--file', default=os.path.join(ROOT_DIR, crawler_config.METRICS_FILE))
+    parser.add_argument('--runs', type=int, default=20, help='읽을 최근 실행 수')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.file):
+        print(f"{args.file}이 없습니다. 크롤러를 한 번 실행하면 생성됩니다.")
+        return
+    records = load_records(args.file, args.runs)
+    if not records:
+        print("기록이 없습니다.")
+        return
+
+    print(f"--- 최근 실행 {len(records)}회 ---")
+    for record in records:
+        print(f"{record['started']}  {record.get('entry', ''):<22} {record['wall_seconds']:8.1f}s  "
+              f"요청 {record.get('requests', 0)}회")
+
+    print("\n--- 소스/단계별 평균 (초) ---")
+    print(f"{'소스':<20} {'단계':<12} {'평균':>8} {'최근':>8}  비고")
+    for (source, stage), seconds in sorted(stage_seconds(records).items()):
+        average = sum(seconds) / len(seconds)
+        note = ''
+        if len(seconds) > 1:
+            previous = sum(seconds[:-1]) / (len(seconds) - 1)
+            if previous > 0 and seconds[-1] > previous * REGRESSION_RATIO:
+                note = f"이전 평균의 {seconds[-1] / previous:.1f}배"
+        print(f"{source:<20} {stage:<12} {average:8.2f} {seconds[-1]:8.2f}  {note}")
+
+    hosts = {}
+    for record in records:
+        for host, entry in record.get('hosts', {}).items():
+            total = hosts.setdefault(host, {'requests': 0, 'seconds': 0.0, 'bytes': 0, 'errors': 0})
+            for key in total:
+                total[key] += entry.get(key, 0)
+    if hosts:
+        print(f"\n--- 호스트별 요청 ({len(records)}회 합계) ---")
+        for host, total in sorted(hosts.items(), key=lambda item: item[1]['seconds'], reverse=True):
+            print(f"{host:<28} {total['requests']:>6}회  평균 {total['seconds'] / total['requests'] * 1000:7.0f}ms  "
+                  f"{total['bytes'] / 1024 / 1024:8.1f}MB  실패 {total['errors']}회")
+
+
+if __name__ == '__main__':
+    main()
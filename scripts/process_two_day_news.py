@@ -1,58 +1,93 @@
+import argparse
+import gzip
 import json
 import os
+import sys
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import crawler_config
+import crawler_store
+
 # 오늘과 어제 날짜 계산 (KST 기준)
 today = datetime.now().strftime('%Y년 %m월 %d일')
 yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y년 %m월 %d일')
 # 요일 포함 형식도 처리
 today_with_day = datetime.now().strftime('%Y년 %m월 %d일 %A').replace('Monday', '월요일').replace('Tuesday', '화요일').replace('Wednesday', '수요일').replace('Thursday', '목요일').replace('Friday', '금요일').replace('Saturday', '토요일').replace('Sunday', '일요일')
 yesterday_with_day = (datetime.now() - timedelta(days=1)).strftime('%Y년 %m월 %d일 %A').replace('Monday', '월요일').replace('Tuesday', '화요일').replace('Wednesday', '수요일').replace('Thursday', '목요일').replace('Friday', '금요일').replace('Saturday', '토요일').replace('Sunday', '일요일')
+target_dates = [today, yesterday, today_with_day, yesterday_with_day]
 
 # 디버깅 로그
 print(f"Today: {today}, Yesterday: {yesterday}")
 print(f"Today with day: {today_with_day}, Yesterday with day: {yesterday_with_day}")
 
-# JSON 파일 처리
-def process_json_files():
-    input_dir = Path('news_json')
-    output_file = input_dir / 'ForTwoDay_News.json'
-    two_day_articles = []
+# 증분 모드 상태 파일: 소스별 지문과 마지막 날짜 그룹, 그리고 결과 파일의 지문을 기록
+STATE_FILE = os.path.join(crawler_config.CRAWLER_CACHE_DIR, 'two_day_state.json')
 
-    # news_json 폴더의 모든 JSON 파일 읽기
-    json_files = list(input_dir.glob('*.json'))
-    print(f"Found {len(json_files)} JSON files in {input_dir}")
 
-    for json_file in json_files:
-        if json_file.name == 'ForTwoDay_News.json':
-            continue
-        print(f"Processing {json_file}")
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                if not isinstance(data, list):
-                    print(f"Invalid JSON structure in {json_file}: Expected a list")
-                    continue
-                for group in data:
-                    group_date = group.get('date', '').strip()
-                    # 요일 포함/미포함 모두 처리
-                    normalized_group_date = group_date.split(' ')[0:3]
-                    normalized_group_date = ' '.join(normalized_group_date) if normalized_group_date else ''
-                    print(f"Checking group date: {group_date} (normalized: {normalized_group_date})")
-                    if normalized_group_date in [today, yesterday, today_with_day, yesterday_with_day]:
-                        articles = group.get('articles', [])
-                        print(f"Found {len(articles)} articles for date {group_date}")
-                        for article in articles:
-                            article['source'] = json_file.stem.replace('_News', '')  # 소스 추가
-                            article['date'] = group_date  # date 필드 추가
-                        two_day_articles.append({
-                            'date': group_date,
-                            'articles': articles
-                        })
-        except Exception as e:
-            print(f"Error processing {json_file}: {e}")
+def normalize_date(group_date):
+    """요일 포함/미포함 날짜를 'YYYY년 MM월 DD일'로 맞춥니다."""
+    normalized_group_date = group_date.split(' ')[0:3]
+    return ' '.join(normalized_group_date) if normalized_group_date else ''
+
+
+def source_name(json_file):
+    return json_file.stem.replace('_News', '')
+
 
+def read_two_day_groups(json_file):
+    """
+    소스 파일의 끝에서부터 오늘/어제 그룹만 읽어 (그룹 리스트, 마지막 날짜)를 반환합니다.
+    그 이전 기록은 읽지 않습니다. (crawler_store.iter_date_groups)
+    """
+    two_day_groups = []
+    last_date = ''
+    cutoff = datetime.strptime(yesterday, '%Y년 %m월 %d일')
+    for group in crawler_store.iter_date_groups(str(json_file), reverse=True):
+        group_date = group.get('date', '').strip()
+        last_date = last_date or group_date
+        group_day = crawler_store.parse_group_date(group_date)
+        if group_day is not None and group_day < cutoff:
+            break
+        # 요일 포함/미포함 모두 처리
+        normalized_group_date = normalize_date(group_date)
+        print(f"Checking group date: {group_date} (normalized: {normalized_group_date})")
+        if normalized_group_date in target_dates:
+            articles = group.get('articles', [])
+            print(f"Found {len(articles)} articles for date {group_date}")
+            for article in articles:
+                article['source'] = source_name(json_file)  # 소스 추가
+                article['date'] = group_date  # date 필드 추가
+            two_day_groups.append({
+                'date': group_date,
+                'articles': articles
+            })
+    # 파일 안의 순서(오래된 날짜 먼저)로 되돌려 중복 제거 순서를 유지
+    two_day_groups.reverse()
+    return two_day_groups, last_date
+
+
+def reuse_groups_from_output(previous_output, source):
+    """
+    변경되지 않은 소스의 그룹을 기존 결과 파일에서 복원합니다.
+    (날짜가 바뀌었을 수 있으므로 오늘/어제에 해당하는 기사만 남깁니다)
+    """
+    groups = {}
+    for group in previous_output:
+        for article in group.get('articles', []):
+            if article.get('source') != source:
+                continue
+            group_date = article.get('date', group.get('date', ''))
+            if normalize_date(group_date) in target_dates:
+                groups.setdefault(group_date, []).append(article)
+    return [{'date': date, 'articles': articles} for date, articles in groups.items()]
+
+
+def merge_groups(two_day_articles):
     # 중복 제거 (URL 기준)
     seen_urls = set()
     unique_groups = []
@@ -74,18 +109,220 @@ def process_json_files():
     # 날짜순 정렬
     def parse_date(date_str):
         try:
-            return datetime.strptime(' '.join(date_str.split(' ')[0:3]), '%Y년 %m월 %d일')
+            return datetime.strptime(normalize_date(date_str), '%Y년 %m월 %d일')
         except ValueError:
             return datetime.min  # 정렬을 위해 최소 날짜 반환
     unique_groups.sort(key=lambda x: parse_date(x['date']), reverse=True)
+    return unique_groups
+
+
+def assign_clusters(unique_groups):
+    """
+    소스가 달라도 제목이 거의 같은 기사에 같은 'cluster' 번호를 붙입니다. (crawler_store.NearDuplicateIndex)
+    재사용한 기사의 이전 번호는 버리고 결과 파일을 쓸 때마다 전체를 다시 묶습니다.
+    """
+    index = crawler_store.NearDuplicateIndex()
+    for group in unique_groups:
+        for article in group['articles']:
+            article['cluster'] = index.add(article.get('title', ''))
+    print(f"Clustered {len(index)} articles into {index.cluster_count} stories")
+
+
+# 추가 형식 내보내기 (crawler_config.TWO_DAY_EXPORT_FORMATS)
+EXPORT_FORMATS = ('parquet', 'arrow', 'min.json', 'json.gz')
+
+
+def export_path(output_file, fmt):
+    """news_json/ForTwoDay_News.json -> news_json/ForTwoDay_News.<fmt>"""
+    return output_file.with_name(f"{output_file.stem}.{fmt}")
+
+
+def articles_frame(unique_groups):
+    """
+    그룹 목록을 기사 한 줄짜리 표(pandas.DataFrame)로 펼칩니다.
+    source/date는 값 종류가 적으므로 category(Arrow/Parquet의 사전 인코딩)로 저장합니다.
+    """
+    import pandas as pd
+
+    rows = [dict(article, date=group['date']) for group in unique_groups for article in group['articles']]
+    columns = ['date', 'source']
+    for row in rows:
+        columns.extend(key for key in row if key not in columns)
+    frame = pd.DataFrame(rows, columns=columns)
+    for column in ('source', 'date'):
+        frame[column] = frame[column].astype('category')
+    if 'cluster' in frame:
+        frame['cluster'] = frame['cluster'].astype('Int32')
+    return frame
+
+
+def write_export(unique_groups, path, fmt):
+    if fmt == 'min.json':
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(unique_groups, f, ensure_ascii=False, separators=(',', ':'))
+    elif fmt == 'json.gz':
+        payload = json.dumps(unique_groups, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        # mtime=0: 내용이 같으면 파일도 같게 (커밋 diff가 생기지 않도록)
+        with open(path, 'wb') as f:
+            f.write(gzip.compress(payload, compresslevel=9, mtime=0))
+    elif fmt == 'parquet':
+        articles_frame(unique_groups).to_parquet(path, index=False, compression='zstd')
+    elif fmt == 'arrow':
+        # Arrow IPC(Feather v2) 파일. apache-arrow(JS)는 압축된 IPC 버퍼를 읽지 못하므로 압축하지 않습니다.
+        articles_frame(unique_groups).to_feather(path, compression='uncompressed')
+
+
+def export_outputs(unique_groups, output_file, formats, only_missing=False):
+    """
+    ForTwoDay_News.json과 같은 내용을 formats 형식으로 함께 씁니다. 쓰지 못한 형식 목록을 반환합니다.
+    parquet/arrow는 pandas + pyarrow가 필요합니다. (requirements.txt)
+    """
+    failed = []
+    for fmt in formats:
+        if fmt not in EXPORT_FORMATS:
+            print(f"알 수 없는 내보내기 형식 '{fmt}'입니다. ({', '.join(EXPORT_FORMATS)})")
+            failed.append(fmt)
+            continue
+        path = export_path(output_file, fmt)
+        if only_missing and path.exists():
+            continue
+        try:
+            write_export(unique_groups, path, fmt)
+        except ImportError as e:
+            print(f"{fmt} 내보내기 실패 (pandas/pyarrow 필요, pip install -r requirements.txt): {e}")
+            failed.append(fmt)
+        except Exception as e:
+            print(f"Error saving {path}: {e}")
+            failed.append(fmt)
+    return failed
+
+
+def _load_export(path):
+    """소비자가 하는 방식 그대로 읽습니다. (JSON은 파싱, 열 형식은 DataFrame으로)"""
+    name = path.name
+    if name.endswith('.parquet'):
+        import pandas as pd
+        return pd.read_parquet(path)
+    if name.endswith('.arrow'):
+        import pandas as pd
+        return pd.read_feather(path)
+    if name.endswith('.gz'):
+        with open(path, 'rb') as f:
+            return json.loads(gzip.decompress(f.read()))
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def report_exports(output_file, formats, repeat=3):
+    """기존 JSON과 추가 형식의 파일 크기, 읽기 시간(repeat회 중 최소)을 비교해 출력합니다."""
+    paths = [output_file] + [export_path(output_file, fmt) for fmt in formats]
+    base_size = output_file.stat().st_size
+    base_time = None
+    print(f"{'파일':<32} {'크기':>10} {'비율':>6} {'읽기':>9} {'배':>6}")
+    for path in paths:
+        if not path.exists():
+            continue
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            try:
+                _load_export(path)
+            except ImportError:
+                break
+            timings.append(time.perf_counter() - start)
+        size = path.stat().st_size
+        load = min(timings) if timings else None
+        base_time = base_time or load
+        load_text = f"{load * 1000:7.1f}ms" if load else f"{'-':>9}"
+        speedup = f"{base_time / load:5.1f}x" if load and base_time else f"{'-':>6}"
+        print(f"{path.name:<32} {size / 1024:8.0f}KB {size / base_size:6.1%} {load_text} {speedup}")
+
+
+# JSON 파일 처리
+def process_json_files(incremental=False, export_formats=(), report=False):
+    """최근 이틀치 기사를 모아 저장합니다. 결과 파일이나 요청한 내보내기 형식을 쓰지 못하면 1을 반환합니다."""
+    input_dir = Path('news_json')
+    output_file = input_dir / 'ForTwoDay_News.json'
+    two_day_articles = []
+
+    # news_json 폴더의 모든 JSON 파일 읽기
+    # (결과 파일과 내보낸 형식은 제외: ForTwoDay_News.min.json도 '*.json'에 걸림)
+    json_files = sorted(path for path in input_dir.glob('*.json')
+                        if not path.name.startswith(f"{output_file.stem}."))
+    print(f"Found {len(json_files)} JSON files in {input_dir}")
+
+    # 증분 모드: 이전 실행과 비교해 바뀐 소스만 다시 읽습니다.
+    state = crawler_store.load_json_file(STATE_FILE, {}) if incremental else {}
+    previous_output = None
+    if incremental:
+        if state.get('output') == crawler_store.source_fingerprint(str(output_file)):
+            previous_output = crawler_store.load_json_file(str(output_file), None)
+        else:
+            print("증분 상태가 없거나 결과 파일이 바뀌어 전체를 다시 계산합니다.")
+    source_states = state.get('sources', {}) if previous_output is not None else {}
+
+    new_source_states = {}
+    changed_sources = 0
+    for json_file in json_files:
+        fingerprint = crawler_store.source_fingerprint(str(json_file))
+        previous = source_states.get(json_file.name)
+        if previous and previous.get('fingerprint') == fingerprint:
+            print(f"Unchanged, reusing {json_file}")
+            two_day_articles.extend(reuse_groups_from_output(previous_output, source_name(json_file)))
+            new_source_states[json_file.name] = previous
+            continue
+
+        print(f"Processing {json_file}")
+        changed_sources += 1
+        try:
+            groups, last_date = read_two_day_groups(json_file)
+            two_day_articles.extend(groups)
+            new_source_states[json_file.name] = {'fingerprint': fingerprint, 'last_date': last_date}
+        except Exception as e:
+            print(f"Error processing {json_file}: {e}")
+
+    # 날짜가 바뀐 경우에는 어제 이전 기사를 빼야 하므로 다시 씁니다.
+    if (previous_output is not None and changed_sources == 0 and state.get('today') == today
+            and set(new_source_states) == set(source_states)):
+        print(f"변경된 소스가 없어 {output_file}을 다시 쓰지 않습니다.")
+        # 이번에 새로 켠 형식만 기존 결과로 만듭니다.
+        failed = export_outputs(previous_output, output_file, export_formats, only_missing=True)
+        if report:
+            report_exports(output_file, export_formats)
+        return 1 if failed else 0
+
+    unique_groups = merge_groups(two_day_articles)
+    assign_clusters(unique_groups)
 
     # 결과 저장
     try:
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(unique_groups, f, ensure_ascii=False, indent=2)
-        print(f"Saved {output_file} with {sum(len(g['articles']) for g in unique_groups)} articles")
+        print(f"Saved {output_file} with {sum(len(g['articles']) for g in unique_groups)} articles "
+              f"({changed_sources} changed sources)")
     except Exception as e:
         print(f"Error saving {output_file}: {e}")
+        return 1
+    failed = export_outputs(unique_groups, output_file, export_formats)
+    if report:
+        report_exports(output_file, export_formats)
+
+    if incremental:
+        crawler_store.write_json_atomic(STATE_FILE, {
+            'today': today,
+            'output': crawler_store.source_fingerprint(str(output_file)),
+            'sources': new_source_states,
+        })
+    return 1 if failed else 0
+
 
 if __name__ == '__main__':
-    process_json_files()
+    parser = argparse.ArgumentParser(description='최근 이틀치 기사를 ForTwoDay_News.json으로 모읍니다.')
+    parser.add_argument('--incremental', action='store_true',
+                        help='지난 실행 이후 바뀐 소스만 다시 읽습니다 (.crawler_cache에 상태 저장)')
+    parser.add_argument('--export', nargs='*', choices=EXPORT_FORMATS, default=crawler_config.TWO_DAY_EXPORT_FORMATS,
+                        metavar='FORMAT',
+                        help=f"JSON과 함께 만들 형식: {', '.join(EXPORT_FORMATS)} (기본: CRAWLER_TWO_DAY_EXPORTS)")
+    parser.add_argument('--report', action='store_true', help='기존 JSON과 추가 형식의 크기/읽기 시간을 비교해 출력')
+    args = parser.parse_args()
+    sys.exit(process_json_files(incremental=args.incremental, export_formats=args.export, report=args.report))
@@ -0,0 +1,98 @@
+# scripts/record_fixtures.py
+"""
+[HTML 픽스처 기록]
+사이트마다 첫 번째 목록 페이지와 가장 최근에 저장된 기사(news_json)의 상세 페이지를
+내려받아 fixtures/<크롤러>/에 저장합니다. 파서 벤치마크 등 오프라인 측정에 사용합니다.
+
+fixtures/<크롤러>/manifest.json에는 파일마다 원래 URL, 인코딩, Content-Type이 기록됩니다.
+
+사용법:
+    python scripts/record_fixtures.py                # 전체 크롤러
+    python scripts/record_fixtures.py Daum Nate      # 일부만
+"""
+import argparse
+import importlib
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import crawler_utils
+from run_all import CRAWLERS
+
+FIXTURES_DIR = os.path.join(ROOT_DIR, 'fixtures')
+
+
+def listing_urls(module):
+    """크롤러 모듈의 목록 페이지 URL 목록 (urls / base_urls / base_url)"""
+    if hasattr(module, 'urls'):
+        return list(module.urls)
+    if hasattr(module, 'base_urls'):
+        return list(module.base_urls)
+    return [module.base_url]
+
+
+def latest_article_url(module):
+    """결과 파일에서 가장 최근에 저장된 기사 URL"""
+    path = os.path.join(ROOT_DIR, module.result_filename)
+    for group in crawler_utils.iter_date_groups(path, reverse=True):
+        for article in group.get('articles', []):
+            if article.get('url'):
+                return article['url']
+    return None
+
+
+def load_manifest(name):
+    return crawler_utils.load_json_file(os.path.join(FIXTURES_DIR, name, 'manifest.json'), [])
+
+
+def record(name, module):
+    targets = [('listing', listing_urls(module)[0])]
+    detail_url = latest_article_url(module)
+    if detail_url:
+        targets.append(('detail', detail_url))
+
+    site_dir = os.path.join(FIXTURES_DIR, name)
+    os.makedirs(site_dir, exist_ok=True)
+    manifest = []
+    for kind, url in targets:
+        try:
+            response = crawler_utils.fetch(url, polite=True)
+        except Exception as e:
+            print(f"[{name}] {kind} 기록 실패: {url} ({e})")
+            continue
+        file_name = f"{kind}.html"
+        with open(os.path.join(site_dir, file_name), 'wb') as f:
+            f.write(response.content)
+        manifest.append({
+            'kind': kind,
+            'url': url,
+            'file': file_name,
+            'encoding': response.encoding,
+            'content_type': response.headers.get('Content-Type', ''),
+        })
+        print(f"[{name}] {kind}: {len(response.content):,} bytes <- {url}")
+
+    crawler_utils.write_json_atomic(os.path.join(site_dir, 'manifest.json'), manifest, indent=2)
+    return len(manifest)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='사이트별 HTML 픽스처를 기록합니다.')
+    parser.add_argument('crawlers', nargs='*', metavar='CRAWLER',
+                        help=f"기록할 크롤러 이름 (생략 시 전체): {', '.join(CRAWLERS)}")
+    args = parser.parse_args()
+    unknown = [name for name in args.crawlers if name not in CRAWLERS]
+    if unknown:
+        parser.error(f"알 수 없는 크롤러: {', '.join(unknown)}")
+
+    os.chdir(ROOT_DIR)  # 크롤러의 result_filename은 저장소 루트 기준 상대 경로
+    total = 0
+    for name in args.crawlers or CRAWLERS:
+        total += record(name, importlib.import_module(CRAWLERS[name]))
+    print(f"{total}개 페이지를 {FIXTURES_DIR}에 기록했습니다.")
+
+
+if __name__ == '__main__':
+    main()
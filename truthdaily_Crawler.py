@@ -1,20 +1,16 @@
 # truthdaily_Crawler.py
-import requests
-from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
-import json
+from datetime import timedelta
 import os
-import re
-import time
 import crawler_utils  # 👈 공통 유틸리티 임포트
-import crawler_config # 👈 설정 파일 임포트
+import crawler_time  # 👈 공통 시각 파싱
 
 # --- ⬇️ 공통 코드 (삭제 및 utils로 대체) ⬇️ ---
 NEWS_JSON_DIR = 'news_json'
 result_filename = os.path.join(NEWS_JSON_DIR, 'truthdaily_News.json') # 👈 고유값
 
 # 1. 공통 유틸리티에서 키워드와 날짜 가져오기
-keywords, exclude_keywords = crawler_utils.load_keywords()
+# 키워드는 임포트 시점이 아니라 main()에서 로드합니다. (cold start 단축)
+keywords, exclude_keywords = [], []
 today = crawler_utils.get_today_string()
 
 # 2. 고유한 URL 리스트
@@ -33,6 +29,7 @@ urls = [
 
 processed_links = set()
 processed_titles = set()
+pagination_guard = None  # main()에서 생성 (이미 본 기사만 나오면 페이지 넘김 중단)
 
 # 3. is_relevant_article, get_existing_links, save_to_json 함수
 # (이 파일에서 모두 삭제 -> crawler_utils가 대신 처리)
@@ -41,25 +38,24 @@ processed_titles = set()
 
 def is_within_two_days(article_time_str):
     """(고유 로직) 기사 시간이 현재로부터 2일 이내인지 확인"""
-    try:
-        # "07-30 17:43" 형식을 파싱
-        current_year = datetime.now().year
-        article_datetime = datetime.strptime(f"{current_year}-{article_time_str}", "%Y-%m-%d %H:%M")
-        
-        # 현재 시간으로부터 2일 전 계산
-        two_days_ago = datetime.now() - timedelta(days=2)
-        
-        return article_datetime >= two_days_ago
-    except ValueError as e:
-        print(f"시간 파싱 오류: {article_time_str}, {e}")
+    # "07-30 17:43" 형식을 파싱 (연도는 crawler_time이 추정)
+    article_datetime = crawler_time.parse(article_time_str, ["%m-%d %H:%M"])
+    if article_datetime is None:
+        print(f"시간 파싱 오류: {article_time_str}")
         return False
+    
+    # 현재 시간으로부터 2일 전 계산
+    two_days_ago = crawler_time.now() - timedelta(days=2)
+    
+    return article_datetime >= two_days_ago
 
+@crawler_utils.cached_details
 def extract_article_details(url):
     """(고유 로직) 개별 기사 페이지에서 상세 정보 추출"""
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # 필요한 요소를 찾으면 나머지 본문은 받지 않습니다.
+        # (본문 컨테이너 전체가 아니라 첫 이미지와 첫 문단만 기다립니다)
+        soup = crawler_utils.fetch_partial(url, ['.article-body img', '.article-body p'])
         
         # 이미지 URL 추출
         img_element = soup.select_one('.article-body img')
@@ -67,20 +63,19 @@ def extract_article_details(url):
         if img_url and not img_url.startswith('http'):
             img_url = f"https://www.truthdaily.co.kr{img_url}"
         
-        # 요약/본문 일부 추출
-        content_element = soup.select_one('.article-body')
+        # 요약/본문 일부 추출 (본문의 첫 문단)
+        first_paragraph = soup.select_one('.article-body p')
         summary = ''
-        if content_element:
-            paragraphs = content_element.find_all('p')
-            if paragraphs:
-                summary = paragraphs[0].get_text(strip=True)[:200] + "..." if len(paragraphs[0].get_text(strip=True)) > 200 else paragraphs[0].get_text(strip=True)
+        if first_paragraph:
+            text = first_paragraph.get_text(strip=True)
+            summary = text[:200] + "..." if len(text) > 200 else text
         
         return img_url, summary
     except Exception as e:
         print(f"기사 상세정보 추출 실패 ({url}): {e}")
         return '', ''
 
-def load_more_articles(session, url, page_num):
+def load_more_articles(url, page_num):
     """(고유 로직) 더보기 버튼을 통해 추가 기사 로드"""
     try:
         base_url = url.split('?')[0]
@@ -93,10 +88,9 @@ def load_more_articles(session, url, page_num):
             'Referer': url
         }
         
-        response = session.get(ajax_url, headers=headers, timeout=10)
-        response.raise_for_status()
+        response = crawler_utils.fetch(ajax_url, polite=True, headers=headers)
         
-        return BeautifulSoup(response.text, 'html.parser')
+        return crawler_utils.parse_html(response.text)
     except Exception as e:
         print(f"더보기 로드 실패 (페이지 {page_num}): {e}")
         return None
@@ -105,13 +99,14 @@ def scrape_page(url):
     """(고유 로직) 페이지별 기사 수집"""
     print(f"Scraping URL: {url}")
     articles = []
-    session = requests.Session()
     page_num = 1
     
     try:
-        response = session.get(url, timeout=10)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
+        response = crawler_utils.fetch_listing(url)
+        if response is None:
+            print(f"변경 없음, 건너뜀: {url}")
+            return articles
+        soup = crawler_utils.parse_html(response.text)
         
         while True:
             sections_div = soup.select_one('#sections.altlist') # 👈 고유 선택자
@@ -125,7 +120,7 @@ def scrape_page(url):
             found_old_articles = False
             page_articles = []
             
-            for element in article_elements:
+            for position, element in enumerate(article_elements):
                 title_element = element.select_one('h2.altlist-subject a') # 👈 고유 선택자
                 if not title_element:
                     continue
@@ -133,6 +128,8 @@ def scrape_page(url):
                 title = title_element.get_text(strip=True)
                 href = title_element.get('href', '')
                 full_link = href if href.startswith('http') else f'https://www.truthdaily.co.kr{href}'
+                if pagination_guard:
+                    pagination_guard.see(full_link, position)
                 
                 time_element = element.select_one('.altlist-info .altlist-info-item:last-child') # 👈 고유 선택자
                 if not time_element:
@@ -151,12 +148,7 @@ def scrape_page(url):
                 if full_link not in processed_links and is_relevant:
                     img_url, summary = extract_article_details(full_link)
                     
-                    try:
-                        current_year = datetime.now().year
-                        dt = datetime.strptime(f"{current_year}-{article_time}", "%Y-%m-%d %H:%M")
-                        published_time = dt.isoformat()
-                    except ValueError:
-                        published_time = article_time
+                    published_time = crawler_time.parse_iso(article_time, ["%m-%d %H:%M"]) or article_time
                     
                     processed_links.add(full_link)
                     processed_titles.add(title)
@@ -173,42 +165,49 @@ def scrape_page(url):
                     print(f"기사 처리 완료: {title} ({article_time})")
             
             articles.extend(page_articles)
+            all_known = pagination_guard.end_page() if pagination_guard else False
             
-            if found_old_articles or len(page_articles) == 0:
-                print(f"수집 중단: {'2일 이전 기사 발견' if found_old_articles else '더 이상 기사 없음'}")
+            if found_old_articles or len(page_articles) == 0 or all_known:
+                reason = '2일 이전 기사 발견' if found_old_articles else '이미 본 기사만 있음' if all_known else '더 이상 기사 없음'
+                print(f"수집 중단: {reason}")
                 break
             
             page_num += 1
             print(f"다음 페이지 {page_num} 로드 중...")
-            soup = load_more_articles(session, url, page_num) # 👈 고유 AJAX 호출
+            soup = load_more_articles(url, page_num) # 👈 고유 AJAX 호출
             
             if not soup:
                 print("더 이상 페이지를 로드할 수 없습니다.")
                 break
             
-            time.sleep(1)
-            
     except Exception as e:
         print(f"페이지 처리 실패 ({url}): {e}")
+        crawler_utils.discard_listing(url)  # 다음 실행에서 이 목록 페이지를 다시 처리
     
     return articles
 
 # --- ⬇️ main 함수 (공통 유틸리티를 사용하도록 수정) ⬇️ ---
 
 def main():
-    global processed_links, processed_titles
+    global keywords, exclude_keywords, processed_links, pagination_guard
+    keywords, exclude_keywords = crawler_utils.load_keywords()
     
     # 1. 공통 함수로 파일 생성 및 기존 링크 로드
     #crawler_utils.ensure_file_exists(result_filename)
     processed_links = crawler_utils.get_existing_links(result_filename)
+    pagination_guard = crawler_utils.PaginationGuard(result_filename, processed_links)
     
     all_articles = []
     
     # 2. 고유한 스크래핑 로직 실행
-    for url in urls:
+    scheduler = crawler_utils.SectionScheduler(result_filename)
+    for url in scheduler.due(urls): # 수집 예정 시각이 된 섹션만
+        pagination_guard.start()
         articles = scrape_page(url)
+        scheduler.record(url, len(articles))
         all_articles.extend(articles)
-        time.sleep(2)  # 섹션 간 요청 간격 조절
+    pagination_guard.finish()
+    scheduler.finish()
     
     # 3. 공통 함수로 저장
     if all_articles: